@@ -0,0 +1,307 @@
+"""Load benchmark for progressive discovery through the GPT Actions API.
+
+    uv run scripts/bench_actions.py                        # serve _site/ and run every flow
+    uv run scripts/bench_actions.py --clients 8 --iterations 50 --encoding gzip
+    uv run scripts/bench_actions.py --url https://example.github.io/skills-hub-demo/
+
+Each flow is the sequence of requests an agent makes to go from nothing to a
+loaded skill, using only what earlier responses told it:
+
+  progressive  personas → persona → skill → each reference
+  sections     personas → persona → skill TOC → overview + largest section
+  bundle       personas → persona bundle
+  search       search index → skill → each reference
+
+Flows whose endpoints the built site doesn't have are skipped, so the same
+command compares whatever layouts exist. Every flow loads each skill in the
+catalog in turn; --clients threads run flows concurrently over keep-alive
+connections. Without --url, _site/ is served on a free port by
+serve_site.py, with ETags and precompressed siblings as in production.
+With --revalidate, clients remember ETags and send If-None-Match, which
+shows what repeat visits cost.
+
+Reported per flow: round trips and bytes per flow (bytes as sent, so
+compressed with --encoding), p50/p95 latency per request and per flow, and
+throughput. --json writes the raw numbers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import http.client
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from serve_site import SITE_DIR, serve
+
+
+class Client:
+    """One keep-alive connection that records every request it makes."""
+
+    def __init__(self, base_url: str, *, encoding: str, revalidate: bool):
+        parts = urlsplit(base_url)
+        conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.conn = conn_cls(parts.netloc, timeout=30)
+        self.prefix = parts.path.rstrip("/") + "/actions/"
+        self.encoding = encoding
+        self.revalidate = revalidate
+        self.etags: dict[str, tuple[str, Any]] = {}
+        self.requests: list[tuple[int, float]] = []  # (bytes, seconds)
+
+    def get(self, path: str) -> Any:
+        headers = {"Accept-Encoding": self.encoding} if self.encoding != "identity" else {}
+        cached = self.etags.get(path) if self.revalidate else None
+        if cached:
+            headers["If-None-Match"] = cached[0]
+        start = time.perf_counter()
+        self.conn.request("GET", self.prefix + path, headers=headers)
+        res = self.conn.getresponse()
+        body = res.read()
+        self.requests.append((len(body), time.perf_counter() - start))
+        if res.status == 304 and cached:
+            return cached[1]
+        if res.status != 200:
+            raise RuntimeError(f"{res.status} for {path}")
+        coding = res.getheader("Content-Encoding")
+        if coding == "gzip":
+            body = gzip.decompress(body)
+        elif coding == "br":
+            body = brotli.decompress(body)
+        data = json.loads(body)
+        if self.revalidate and res.getheader("ETag"):
+            self.etags[path] = (res.getheader("ETag"), data)
+        return data
+
+    def close(self):
+        self.conn.close()
+
+
+Target = tuple[str, str]  # (persona_id, skill_name)
+
+
+def flow_progressive(client: Client, target: Target):
+    persona_id, skill = target
+    client.get("personas.json")
+    client.get(f"personas/{persona_id}.json")
+    detail = client.get(f"skills/{persona_id}/{skill}.json")
+    for ref in detail["references"]:
+        client.get(ref["fetch_path"].removeprefix("/actions/") + ".json")
+
+
+def flow_sections(client: Client, target: Target):
+    persona_id, skill = target
+    client.get("personas.json")
+    client.get(f"personas/{persona_id}.json")
+    toc = client.get(f"skills/{persona_id}/{skill}/toc.json")
+    sections = toc["sections"]
+    wanted = sections[:1] + sorted(sections[1:], key=lambda s: -s["chars"])[:1]
+    for section in wanted:
+        client.get(section["fetch_path"].removeprefix("/actions/") + ".json")
+
+
+def flow_bundle(client: Client, target: Target):
+    persona_id, _ = target
+    client.get("personas.json")
+    client.get(f"bundles/{persona_id}.json")
+
+
+def flow_search(client: Client, target: Target):
+    persona_id, skill = target
+    client.get("search-index.json")
+    detail = client.get(f"skills/{persona_id}/{skill}.json")
+    for ref in detail["references"]:
+        client.get(ref["fetch_path"].removeprefix("/actions/") + ".json")
+
+
+# Flow name -> (function, an endpoint that must exist for the flow to run)
+FLOWS: dict[str, tuple[Callable[[Client, Target], None], str]] = {
+    "progressive": (flow_progressive, "personas.json"),
+    "sections": (flow_sections, "skills/{persona}/{skill}/toc.json"),
+    "bundle": (flow_bundle, "bundles/{persona}.json"),
+    "search": (flow_search, "search-index.json"),
+}
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def discover_targets(base_url: str) -> list[Target]:
+    """Every (persona, skill) the API lists, via the public endpoints."""
+    client = Client(base_url, encoding="identity", revalidate=False)
+    try:
+        targets = []
+        for persona in client.get("personas.json")["personas"]:
+            for skill in client.get(f"personas/{persona['id']}.json")["skills"]:
+                targets.append((persona["id"], skill["name"]))
+        return targets
+    finally:
+        client.close()
+
+
+def _available(base_url: str, endpoint: str, target: Target) -> bool:
+    client = Client(base_url, encoding="identity", revalidate=False)
+    try:
+        client.get(endpoint.format(persona=target[0], skill=target[1]))
+        return True
+    except (RuntimeError, OSError):
+        return False
+    finally:
+        client.close()
+
+
+def run_flow(
+    base_url: str,
+    flow: Callable[[Client, Target], None],
+    targets: list[Target],
+    *,
+    clients: int,
+    iterations: int,
+    encoding: str,
+    revalidate: bool,
+) -> dict[str, Any]:
+    """Run iterations flows on each of clients threads and summarize them."""
+    flow_stats: list[tuple[int, int, float]] = []  # (round trips, bytes, seconds)
+    request_latencies: list[float] = []
+    lock = threading.Lock()
+    errors: list[BaseException] = []
+
+    def worker(offset: int):
+        client = Client(base_url, encoding=encoding, revalidate=revalidate)
+        try:
+            for i in range(iterations):
+                target = targets[(offset + i) % len(targets)]
+                before = len(client.requests)
+                start = time.perf_counter()
+                flow(client, target)
+                elapsed = time.perf_counter() - start
+                made = client.requests[before:]
+                with lock:
+                    flow_stats.append((len(made), sum(b for b, _ in made), elapsed))
+                    request_latencies.extend(s for _, s in made)
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            client.close()
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+
+    n = len(flow_stats)
+    return {
+        "flows": n,
+        "round_trips": sum(r for r, _, _ in flow_stats) / n,
+        "bytes": sum(b for _, b, _ in flow_stats) / n,
+        "request_p50_ms": _percentile(request_latencies, 50) * 1000,
+        "request_p95_ms": _percentile(request_latencies, 95) * 1000,
+        "flow_p50_ms": _percentile([s for _, _, s in flow_stats], 50) * 1000,
+        "flow_p95_ms": _percentile([s for _, _, s in flow_stats], 95) * 1000,
+        "flows_per_s": n / wall,
+        "requests_per_s": len(request_latencies) / wall,
+    }
+
+
+def format_results(results: dict[str, dict[str, Any]]) -> str:
+    lines = [
+        f"{'flow':<13}{'trips':>7}{'KB/flow':>9}{'req p50':>9}{'req p95':>9}"
+        f"{'flow p50':>10}{'flow p95':>10}{'flows/s':>9}{'req/s':>9}",
+    ]
+    for name, r in results.items():
+        lines.append(
+            f"{name:<13}{r['round_trips']:>7.1f}{r['bytes'] / 1024:>9.1f}"
+            f"{r['request_p50_ms']:>8.2f}ms{r['request_p95_ms']:>7.2f}ms"
+            f"{r['flow_p50_ms']:>8.2f}ms{r['flow_p95_ms']:>8.2f}ms"
+            f"{r['flows_per_s']:>9.0f}{r['requests_per_s']:>9.0f}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skill discovery flows against the actions API.")
+    parser.add_argument("--url", help="Site base URL. Defaults to serving _site/ locally.")
+    parser.add_argument("--dir", type=Path, default=SITE_DIR, help="Site directory to serve. Defaults to _site/.")
+    parser.add_argument("--clients", type=int, default=4, help="Concurrent simulated clients. Defaults to 4.")
+    parser.add_argument("--iterations", type=int, default=20, help="Flows per client. Defaults to 20.")
+    parser.add_argument(
+        "--encoding",
+        choices=["identity", "gzip", "br"],
+        default="identity",
+        help="Accept-Encoding to send. Compressed bytes need build.py --precompress.",
+    )
+    parser.add_argument("--revalidate", action="store_true", help="Cache ETags and send If-None-Match.")
+    parser.add_argument("--flows", nargs="+", choices=list(FLOWS), default=list(FLOWS))
+    parser.add_argument("--json", type=Path, help="Also write the results to this file.")
+    args = parser.parse_args()
+
+    if args.clients < 1 or args.iterations < 1:
+        parser.error("--clients and --iterations must be at least 1")
+    if args.encoding == "br" and brotli is None:
+        parser.error("--encoding br needs the 'brotli' package")
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        if not args.dir.is_dir():
+            parser.error(f"{args.dir} does not exist; run scripts/build.py first")
+        server = serve(args.dir, 0, quiet=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    try:
+        targets = discover_targets(base_url)
+        print(f"{len(targets)} skills, {args.clients} clients x {args.iterations} flows, "
+              f"encoding={args.encoding}{', revalidating' if args.revalidate else ''}")
+        results = {}
+        for name in args.flows:
+            flow, endpoint = FLOWS[name]
+            if not _available(base_url, endpoint, targets[0]):
+                print(f"{name}: skipped ({endpoint} not in this build)")
+                continue
+            results[name] = run_flow(
+                base_url, flow, targets,
+                clients=args.clients,
+                iterations=args.iterations,
+                encoding=args.encoding,
+                revalidate=args.revalidate,
+            )
+        print(format_results(results))
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    if args.json:
+        args.json.write_text(
+            json.dumps({
+                "clients": args.clients,
+                "iterations": args.iterations,
+                "encoding": args.encoding,
+                "revalidate": args.revalidate,
+                "skills": len(targets),
+                "flows": results,
+            }, indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+
+if __name__ == "__main__":
+    main()
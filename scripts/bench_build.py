@@ -0,0 +1,369 @@
+"""Scaling benchmark for the site build on synthetic skill catalogs.
+
+    uv run scripts/bench_build.py                          # one default-sized catalog
+    uv run scripts/bench_build.py --skills 10 20 40 80     # a scaling curve
+    uv run scripts/bench_build.py --skills 10 40 --max-exponent 1.3
+
+For each catalog size a synthetic repository is generated in a temp
+directory: skills/personas.yaml, one meta skill plus N skills per persona
+(each with reference files and a rubric), and a trace corpus in the same
+layout as traces/. The full build then runs against it with stage
+profiling on (see build_profile.py), and the hot helpers that the profile
+lumps into larger stages -- discover_personas (cold and warm),
+build_inventory, the OpenAPI spec, and the search index plus one query
+against it -- are timed on their own. Peak memory comes from a second,
+tracemalloc-instrumented build, so its per-allocation overhead stays out of
+every timing.
+
+Per-stage wall time and peak heap growth are printed as a table per size.
+With several sizes, the log-log slope of time against total skill count is
+reported for every stage; --max-exponent makes the run fail when any stage
+grows faster than that (1.0 is linear). --json writes the raw results.
+Peak memory covers the build process only; keep --jobs at 1 for it to
+include packaging.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import multiprocessing
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+import build
+import skill_record
+from build_actions import _build_openapi_spec
+from build_profile import PROFILE_NAME
+from build_search import build_search_index, search
+
+WORDS = (
+    "analysis argument authority brief case claim counsel court doctrine element "
+    "evidence exam fact holding issue judge jurisdiction law motion opinion outline "
+    "party policy precedent principle question reasoning remedy rule standard "
+    "statute student test theory tort trial"
+).split()
+
+
+def _prose(rng: random.Random, size: int) -> str:
+    """Roughly size bytes of markdown paragraphs."""
+    paragraphs = []
+    total = 0
+    while total < size:
+        sentence_count = rng.randint(3, 6)
+        para = " ".join(
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 16))).capitalize() + "."
+            for _ in range(sentence_count)
+        )
+        paragraphs.append(para)
+        total += len(para) + 2
+    return "\n\n".join(paragraphs)
+
+
+def _skill_md(name: str, description: str, body: str) -> str:
+    return (
+        f"---\nname: {name}\ndescription: {description}\n"
+        f"metadata:\n  version: 0.1.0\n---\n\n{body}\n"
+    )
+
+
+def _trace(rng: random.Random, persona: str, skill: str, scenario: str, timestamp: str, body_size: int) -> dict:
+    turns = [
+        {"role": role, "content": _prose(rng, body_size // 4)}
+        for role in ("user", "assistant", "user", "assistant")
+    ]
+    model = {"id": "default", "model": "synthetic/model", "temperature": 0.3, "max_tokens": 2048}
+    return {
+        "meta": {
+            "timestamp": timestamp,
+            "persona": persona,
+            "skill": skill,
+            "version": "0.1.0",
+            "scenario_id": scenario,
+        },
+        "config": {"model_under_test": model, "judge_model": {**model, "id": "default-judge"}},
+        "scenario": {"id": scenario, "setup": "Synthetic scenario.\n", "messages": turns[:1]},
+        "conversation": turns,
+        "evaluation": {"score": round(rng.uniform(40, 100), 1), "structural": []},
+    }
+
+
+def generate_catalog(
+    root: Path,
+    *,
+    personas: int = 4,
+    skills_per_persona: int = 5,
+    refs_per_skill: int = 2,
+    body_kb: float = 4,
+    traces_per_skill: int = 4,
+    seed: int = 0,
+) -> dict[str, int]:
+    """Write a synthetic skills/ and traces/ tree under root.
+
+    Returns counts of what was generated. The same arguments and seed always
+    produce the same files.
+    """
+    rng = random.Random(seed)
+    body_size = int(body_kb * 1024)
+    skills_dir = root / "skills"
+    traces_dir = root / "traces"
+    skills_dir.mkdir(parents=True)
+    traces_dir.mkdir(parents=True)
+
+    config = []
+    trace_index = []
+    for p in range(personas):
+        persona_id = f"persona-{p:02d}"
+        config.append({
+            "id": persona_id,
+            "label": f"Persona {p}",
+            "headline": _prose(rng, 40),
+            "pitch": _prose(rng, 200),
+            "design": {
+                "objective": _prose(rng, 40),
+                "principles": [_prose(rng, 60) for _ in range(3)],
+                "tone": _prose(rng, 30),
+                "success": _prose(rng, 80),
+            },
+        })
+
+        meta_dir = skills_dir / persona_id / f"{persona_id}-meta"
+        meta_dir.mkdir(parents=True)
+        meta_body = (
+            f"# Persona {p} Meta Skill\n\n{_prose(rng, 600)}\n\n"
+            f"## Assist Directly\n\n{_prose(rng, 400)}\n\n## Boundaries\n\n{_prose(rng, 300)}"
+        )
+        (meta_dir / "SKILL.md").write_text(
+            _skill_md(f"{persona_id}-meta", f"Always-on assistant for persona {p}.", meta_body),
+            encoding="utf-8",
+        )
+
+        for s in range(skills_per_persona):
+            name = f"{persona_id}-skill-{s:03d}"
+            skill_dir = skills_dir / persona_id / name
+            (skill_dir / "references").mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(
+                _skill_md(name, _prose(rng, 160).replace(":", ""), f"# {name}\n\n{_prose(rng, body_size)}"),
+                encoding="utf-8",
+            )
+            for r in range(refs_per_skill):
+                (skill_dir / "references" / f"reference-{r:02d}.md").write_text(
+                    f"# Reference {r}\n\n{_prose(rng, body_size // 2)}\n", encoding="utf-8"
+                )
+            (skill_dir / "rubric.yaml").write_text(
+                yaml.safe_dump({
+                    "skill": name,
+                    "version": "0.1.0",
+                    "scenarios": [{"id": "happy-path", "setup": "Synthetic.", "messages": [
+                        {"role": "user", "content": _prose(rng, 120)},
+                    ]}],
+                }),
+                encoding="utf-8",
+            )
+
+            for t in range(traces_per_skill):
+                scenario = f"scenario-{t:02d}"
+                timestamp = f"2026-01-01T00:{t // 60:02d}:{t % 60:02d}+00:00"
+                rel = f"{persona_id}/{name}/0.1.0/{scenario}_0001.json"
+                trace = _trace(rng, persona_id, name, scenario, timestamp, body_size)
+                path = traces_dir / rel
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps(trace, indent=2), encoding="utf-8")
+                trace_index.append({
+                    "path": rel,
+                    "persona": persona_id,
+                    "skill": name,
+                    "version": "0.1.0",
+                    "scenario_id": scenario,
+                    "timestamp": timestamp,
+                    "score": trace["evaluation"]["score"],
+                    "model": "synthetic/model",
+                    "judge": "synthetic/model",
+                })
+
+    (skills_dir / "personas.yaml").write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+    (traces_dir / "index.json").write_text(json.dumps({"traces": trace_index}, indent=2), encoding="utf-8")
+    return {
+        "personas": personas,
+        "skills": personas * (skills_per_persona + 1),
+        "references": personas * skills_per_persona * refs_per_skill,
+        "traces": len(trace_index),
+    }
+
+
+@contextlib.contextmanager
+def _patched_tree(root: Path):
+    """Point build.py at a synthetic repository for the duration of the block."""
+    saved = (build.SKILLS_DIR, build.TRACES_DIR, build.OUTPUT_DIR)
+    build.SKILLS_DIR = root / "skills"
+    build.TRACES_DIR = root / "traces"
+    build.OUTPUT_DIR = root / "_site"
+    skill_record._cache.clear()
+    try:
+        yield
+    finally:
+        build.SKILLS_DIR, build.TRACES_DIR, build.OUTPUT_DIR = saved
+        skill_record._cache.clear()
+
+
+def _timed(fn, *args) -> tuple[float, Any]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def run_benchmark(root: Path, *, jobs: int = 1, base_url: str = "https://example.test/") -> dict[str, Any]:
+    """Build the catalog under root and return per-stage timings and memory.
+
+    Stages that run once per persona (skills, meta) are summed.
+    """
+    with _patched_tree(root), contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        build.build(base_url, jobs=jobs, profile=True)
+        total = time.perf_counter() - start
+        profile = json.loads((build.OUTPUT_DIR / PROFILE_NAME).read_text(encoding="utf-8"))
+
+        # A cold rebuild under tracemalloc, only for the per-stage peaks.
+        skill_record._cache.clear()
+        build.build(base_url, jobs=jobs, profile_memory=True)
+        tracemalloc.stop()
+        memory = json.loads((build.OUTPUT_DIR / PROFILE_NAME).read_text(encoding="utf-8"))
+
+        skill_record._cache.clear()
+        discover_cold, personas = _timed(build.discover_personas)
+        discover_warm, _ = _timed(build.discover_personas)
+        inventory, _ = _timed(build.build_inventory, personas, base_url)
+        openapi, _ = _timed(_build_openapi_spec, personas, base_url)
+        search_build, index = _timed(build_search_index, personas)
+        search_query, _ = _timed(search, index, "practice exam feedback on my outline")
+
+    stages: dict[str, dict[str, float]] = {}
+    for s in profile["stages"]:
+        agg = stages.setdefault(s["stage"], {"wall_s": 0.0, "peak_kb": 0.0, "files": 0})
+        agg["wall_s"] += s["wall_s"]
+        agg["files"] += s["files"]
+    for s in memory["stages"]:
+        agg = stages.setdefault(s["stage"], {"wall_s": 0.0, "peak_kb": 0.0, "files": 0})
+        agg["peak_kb"] = max(agg["peak_kb"], s["peak_kb"])
+    for name, seconds in (
+        ("discover_personas (cold)", discover_cold),
+        ("discover_personas (warm)", discover_warm),
+        ("build_inventory", inventory),
+        ("openapi_spec", openapi),
+        ("search_index", search_build),
+        ("search_query", search_query),
+    ):
+        stages[name] = {"wall_s": seconds, "peak_kb": None, "files": None}
+    return {"total_s": total, "stages": stages}
+
+
+def scaling_exponents(results: list[dict[str, Any]]) -> dict[str, float]:
+    """Least-squares slope of log(wall time) against log(skill count) per stage."""
+    exponents = {}
+    for stage in results[0]["stages"]:
+        points = [
+            (math.log(r["counts"]["skills"]), math.log(r["stages"][stage]["wall_s"]))
+            for r in results
+            if r["stages"].get(stage, {}).get("wall_s", 0) > 0
+        ]
+        if len(points) < 2:
+            continue
+        mean_x = sum(x for x, _ in points) / len(points)
+        mean_y = sum(y for _, y in points) / len(points)
+        var = sum((x - mean_x) ** 2 for x, _ in points)
+        if var:
+            exponents[stage] = sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+    return exponents
+
+
+def format_results(result: dict[str, Any]) -> str:
+    c = result["counts"]
+    lines = [
+        f"{c['personas']} personas, {c['skills']} skills, {c['references']} references, "
+        f"{c['traces']} traces: {result['total_s']:.2f}s",
+        f"  {'stage':<26}{'wall s':>9}{'peak KB':>10}{'files':>8}",
+    ]
+    for name, s in result["stages"].items():
+        peak = f"{s['peak_kb']:>10.1f}" if s["peak_kb"] is not None else f"{'':>10}"
+        files = f"{s['files']:>8}" if s["files"] is not None else ""
+        lines.append(f"  {name:<26}{s['wall_s']:>9.4f}{peak}{files}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the site build on synthetic catalogs.")
+    parser.add_argument("--personas", type=int, default=4)
+    parser.add_argument(
+        "--skills",
+        type=int,
+        nargs="+",
+        default=[5],
+        help="Skills per persona; give several values for a scaling curve.",
+    )
+    parser.add_argument("--refs", type=int, default=2, help="Reference files per skill.")
+    parser.add_argument("--body-kb", type=float, default=4, help="Approximate SKILL.md body size.")
+    parser.add_argument("--traces", type=int, default=4, help="Traces per skill.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", "-j", type=int, default=1)
+    parser.add_argument("--json", type=Path, help="Also write the raw results to this file.")
+    parser.add_argument(
+        "--max-exponent",
+        type=float,
+        help="Fail if any stage's time grows faster than skills**N across --skills sizes.",
+    )
+    args = parser.parse_args()
+
+    if args.jobs > 1:
+        # Workers must inherit the patched build paths.
+        multiprocessing.set_start_method("fork", force=True)
+
+    results = []
+    for skills in args.skills:
+        with tempfile.TemporaryDirectory(prefix="bench-build-") as tmp:
+            root = Path(tmp)
+            counts = generate_catalog(
+                root,
+                personas=args.personas,
+                skills_per_persona=skills,
+                refs_per_skill=args.refs,
+                body_kb=args.body_kb,
+                traces_per_skill=args.traces,
+                seed=args.seed,
+            )
+            result = {"counts": counts, **run_benchmark(root, jobs=args.jobs)}
+        results.append(result)
+        print(format_results(result))
+        print()
+
+    exponents = scaling_exponents(results) if len(results) > 1 else {}
+    if exponents:
+        print("Scaling exponent (time ~ skills**k):")
+        for stage, k in exponents.items():
+            print(f"  {stage:<26}{k:>6.2f}")
+
+    if args.json:
+        args.json.write_text(
+            json.dumps({"results": results, "exponents": exponents}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+    if args.max_exponent is not None:
+        too_steep = {s: k for s, k in exponents.items() if k > args.max_exponent}
+        if too_steep:
+            for stage, k in too_steep.items():
+                print(f"FAIL: {stage} scales as skills**{k:.2f} (limit {args.max_exponent})")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""Agreement benchmark for batched judging against per-criterion judging.
+
+    uv run scripts/bench_judging.py                          # every recorded scenario
+    uv run scripts/bench_judging.py --limit 10 --repeats 2   # plus the per-criterion noise floor
+    uv run scripts/bench_judging.py --skill socratic-tutor --modes rubric
+
+Takes the latest trace for each skill, version and scenario from traces/,
+re-judges its conversation against the skill's current rubric.yaml with the
+configured judge (tests/test_config.yaml) in per-criterion mode and in each
+batched mode (see judge_batch in harness/evaluator.py), and compares the
+results criterion by criterion.
+
+Reported per mode: judge calls, prompt/cached/completion tokens and wall
+time summed over all traces; exact agreement with the per-criterion results
+per category; Cohen's kappa over all criteria; and the mean absolute score
+difference. With --repeats 2 or more, per-criterion mode is judged again and
+compared with its first run, which shows how much disagreement is plain
+judge noise. --json writes the raw numbers.
+
+Needs the API key from .env. --completion-cache record/replay reuses
+responses (harness/completion_cache.py) and can't be combined with --repeats,
+since a replayed rerun always agrees with itself.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from collections import Counter
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import yaml
+from dotenv import load_dotenv
+from openai import AsyncOpenAI
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TESTS_DIR = PROJECT_ROOT / "tests"
+SKILLS_DIR = PROJECT_ROOT / "skills"
+sys.path.insert(0, str(TESTS_DIR))
+
+from harness.completion_cache import MODES as CACHE_MODES  # noqa: E402
+from harness.completion_cache import CompletionCache, cached_client  # noqa: E402
+from harness.evaluator import BATCH_MODES, EvaluationReport, evaluate_trace_async  # noqa: E402
+from harness.runner import ConversationTrace, Message, ModelConfig, Usage, load_test_config  # noqa: E402
+from harness.trace_writer import TRACES_DIR  # noqa: E402
+
+CATEGORIES = ("structural", "pedagogical", "anti_patterns")
+
+
+def load_cases(skill: str | None, limit: int | None) -> list[tuple[ConversationTrace, dict]]:
+    """(trace, rubric) for the latest recorded trace of each skill/version/scenario."""
+    index = json.loads((TRACES_DIR / "index.json").read_text(encoding="utf-8"))["traces"]
+    latest: dict[tuple[str, str, str], dict] = {}
+    for entry in index:
+        if skill and entry["skill"] != skill:
+            continue
+        key = (entry["skill"], entry["version"], entry["scenario_id"])
+        if key not in latest or entry["timestamp"] > latest[key]["timestamp"]:
+            latest[key] = entry
+
+    cases = []
+    for key in sorted(latest):
+        entry = latest[key]
+        rubric_path = SKILLS_DIR / entry["persona"] / entry["skill"] / "rubric.yaml"
+        if not rubric_path.is_file():
+            continue
+        record = json.loads((TRACES_DIR / entry["path"]).read_text(encoding="utf-8"))
+        trace = ConversationTrace(
+            skill_name=entry["skill"],
+            scenario_id=entry["scenario_id"],
+            model_id=record["config"]["model_under_test"]["id"],
+            messages=[Message(**m) for m in record["conversation"]],
+        )
+        cases.append((trace, yaml.safe_load(rubric_path.read_text(encoding="utf-8"))))
+    return cases[:limit] if limit else cases
+
+
+def _labels(report: EvaluationReport) -> dict[tuple[str, str], str]:
+    return {
+        (category, c.criterion_id): c.result
+        for category in CATEGORIES
+        for c in getattr(report, category)
+    }
+
+
+def cohens_kappa(pairs: list[tuple[str, str]]) -> float | None:
+    """Chance-corrected agreement between two labelings of the same items."""
+    n = len(pairs)
+    if not n:
+        return None
+    observed = sum(a == b for a, b in pairs) / n
+    left = Counter(a for a, _ in pairs)
+    right = Counter(b for _, b in pairs)
+    expected = sum(left[label] * right[label] for label in left) / (n * n)
+    return 1.0 if expected == 1 else (observed - expected) / (1 - expected)
+
+
+def compare(baseline: list[EvaluationReport], other: list[EvaluationReport]) -> dict[str, Any]:
+    """Agreement of other with baseline, report by report and criterion by criterion."""
+    per_category = {category: [0, 0] for category in CATEGORIES}
+    pairs = []
+    score_diffs = []
+    for base, rep in zip(baseline, other):
+        base_labels, labels = _labels(base), _labels(rep)
+        for key, label in base_labels.items():
+            if key not in labels:
+                continue
+            per_category[key[0]][0] += label == labels[key]
+            per_category[key[0]][1] += 1
+            pairs.append((label, labels[key]))
+        score_diffs.append(abs(base.score() - rep.score()))
+    return {
+        "agreement": {
+            category: (agree / total if total else None)
+            for category, (agree, total) in per_category.items()
+        },
+        "overall": sum(a == b for a, b in pairs) / len(pairs) if pairs else None,
+        "kappa": cohens_kappa(pairs),
+        "mean_abs_score_diff": sum(score_diffs) / len(score_diffs) if score_diffs else None,
+    }
+
+
+def _usage(reports: list[EvaluationReport]) -> dict[str, Any]:
+    total = Usage()
+    for report in reports:
+        total.merge(report.usage)
+    return {
+        "calls": total.calls,
+        "prompt_tokens": total.prompt_tokens,
+        "cached_tokens": total.cached_tokens,
+        "completion_tokens": total.completion_tokens,
+        "seconds": round(total.seconds, 2),
+    }
+
+
+async def judge_all(
+    client: AsyncOpenAI,
+    judge: ModelConfig,
+    cases: list[tuple[ConversationTrace, dict]],
+    runs: list[str],
+    concurrency: int,
+) -> dict[str, list[EvaluationReport]]:
+    """Judge every case once per entry in runs (a batch mode, repeated for repeats)."""
+    limiter = asyncio.Semaphore(concurrency)
+    jobs = [
+        evaluate_trace_async(client, replace(judge, judge_batch=mode), rubric, trace, limiter)
+        for mode in runs
+        for trace, rubric in cases
+    ]
+    reports = await asyncio.gather(*jobs)
+    n = len(cases)
+    return {f"{mode}#{i}": reports[i * n:(i + 1) * n] for i, mode in enumerate(runs)}
+
+
+def run_benchmark(
+    client: AsyncOpenAI,
+    judge: ModelConfig,
+    cases: list[tuple[ConversationTrace, dict]],
+    modes: list[str],
+    *,
+    repeats: int = 1,
+    concurrency: int = 8,
+) -> dict[str, Any]:
+    runs = ["criterion"] * repeats + modes
+    reports = asyncio.run(judge_all(client, judge, cases, runs, concurrency))
+    baseline = reports["criterion#0"]
+
+    results: dict[str, Any] = {"criterion": {"usage": _usage(baseline)}}
+    if repeats > 1:
+        results["criterion"]["self_agreement"] = [
+            compare(baseline, reports[f"criterion#{i}"]) for i in range(1, repeats)
+        ]
+    for i, mode in enumerate(modes, start=repeats):
+        batched = reports[f"{mode}#{i}"]
+        results[mode] = {"usage": _usage(batched), **compare(baseline, batched)}
+    return {"judge": judge.model, "traces": len(cases), "modes": results}
+
+
+def _pct(value: float | None) -> str:
+    return f"{value * 100:.0f}%" if value is not None else "-"
+
+
+def format_results(results: dict[str, Any]) -> str:
+    lines = [
+        f"{results['traces']} traces judged by {results['judge']}",
+        f"{'mode':<22}{'calls':>7}{'prompt':>9}{'cached':>9}{'compl':>8}{'secs':>8}"
+        f"{'struct':>8}{'pedag':>7}{'anti':>6}{'all':>6}{'kappa':>7}{'|Δscore|':>10}",
+    ]
+
+    def row(name: str, usage: dict | None, cmp: dict | None) -> str:
+        u = usage or {}
+        c = cmp or {"agreement": {}, "overall": None, "kappa": None, "mean_abs_score_diff": None}
+        kappa = f"{c['kappa']:.2f}" if c["kappa"] is not None else "-"
+        diff = f"{c['mean_abs_score_diff']:.1f}" if c["mean_abs_score_diff"] is not None else "-"
+        return (
+            f"{name:<22}{u.get('calls', ''):>7}{u.get('prompt_tokens', ''):>9}"
+            f"{u.get('cached_tokens', ''):>9}{u.get('completion_tokens', ''):>8}"
+            f"{u.get('seconds', ''):>8}"
+            f"{_pct(c['agreement'].get('structural')):>8}{_pct(c['agreement'].get('pedagogical')):>7}"
+            f"{_pct(c['agreement'].get('anti_patterns')):>6}{_pct(c['overall']):>6}{kappa:>7}{diff:>10}"
+        )
+
+    for name, data in results["modes"].items():
+        if name == "criterion":
+            lines.append(row("criterion (baseline)", data["usage"], None))
+            for i, cmp in enumerate(data.get("self_agreement", []), start=2):
+                lines.append(row(f"  rerun {i} vs run 1", None, cmp))
+        else:
+            lines.append(row(name, data["usage"], data))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare batched and per-criterion judging.")
+    parser.add_argument(
+        "--modes", nargs="+", choices=[m for m in BATCH_MODES if m != "criterion"],
+        default=["category", "rubric"], help="Batched modes to compare. Defaults to both.",
+    )
+    parser.add_argument("--skill", help="Only traces of this skill.")
+    parser.add_argument("--limit", type=int, help="At most this many traces.")
+    parser.add_argument("--judge", type=int, default=0, help="Index into judge_models. Defaults to 0.")
+    parser.add_argument(
+        "--repeats", type=int, default=1,
+        help="Per-criterion runs; 2 or more also reports its self-agreement. Defaults to 1.",
+    )
+    parser.add_argument("--concurrency", type=int, default=8, help="API calls in flight. Defaults to 8.")
+    parser.add_argument("--completion-cache", choices=CACHE_MODES, default="off")
+    parser.add_argument("--json", type=Path, help="Also write the results to this file.")
+    args = parser.parse_args()
+
+    if args.repeats > 1 and args.completion_cache != "off":
+        parser.error("--repeats needs live calls; drop --completion-cache")
+
+    config = load_test_config(TESTS_DIR / "test_config.yaml")
+    judge = ModelConfig(**config["judge_models"][args.judge])
+    api_config = config.get("api", {})
+    load_dotenv(PROJECT_ROOT / ".env")
+    api_key = os.environ.get(api_config.get("api_key_env", "OPENROUTER_API_KEY"), "")
+    if not api_key and args.completion_cache != "replay":
+        parser.error("No API key configured -- set OPENROUTER_API_KEY in .env")
+
+    cases = load_cases(args.skill, args.limit)
+    if not cases:
+        parser.error("No traces with a rubric to judge")
+
+    cache = None
+    if args.completion_cache != "off":
+        cache_config = config.get("completion_cache", {})
+        cache = CompletionCache(
+            PROJECT_ROOT / cache_config.get("dir", "tests/.completion-cache"),
+            args.completion_cache,
+            max_bytes=int(cache_config.get("max_mb", 512)) * 1024 * 1024,
+        )
+    client = cached_client(
+        AsyncOpenAI(
+            api_key=api_key or "replay-only",
+            base_url=api_config.get("base_url", "https://openrouter.ai/api/v1"),
+            timeout=60.0,
+            max_retries=1,
+        ),
+        cache,
+    )
+
+    results = run_benchmark(
+        client, judge, cases, args.modes, repeats=args.repeats, concurrency=args.concurrency,
+    )
+    print(format_results(results))
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
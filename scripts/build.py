@@ -6,15 +6,34 @@ Reads skills from skills/<persona>/<skill-name>/SKILL.md, produces:
   _site/skills/<persona>/<persona>-meta.skill (zip bundling all persona skills)
   _site/inventory/<persona>.json             (per-persona inventory)
   _site/inventory/personas.json              (persona index)
+  _site/inventory/all.json                   (index + inventories + trace summary, for the website)
   _site/index.html, css/, js/                (website)
+  _site/manifest.json                        (SHA-256 + size of every published file)
+
+Archives are reproducible: identical sources give byte-identical .skill and
+.mcpb files (see build_zip.py).
+
+With --incremental, the previous _site/ is kept and only outputs whose
+inputs changed since the last build are regenerated (see build_incremental.py).
+With --watch, the build stays running: it serves _site/ locally and rebuilds
+incrementally whenever skills/, templates/, website/, or traces/ change
+(see build_watch.py). With --jobs N, skill archives, meta skills, actions JSON, and website pages
+are produced on a pool of N worker processes; the output is the same as a
+serial build.
 """
 
 import argparse
+import functools
+import hashlib
 import json
 import os
 import re
 import shutil
+import subprocess
+import sys
 import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 
 import jinja2
@@ -22,6 +41,12 @@ import yaml
 from dotenv import load_dotenv
 
 from build_actions import build_actions
+from build_compress import remove_siblings
+from build_incremental import BuildManifest, digest_inputs
+from build_profile import PROFILE_NAME, BuildProfile
+from build_tokens import BUDGET_NAME, budget_report, format_budget_report, skill_token_costs, write_budget_report
+from build_zip import copy_compressed_member, write_member
+from skill_record import SkillRecord, load_skill
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SKILLS_DIR = PROJECT_ROOT / "skills"
@@ -38,60 +63,11 @@ def load_personas_config() -> list[dict]:
         return yaml.safe_load(f)
 
 
-def parse_frontmatter(path: Path) -> dict:
-    """Extract YAML frontmatter (name, description, version, …) from a SKILL.md file."""
-    text = path.read_text(encoding="utf-8")
-    m = re.match(r"^---\s*\n(.*?)\n---", text, re.DOTALL)
-    if not m:
-        raise ValueError(f"No YAML frontmatter in {path}")
-    result = {}
-    for line in m.group(1).strip().splitlines():
-        key, sep, val = line.partition(":")
-        if sep:
-            result[key.strip()] = val.strip()
-    return result
-
-
 def load_meta_template() -> str:
     """Load the meta skill template from templates/meta-skill.md."""
     return (TEMPLATES_DIR / "meta-skill.md").read_text(encoding="utf-8")
 
 
-def parse_meta_sections(path: Path) -> dict[str, str]:
-    """Parse a meta SKILL.md into sections for template rendering.
-
-    Returns dict with keys: frontmatter, intro, assist_directly, extra_sections.
-    The SKILL.md is split at '## Assist Directly'; everything before is intro,
-    everything after is assist_directly + any trailing sections (boundaries etc.).
-    """
-    text = path.read_text(encoding="utf-8")
-
-    m = re.match(r"(---\s*\n.*?\n---)\s*\n(.*)", text, re.DOTALL)
-    if not m:
-        raise ValueError(f"Cannot parse meta skill: {path}")
-    frontmatter = m.group(1)
-    body = m.group(2)
-
-    parts = re.split(r"^## Assist Directly\s*$", body, maxsplit=1, flags=re.MULTILINE)
-    intro = parts[0].strip()
-
-    if len(parts) > 1:
-        after = parts[1].strip()
-        sub = re.split(r"(?=^## )", after, maxsplit=1, flags=re.MULTILINE)
-        assist_directly = sub[0].strip()
-        extra_sections = sub[1].strip() if len(sub) > 1 else ""
-    else:
-        assist_directly = ""
-        extra_sections = ""
-
-    return {
-        "frontmatter": frontmatter,
-        "intro": intro,
-        "assist_directly": assist_directly,
-        "extra_sections": extra_sections,
-    }
-
-
 def render_meta_skill(template: str, sections: dict[str, str], replacements: dict[str, str]) -> str:
     """Render a meta skill by filling the template with sections and build-time values."""
     content = template
@@ -105,7 +81,8 @@ def discover_personas() -> dict[str, dict]:
     """Load personas.yaml, then scan each persona's skill directories.
 
     Returns an ordered dict: {persona_id: {meta: ..., skills: [...]}}.
-    Order matches the list order in personas.yaml.
+    Order matches the list order in personas.yaml. Each skill dict carries
+    its SkillRecord under "record" so later stages never re-read SKILL.md.
     """
     config = load_personas_config()
     personas: dict[str, dict] = {}
@@ -118,65 +95,82 @@ def discover_personas() -> dict[str, dict]:
         for skill_dir in sorted(persona_dir.iterdir()):
             if not skill_dir.is_dir():
                 continue
-            skill_md = skill_dir / "SKILL.md"
-            if not skill_md.exists():
+            if not (skill_dir / "SKILL.md").exists():
                 continue
-            fm = parse_frontmatter(skill_md)
+            record = load_skill(skill_dir)
             skills.append({
-                "name": fm.get("name", skill_dir.name),
-                "description": fm.get("description", ""),
-                "version": fm.get("version", "0.0.0"),
+                "name": record.name,
+                "description": record.description,
+                "version": record.version,
                 "dir": skill_dir,
-                "is_meta": skill_dir.name.endswith("-meta"),
+                "is_meta": record.is_meta,
+                "record": record,
             })
         if skills:
             personas[persona_id] = {"meta": entry, "skills": skills}
     return personas
 
 
-def zip_skill(skill_dir: Path, output_path: Path):
-    """Zip a single skill directory as a .skill file."""
+def zip_skill(skill: SkillRecord, output_path: Path) -> Path:
+    """Zip a single skill directory as a .skill file.
+
+    Members come from the record's file bytes in sorted order and carry
+    normalized metadata (see build_zip.py), so the archive is reproducible.
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for file in sorted(skill_dir.rglob("*")):
-            if not file.is_file():
-                continue
-            arcname = file.relative_to(skill_dir.parent)
-            zf.write(file, arcname)
+        for rel, data in sorted(skill.files.items()):
+            write_member(zf, f"{skill.dir.name}/{rel}", data)
+    return output_path
 
 
 def zip_meta_skill(
-    meta_dir: Path,
-    bundled_dirs: list[Path],
+    meta: SkillRecord,
+    bundled_archives: list[Path],
     output_path: Path,
     rendered_skill_md: str,
-):
+) -> Path:
     """Zip a meta skill with bundled persona skills in references/.
 
     The agent skills spec requires a single skill directory per archive.
     Bundled skills are placed under <meta-name>/references/<skill-name>/
     so the meta SKILL.md can reference them via relative paths.
+
+    Bundled skills are taken from their already-built .skill archives (see
+    zip_skill) and their compressed members are copied as-is, so only the
+    rendered SKILL.md and the meta skill's own files are compressed here.
     """
-    meta_name = meta_dir.name
+    meta_name = meta.dir.name
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr(f"{meta_name}/SKILL.md", rendered_skill_md)
+        write_member(zf, f"{meta_name}/SKILL.md", rendered_skill_md)
 
-        for file in sorted(meta_dir.rglob("*")):
-            if not file.is_file() or file.name == "SKILL.md":
+        for rel, data in sorted(meta.files.items()):
+            if Path(rel).name == "SKILL.md":
                 continue
-            arcname = file.relative_to(meta_dir.parent)
-            zf.write(file, arcname)
-
-        for skill_dir in bundled_dirs:
-            for file in sorted(skill_dir.rglob("*")):
-                if not file.is_file():
-                    continue
-                rel = file.relative_to(skill_dir)
-                if rel.name == "SKILL.md" and rel.parent == Path("."):
-                    rel = Path("subskill.md")
-                arcname = Path(meta_name) / "references" / skill_dir.name / rel
-                zf.write(file, str(arcname))
+            write_member(zf, f"{meta_name}/{rel}", data)
+
+        for archive in bundled_archives:
+            with zipfile.ZipFile(archive) as src:
+                for info in src.infolist():
+                    skill_name, _, rel = info.filename.partition("/")
+                    if rel == "SKILL.md":
+                        rel = "subskill.md"
+                    arcname = f"{meta_name}/references/{skill_name}/{rel}"
+                    copy_compressed_member(src, info, zf, arcname)
+    return output_path
+
+
+def package_meta_skill(
+    meta: SkillRecord,
+    bundled_archives: list[Path],
+    output_path: Path,
+    template: str,
+    replacements: dict[str, str],
+) -> Path:
+    """Render a meta SKILL.md from the template and zip it with its bundled skills."""
+    rendered = render_meta_skill(template, dict(meta.meta_sections), replacements)
+    return zip_meta_skill(meta, bundled_archives, output_path, rendered)
 
 
 def build_bundled_skills_text(skills: list[dict]) -> str:
@@ -191,11 +185,53 @@ def build_bundled_skills_text(skills: list[dict]) -> str:
     return "\n".join(lines)
 
 
-def build_inventory(personas: dict[str, dict], base_url: str, repo_url: str = "") -> dict:
-    """Generate per-persona inventories and the persona index.
+def summarize_traces(traces_dir: Path) -> dict[str, dict[str, dict]]:
+    """Per-skill summary of traces/index.json: {persona: {skill: summary}}.
+
+    Each summary has the trace count, the number of distinct scenarios,
+    the mean score, and the version, score and timestamp of the latest
+    trace. Returns {} when there is no trace index.
+    """
+    index_path = traces_dir / "index.json"
+    if not index_path.is_file():
+        return {}
+    entries = json.loads(index_path.read_text(encoding="utf-8")).get("traces", [])
+
+    grouped: dict[tuple[str, str], list[dict]] = {}
+    for t in entries:
+        grouped.setdefault((t["persona"], t["skill"]), []).append(t)
+
+    summary: dict[str, dict[str, dict]] = {}
+    for (persona_id, skill), traces in sorted(grouped.items()):
+        scores = [t["score"] for t in traces if t.get("score") is not None]
+        latest = max(traces, key=lambda t: t.get("timestamp") or "")
+        summary.setdefault(persona_id, {})[skill] = {
+            "count": len(traces),
+            "scenarios": len({t.get("scenario_id") for t in traces}),
+            "mean_score": round(sum(scores) / len(scores), 1) if scores else None,
+            "latest_version": latest.get("version"),
+            "latest_score": latest.get("score"),
+            "latest_timestamp": latest.get("timestamp"),
+        }
+    return summary
+
+
+def build_inventory(
+    personas: dict[str, dict],
+    base_url: str,
+    repo_url: str = "",
+    token_costs: dict[str, dict[str, dict[str, int]]] | None = None,
+    trace_summary: dict[str, dict[str, dict]] | None = None,
+) -> dict:
+    """Generate per-persona inventories, the persona index, and the combined bundle.
 
     Inventory JSON is kept for the website even though meta skills no
-    longer fetch it at runtime.
+    longer fetch it at runtime. With token_costs (see build_tokens.py),
+    each skill entry also carries its "tokens" and "reference_tokens".
+
+    The "all" bundle holds the persona index, every inventory in index
+    order, and trace_summary (see summarize_traces()), so the website's
+    front page renders from a single request.
     """
     persona_index = []
     inventories = {}
@@ -214,6 +250,8 @@ def build_inventory(personas: dict[str, dict], base_url: str, repo_url: str = ""
                 "version": s["version"],
                 "source_path": f"skills/{persona_id}/{s['name']}",
             }
+            if token_costs is not None:
+                entry.update(token_costs[persona_id][s["name"]])
             if s["is_meta"]:
                 meta_skill = entry
             else:
@@ -242,37 +280,58 @@ def build_inventory(personas: dict[str, dict], base_url: str, repo_url: str = ""
     return {
         "personas": {"personas": persona_index, "repo_url": repo_url},
         "inventories": inventories,
+        "all": {
+            "personas": persona_index,
+            "repo_url": repo_url,
+            "inventories": list(inventories.values()),
+            "traces": trace_summary or {},
+        },
     }
 
 
-def build_website(base_url: str, *, repo_url: str = "", custom_gpt_url: str = ""):
-    """Render Jinja2 HTML templates and copy static assets to _site/."""
-    env = jinja2.Environment(
+@functools.cache
+def _website_env() -> jinja2.Environment:
+    return jinja2.Environment(
         loader=jinja2.FileSystemLoader(str(WEBSITE_DIR)),
         autoescape=False,
         keep_trailing_newline=True,
     )
 
-    mcpb_download_url = f"{base_url}packages/mcpb/legal-ed-skills-hub.mcpb"
 
-    for html_path in WEBSITE_DIR.rglob("*.html"):
-        if html_path.name.startswith("_"):
-            continue
-        rel = html_path.relative_to(WEBSITE_DIR)
-        root = "../" * (len(rel.parts) - 1)
+def render_page(rel: Path, context: dict[str, str]) -> Path:
+    """Render one website template to _site/ and return the written path."""
+    template = _website_env().get_template(rel.as_posix())
+    rendered = template.render(root="../" * (len(rel.parts) - 1), **context)
 
-        template = env.get_template(str(rel))
-        rendered = template.render(
-            base_url=base_url,
-            repo_url=repo_url,
-            root=root,
-            custom_gpt_url=custom_gpt_url,
-            mcpb_download_url=mcpb_download_url,
-        )
+    dest = OUTPUT_DIR / rel
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.write_text(rendered, encoding="utf-8")
+    return dest
 
-        dest = OUTPUT_DIR / rel
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        dest.write_text(rendered, encoding="utf-8")
+
+def build_website(
+    base_url: str,
+    *,
+    repo_url: str = "",
+    custom_gpt_url: str = "",
+    executor: Executor | None = None,
+) -> list[Path]:
+    """Render Jinja2 HTML templates and copy static assets to _site/.
+
+    Returns the list of files written.
+    """
+    context = {
+        "base_url": base_url,
+        "repo_url": repo_url,
+        "custom_gpt_url": custom_gpt_url,
+        "mcpb_download_url": f"{base_url}packages/mcpb/legal-ed-skills-hub.mcpb",
+    }
+    pages = [
+        (html_path.relative_to(WEBSITE_DIR), context)
+        for html_path in sorted(WEBSITE_DIR.rglob("*.html"))
+        if not html_path.name.startswith("_")
+    ]
+    written = run_tasks(executor, render_page, pages)
 
     for item in WEBSITE_DIR.rglob("*"):
         if not item.is_file() or item.suffix == ".html":
@@ -281,17 +340,207 @@ def build_website(base_url: str, *, repo_url: str = "", custom_gpt_url: str = ""
         dest = OUTPUT_DIR / rel
         dest.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(item, dest)
+        written.append(dest)
+
+    return written
+
+
+def write_inventory(inv_data: dict, compact: bool = False) -> list[Path]:
+    """Write the build_inventory() result to _site/inventory/. Returns the files written.
+
+    With compact=True the JSON is minified.
+    """
+    inv_dir = OUTPUT_DIR / "inventory"
+    inv_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    dump_args = {"separators": (",", ":")} if compact else {"indent": 2}
+
+    for persona_id, inventory in inv_data["inventories"].items():
+        path = inv_dir / f"{persona_id}.json"
+        path.write_text(json.dumps(inventory, ensure_ascii=False, **dump_args), encoding="utf-8")
+        written.append(path)
 
+    for name, key in (("personas.json", "personas"), ("all.json", "all")):
+        path = inv_dir / name
+        path.write_text(json.dumps(inv_data[key], ensure_ascii=False, **dump_args), encoding="utf-8")
+        written.append(path)
+    return written
 
-def build(base_url: str, *, repo_url: str = "", custom_gpt_url: str = ""):
-    """Run the full build."""
-    if OUTPUT_DIR.exists():
-        shutil.rmtree(OUTPUT_DIR)
-    OUTPUT_DIR.mkdir(parents=True)
 
-    meta_template = load_meta_template()
-    personas = discover_personas()
+def run_tasks(executor: Executor | None, fn, arg_tuples: list[tuple]) -> list:
+    """Call fn(*args) for each args tuple, on the executor if one is given.
+
+    Results come back in submission order either way, which is what keeps
+    a parallel build's output identical to a serial one.
+    """
+    if executor is None:
+        return [fn(*args) for args in arg_tuples]
+    futures = [executor.submit(fn, *args) for args in arg_tuples]
+    return [f.result() for f in futures]
+
+
+def _build_units(
+    manifest: BuildManifest,
+    units: list[tuple[str, str, tuple]],
+    fn,
+    executor: Executor | None = None,
+) -> int:
+    """Run fn(*args) for every (key, digest, args) unit that is out of date.
+
+    fn must be a module-level function returning the path it wrote, so it
+    can be shipped to a worker process. Returns the number of units rebuilt.
+    """
+    stale = [u for u in units if not manifest.is_fresh(u[0], u[1])]
+    for key, _, _ in stale:
+        manifest.begin(key)
+    outputs = run_tasks(executor, fn, [args for _, _, args in stale])
+    for (key, digest, _), output in zip(stale, outputs):
+        manifest.record(key, digest, [output])
+    return len(stale)
+
 
+def _build_unit(manifest: BuildManifest, key: str, digest: str, produce) -> bool:
+    """Run produce() unless the unit is up to date, and record what it wrote.
+
+    produce() must return the list of output files. Returns True if the
+    unit was rebuilt.
+    """
+    if manifest.is_fresh(key, digest):
+        return False
+    manifest.begin(key)
+    manifest.record(key, digest, produce())
+    return True
+
+
+def build(
+    base_url: str,
+    *,
+    repo_url: str = "",
+    custom_gpt_url: str = "",
+    incremental: bool = False,
+    jobs: int = 1,
+    link_traces: bool = False,
+    precompress: bool = False,
+    precompress_min_size: int = 1024,
+    profile: bool = False,
+    profile_memory: bool = False,
+    token_budget: int = 0,
+    compact_json: bool = False,
+) -> dict | None:
+    """Run the full build.
+
+    With incremental=True the existing _site/ is kept: units whose input
+    digest matches the build manifest are skipped, and outputs whose sources
+    are gone are deleted. A full build also writes the manifest, so the next
+    incremental build can start from it.
+
+    With jobs > 1, CPU-bound work (zipping, rendering, actions JSON) runs on
+    a process pool of that size.
+
+    With link_traces=True, trace files are published as reflinks or hardlinks
+    to the source files instead of copies (see publish_file).
+
+    With precompress=True, text files of at least precompress_min_size bytes
+    get .gz/.br siblings and a per-endpoint size report is printed (see
+    build_compress.py).
+
+    With profile=True, every stage is timed and its output counted; a table
+    is printed and _site/build-profile.json is written (see build_profile.py).
+    profile_memory=True implies profile and adds per-stage peak heap growth.
+
+    With token_budget > 0, a per-skill token cost report is printed and
+    written to _site/token-budget.json, and returned (see build_tokens.py).
+
+    With compact_json=True, the inventory and actions JSON endpoints are
+    written minified (openapi.yaml remains the readable copy of the spec),
+    and the bytes saved per endpoint are reported.
+    """
+    profile = profile or profile_memory
+    build_profile = BuildProfile(OUTPUT_DIR, enabled=profile, trace_memory=profile_memory)
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        report = _build(
+            base_url,
+            repo_url=repo_url,
+            custom_gpt_url=custom_gpt_url,
+            incremental=incremental,
+            link_traces=link_traces,
+            precompress=precompress,
+            precompress_min_size=precompress_min_size,
+            token_budget=token_budget,
+            compact_json=compact_json,
+            profile=build_profile,
+            executor=executor,
+        )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if profile:
+        print(build_profile.format_table())
+        path = build_profile.write({
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "jobs": jobs,
+            "incremental": incremental,
+        })
+        print(f"Profile: {path}")
+    return report
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def _remove_report(path: Path):
+    """Delete a report written outside the build manifest, with its .gz/.br siblings."""
+    path.unlink(missing_ok=True)
+    remove_siblings(path)
+
+
+def _build(
+    base_url: str,
+    *,
+    repo_url: str,
+    custom_gpt_url: str,
+    incremental: bool,
+    link_traces: bool,
+    precompress: bool,
+    precompress_min_size: int,
+    token_budget: int,
+    compact_json: bool,
+    profile: BuildProfile,
+    executor: Executor | None,
+) -> dict | None:
+    with profile.stage("clean"):
+        if incremental:
+            manifest = BuildManifest.load(OUTPUT_DIR)
+        else:
+            if OUTPUT_DIR.exists():
+                shutil.rmtree(OUTPUT_DIR)
+            manifest = BuildManifest(OUTPUT_DIR)
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        # Reports live outside any manifest unit. The profile is written again
+        # after the build if it is on, the budget report below if it is on.
+        _remove_report(OUTPUT_DIR / PROFILE_NAME)
+        if token_budget <= 0:
+            _remove_report(OUTPUT_DIR / BUDGET_NAME)
+
+    with profile.stage("discover"):
+        meta_template = load_meta_template()
+        personas = discover_personas()
+    rebuilt = 0
+
+    skill_units: dict[str, list] = {}
+    meta_units: dict[str, list] = {}
+    rendered_meta: dict[str, str] = {}
     for persona_id, persona_data in personas.items():
         meta_skill = None
         regular_skills = []
@@ -301,78 +550,263 @@ def build(base_url: str, *, repo_url: str = "", custom_gpt_url: str = ""):
             else:
                 regular_skills.append(skill)
 
+        bundled_archives = []
+        skill_units[persona_id] = []
         for skill in regular_skills:
             output_path = OUTPUT_DIR / "skills" / persona_id / f"{skill['name']}.skill"
-            zip_skill(skill["dir"], output_path)
-
+            bundled_archives.append(output_path)
+            skill_units[persona_id].append((
+                output_path.relative_to(OUTPUT_DIR).as_posix(),
+                skill["record"].digest,
+                (skill["record"], output_path),
+            ))
+
+        meta_units[persona_id] = []
         if meta_skill:
-            sections = parse_meta_sections(meta_skill["dir"] / "SKILL.md")
             repo_skills = f"{repo_url}tree/main/skills/{persona_id}" if repo_url else ""
             issues = f"{repo_url}issues" if repo_url else ""
-            rendered = render_meta_skill(meta_template, sections, {
+            replacements = {
                 "bundled_skills": build_bundled_skills_text(regular_skills),
                 "hub_url": base_url or "",
                 "inventory_url": f"{base_url}inventory/{persona_id}.json",
                 "repo_skills_url": repo_skills,
                 "issues_url": issues,
-            })
-            output_path = OUTPUT_DIR / "skills" / persona_id / f"{meta_skill['name']}.skill"
-            zip_meta_skill(
-                meta_skill["dir"],
-                [s["dir"] for s in regular_skills],
-                output_path,
-                rendered,
+            }
+            rendered_meta[persona_id] = render_meta_skill(
+                meta_template, dict(meta_skill["record"].meta_sections), replacements,
             )
+            output_path = OUTPUT_DIR / "skills" / persona_id / f"{meta_skill['name']}.skill"
+            meta_units[persona_id].append((
+                output_path.relative_to(OUTPUT_DIR).as_posix(),
+                digest_inputs(
+                    TEMPLATES_DIR / "meta-skill.md",
+                    meta_skill["record"].digest,
+                    *(s["record"].digest for s in regular_skills),
+                    json.dumps(replacements, sort_keys=True),
+                ),
+                (meta_skill["record"], bundled_archives, output_path, meta_template, replacements),
+            ))
+
+    # Meta archives copy compressed members out of the individual archives,
+    # so a persona's skills are always packaged before its meta skill.
+    for persona_id in personas:
+        with profile.stage("skills", persona_id):
+            rebuilt += _build_units(manifest, skill_units[persona_id], zip_skill, executor)
+        with profile.stage("meta", persona_id):
+            rebuilt += _build_units(manifest, meta_units[persona_id], package_meta_skill, executor)
 
     # Generate inventories (still used by the website)
-    inv_data = build_inventory(personas, base_url, repo_url)
-
-    inv_dir = OUTPUT_DIR / "inventory"
-    inv_dir.mkdir(parents=True, exist_ok=True)
-
-    for persona_id, inventory in inv_data["inventories"].items():
-        (inv_dir / f"{persona_id}.json").write_text(
-            json.dumps(inventory, indent=2, ensure_ascii=False), encoding="utf-8"
+    with profile.stage("inventory"):
+        token_costs = skill_token_costs(personas, rendered_meta)
+        inv_data = build_inventory(personas, base_url, repo_url, token_costs, summarize_traces(TRACES_DIR))
+        rebuilt += _build_unit(
+            manifest,
+            "inventory",
+            digest_inputs(json.dumps(inv_data, sort_keys=True, ensure_ascii=False), f"compact={compact_json}"),
+            lambda: write_inventory(inv_data, compact_json),
         )
 
-    (inv_dir / "personas.json").write_text(
-        json.dumps(inv_data["personas"], indent=2, ensure_ascii=False), encoding="utf-8"
-    )
-
     # Render website HTML templates and copy static assets
-    build_website(base_url, repo_url=repo_url, custom_gpt_url=custom_gpt_url)
-
-    # Copy trace data (JSON files) into _site/traces/
-    if TRACES_DIR.is_dir():
-        traces_out = OUTPUT_DIR / "traces"
-        traces_out.mkdir(parents=True, exist_ok=True)
-        for item in TRACES_DIR.rglob("*"):
-            if not item.is_file():
-                continue
-            if item.name == "index.html":
-                continue
-            rel = item.relative_to(TRACES_DIR)
-            dest = traces_out / rel
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(item, dest)
+    with profile.stage("website"):
+        rebuilt += _build_unit(
+            manifest,
+            "website",
+            digest_inputs(WEBSITE_DIR, base_url, repo_url, custom_gpt_url),
+            lambda: build_website(
+                base_url, repo_url=repo_url, custom_gpt_url=custom_gpt_url, executor=executor,
+            ),
+        )
+
+    # Publish trace data (JSON files) into _site/traces/. Traces are
+    # write-once, so size + mtime identify a file without reading it.
+    with profile.stage("traces"):
+        if TRACES_DIR.is_dir():
+            traces_out = OUTPUT_DIR / "traces"
+            for item in TRACES_DIR.rglob("*"):
+                if not item.is_file():
+                    continue
+                if item.name == "index.html":
+                    continue
+                rel = item.relative_to(TRACES_DIR)
+                dest = traces_out / rel
+                st = item.stat()
+                rebuilt += _build_unit(
+                    manifest,
+                    f"traces/{rel.as_posix()}",
+                    f"{st.st_size}:{st.st_mtime_ns}",
+                    lambda: [publish_file(item, dest, link=link_traces)],
+                )
 
     # GPT Actions (static OpenAPI + JSON endpoints)
-    build_actions(
-        personas=personas,
-        personas_config=load_personas_config(),
-        base_url=base_url,
-        output_dir=OUTPUT_DIR,
-        skills_dir=SKILLS_DIR,
-    )
+    actions_dir = OUTPUT_DIR / "actions"
+
+    def write_actions() -> list[Path]:
+        build_actions(
+            personas=personas,
+            personas_config=load_personas_config(),
+            base_url=base_url,
+            output_dir=OUTPUT_DIR,
+            skills_dir=SKILLS_DIR,
+            executor=executor,
+            compact=compact_json,
+        )
+        return _list_files(actions_dir)
+
+    with profile.stage("actions"):
+        rebuilt += _build_unit(
+            manifest,
+            "actions",
+            digest_inputs(
+                SKILLS_DIR / "personas.yaml",
+                *(s["record"].digest for p in personas.values() for s in p["skills"]),
+                base_url,
+                f"compact={compact_json}",
+            ),
+            write_actions,
+        )
+    if compact_json:
+        from build_compress import format_compact_json_report
+        print(format_compact_json_report(
+            OUTPUT_DIR, ["inventory", "actions"], skip=frozenset({"actions/search-index.json"}),
+        ))
 
     # Claude Desktop Extension (.mcpb)
-    from build_mcpb import build_mcpb
-    build_mcpb(base_url, output_dir=OUTPUT_DIR / "packages" / "mcpb")
+    from build_mcpb import MCPB_TEMPLATE_DIR, build_mcpb
+    mcpb_dir = OUTPUT_DIR / "packages" / "mcpb"
+    with profile.stage("mcpb"):
+        rebuilt += _build_unit(
+            manifest,
+            "mcpb",
+            digest_inputs(MCPB_TEMPLATE_DIR, actions_dir / "version.json", base_url),
+            lambda: [build_mcpb(base_url, output_dir=mcpb_dir, site_dir=OUTPUT_DIR)],
+        )
+
+    token_report = None
+    if token_budget > 0:
+        token_report = budget_report(token_costs, OUTPUT_DIR, token_budget)
+        print(format_budget_report(token_report))
+        budget_path = write_budget_report(token_report, OUTPUT_DIR)
+        # Rewritten on every build outside any unit; drop its old .gz/.br.
+        remove_siblings(budget_path)
+        print(f"Token budget report: {budget_path}")
+
+    with profile.stage("prune"):
+        removed = manifest.prune()
+        manifest.save()
+
+    with profile.stage("manifest"):
+        site_files = write_site_manifest(OUTPUT_DIR)
+
+    if precompress:
+        from build_compress import format_size_report, precompress_site
+        with profile.stage("precompress"):
+            report = precompress_site(
+                OUTPUT_DIR, site_files, min_size=precompress_min_size, executor=executor,
+            )
+            # List the new .gz/.br siblings too; unchanged entries are reused.
+            write_site_manifest(OUTPUT_DIR)
+        print(format_size_report(report))
 
     # Summary
     skill_count = sum(len(p["skills"]) for p in personas.values())
     print(f"Built {skill_count} skills across {len(personas)} personas")
+    if incremental:
+        print(f"Incremental: {rebuilt} outputs rebuilt, {removed} stale files removed")
     print(f"Output: {OUTPUT_DIR}")
+    return token_report
+
+
+def write_site_manifest(output_dir: Path) -> dict[str, dict]:
+    """Write _site/manifest.json: SHA-256 and size of every published file.
+
+    Covers everything deployed (archives, inventory and actions JSON, the
+    .mcpb, website, traces) so clients and the deploy step can skip files
+    whose hash hasn't changed. Dotfiles such as the incremental build
+    manifest are internal and left out. Hashes from the previous manifest
+    are reused for files that haven't changed since it was written.
+
+    Returns the "files" mapping ({path: {"sha256", "size"}}).
+    """
+    manifest_path = output_dir / "manifest.json"
+    previous = {}
+    written_ns = 0
+    if manifest_path.exists():
+        written_ns = manifest_path.stat().st_mtime_ns
+        previous = json.loads(manifest_path.read_text(encoding="utf-8")).get("files", {})
+
+    files = {}
+    for path in sorted(output_dir.rglob("*")):
+        if not path.is_file() or path == manifest_path:
+            continue
+        rel = path.relative_to(output_dir)
+        if any(part.startswith(".") for part in rel.parts):
+            continue
+        # ctime moves on any write, rename, or link and can't be backdated by
+        # copy2, so a file untouched since the last manifest keeps its hash.
+        st = path.stat()
+        prev = previous.get(rel.as_posix())
+        if prev and prev["size"] == st.st_size and st.st_ctime_ns < written_ns:
+            files[rel.as_posix()] = prev
+            continue
+        data = path.read_bytes()
+        files[rel.as_posix()] = {
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "size": len(data),
+        }
+    manifest_path.write_text(
+        json.dumps({"files": files}, indent=2, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+    return files
+
+
+# FICLONE from <linux/fs.h>: share the source's data blocks copy-on-write.
+_FICLONE = 0x40049409
+
+
+def _reflink(src: Path, dest: Path) -> bool:
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            ok = False
+        else:
+            ok = True
+    if ok:
+        shutil.copystat(src, dest)
+    else:
+        dest.unlink()
+    return ok
+
+
+def publish_file(src: Path, dest: Path, *, link: bool = False) -> Path:
+    """Place src at dest, by copying or (with link=True) by linking.
+
+    Linking tries a copy-on-write reflink first (Btrfs, XFS, …), then a
+    hardlink, and copies only when both fail (e.g. across filesystems).
+    An existing dest is removed first so a hardlinked output can never be
+    written through to its source.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.unlink(missing_ok=True)
+    if link:
+        if _reflink(src, dest):
+            return dest
+        try:
+            os.link(src, dest)
+            return dest
+        except OSError:
+            pass
+    shutil.copy2(src, dest)
+    return dest
+
+
+def _list_files(directory: Path) -> list[Path]:
+    return [p for p in directory.rglob("*") if p.is_file()]
 
 
 def main():
@@ -398,6 +832,75 @@ def main():
         help="URL of the ChatGPT Custom GPT. "
              "Defaults to CUSTOM_GPT_URL from .env or empty string (shows 'coming soon').",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse the existing _site/ and rebuild only outputs whose inputs "
+             "changed since the last build (tracked in _site/.build-manifest.json).",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run packaging and rendering on N worker processes "
+             "(0 = one per CPU). Defaults to 1 (serial).",
+    )
+    parser.add_argument(
+        "--link-traces",
+        action="store_true",
+        help="Publish trace files into _site/traces/ as reflinks or hardlinks "
+             "instead of copies (falls back to copying across filesystems).",
+    )
+    parser.add_argument(
+        "--precompress",
+        action="store_true",
+        help="Write .gz (and, with the brotli package, .br) siblings for text "
+             "files and print a per-endpoint transfer size report.",
+    )
+    parser.add_argument(
+        "--precompress-min-size",
+        type=int,
+        default=1024,
+        metavar="BYTES",
+        help="Smallest file to precompress. Defaults to 1024.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time each build stage (and each persona's packaging), print a "
+             "table, and write _site/build-profile.json.",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Like --profile, plus per-stage peak memory (tracemalloc; slower).",
+    )
+    parser.add_argument(
+        "--token-budget",
+        type=int,
+        default=0,
+        metavar="TOKENS",
+        help="Print estimated token costs per skill, write _site/token-budget.json, "
+             "and exit 1 if a skill plus its references exceeds TOKENS.",
+    )
+    parser.add_argument(
+        "--compact-json",
+        action="store_true",
+        help="Write inventory and actions JSON minified and report the bytes saved.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After building, serve _site/ with live reload and rebuild "
+             "incrementally whenever a source file changes.",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Port for the --watch dev server. Defaults to 8000.",
+    )
     args = parser.parse_args()
 
     base = args.base_url
@@ -408,7 +911,32 @@ def main():
     if repo and not repo.endswith("/"):
         repo += "/"
 
-    build(base, repo_url=repo, custom_gpt_url=args.custom_gpt_url)
+    run = functools.partial(
+        build,
+        base,
+        repo_url=repo,
+        custom_gpt_url=args.custom_gpt_url,
+        jobs=args.jobs or os.cpu_count() or 1,
+        link_traces=args.link_traces,
+        precompress=args.precompress,
+        precompress_min_size=args.precompress_min_size,
+        profile=args.profile,
+        profile_memory=args.profile_memory,
+        token_budget=args.token_budget,
+        compact_json=args.compact_json,
+    )
+    report = run(incremental=args.incremental)
+
+    if args.watch:
+        from build_watch import watch
+        watch(
+            lambda: run(incremental=True),
+            watch_dirs=[SKILLS_DIR, TEMPLATES_DIR, WEBSITE_DIR, TRACES_DIR],
+            output_dir=OUTPUT_DIR,
+            port=args.port,
+        )
+    elif report and any(row["over_budget"] for row in report["skills"]):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -22,50 +22,45 @@ pattern, but expressed as static files behind an OpenAPI spec):
 
   GET /actions/skills/{persona_id}/{skill_name}/references/{ref_name}
       A single reference markdown document shipped alongside a skill.
+
+  GET /actions/skills/{persona_id}/{skill_name}/toc
+      Table of contents for one skill: the SKILL.md and each reference
+      split at '## ' headings, with every section's id, title, and size.
+
+  GET /actions/skills/{persona_id}/{skill_name}/sections/{section_id}
+  GET /actions/skills/{persona_id}/{skill_name}/references/{ref_name}/sections/{section_id}
+      One section of a skill or reference, so an agent can load only the
+      workflow steps it needs instead of the whole document.
+
+  GET /actions/bundles/{persona_id}
+      Everything above for one persona in a single response: the persona
+      detail plus every skill body and reference inline. Costs one round
+      trip instead of three or more, at the price of a much larger payload.
+
+  GET /actions/search-index.json
+      A BM25 inverted index over every skill's name, description, headings,
+      and body (see build_search.py). Not an OpenAPI operation: clients that
+      can run code (the MCP server's searchSkills tool) fetch it once and
+      rank skills across all personas locally.
+
+  GET /actions/version.json
+      {"hash": …}, a digest of every other file under actions/. Clients that
+      keep a local copy of the tree (the .mcpb extension's snapshot) compare
+      it to decide whether their copy is stale.
 """
 
 from __future__ import annotations
 
 import json
 import re
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import Any
 
-
-def _parse_skill_md(path: Path) -> dict[str, Any]:
-    """Parse a SKILL.md into frontmatter dict + body text."""
-    text = path.read_text(encoding="utf-8")
-    m = re.match(r"^---\s*\n(.*?)\n---\s*\n?(.*)", text, re.DOTALL)
-    if not m:
-        raise ValueError(f"No YAML frontmatter in {path}")
-    fm: dict[str, Any] = {}
-    for line in m.group(1).strip().splitlines():
-        key, sep, val = line.partition(":")
-        if sep:
-            k = key.strip()
-            v = val.strip()
-            if k == "metadata":
-                continue
-            if k == "version":
-                fm.setdefault("metadata", {})["version"] = v
-            else:
-                fm[k] = v
-    return {"frontmatter": fm, "body": m.group(2).strip()}
-
-
-def _discover_references(skill_dir: Path) -> list[dict[str, str]]:
-    """List reference .md files in a skill's references/ subdirectory."""
-    refs_dir = skill_dir / "references"
-    if not refs_dir.is_dir():
-        return []
-    refs = []
-    for f in sorted(refs_dir.iterdir()):
-        if f.suffix == ".md" and f.is_file():
-            refs.append({
-                "name": f.stem,
-                "filename": f.name,
-            })
-    return refs
+from build_incremental import digest_inputs
+from build_search import build_search_index
+from build_tokens import estimate_tokens
+from skill_record import split_sections
 
 
 def build_actions(
@@ -74,13 +69,16 @@ def build_actions(
     base_url: str,
     output_dir: Path,
     skills_dir: Path,
+    executor: Executor | None = None,
+    compact: bool = False,
 ):
     """Render all GPT Actions static files and the OpenAPI spec.
 
     Parameters
     ----------
     personas : dict
-        The discover_personas() result from build.py.
+        The discover_personas() result from build.py. Skill content comes
+        from each skill's SkillRecord ("record" key).
     personas_config : list[dict]
         Raw personas.yaml entries (for design metadata).
     base_url : str
@@ -89,6 +87,12 @@ def build_actions(
         The _site root.
     skills_dir : Path
         The source skills/ directory.
+    executor : Executor, optional
+        When given, each persona's detail, skill, reference, section, and
+        bundle files are written by a separate task on this executor.
+    compact : bool
+        Write the JSON endpoints minified. openapi.yaml stays the
+        human-readable copy of the spec.
     """
     actions_dir = output_dir / "actions"
     actions_dir.mkdir(parents=True, exist_ok=True)
@@ -121,123 +125,257 @@ def build_actions(
             "objective fields to decide which persona matches the user's needs, "
             "then fetch full detail at /actions/personas/{id}.json."
         ),
-    })
+    }, compact=compact)
 
     # ------------------------------------------------------------------
-    # 2. Per-persona detail
+    # 2-6. Per-persona detail, skills, references, sections, and bundle
     # ------------------------------------------------------------------
-    personas_out = actions_dir / "personas"
-    personas_out.mkdir(parents=True, exist_ok=True)
+    if executor is None:
+        for persona_id, pdata in personas.items():
+            _write_persona_actions(actions_dir, persona_id, pdata, compact)
+    else:
+        futures = [
+            executor.submit(_write_persona_actions, actions_dir, persona_id, pdata, compact)
+            for persona_id, pdata in personas.items()
+        ]
+        for f in futures:
+            f.result()
 
-    for persona_id, pdata in personas.items():
-        pm = pdata["meta"]
-        design = pm.get("design", {})
-        regular = [s for s in pdata["skills"] if not s["is_meta"]]
+    # ------------------------------------------------------------------
+    # 7. Search index (compact: it is fetched by code, not read by people)
+    # ------------------------------------------------------------------
+    (actions_dir / "search-index.json").write_text(
+        json.dumps(build_search_index(personas), ensure_ascii=False, separators=(",", ":")) + "\n",
+        encoding="utf-8",
+    )
 
-        skills_summary = []
-        for s in regular:
-            skill_dir = s["dir"]
-            refs = _discover_references(skill_dir)
-            skills_summary.append({
-                "name": s["name"],
-                "description": s["description"],
-                "version": s["version"],
-                "has_references": len(refs) > 0,
-                "reference_count": len(refs),
-            })
+    # ------------------------------------------------------------------
+    # 8. OpenAPI spec
+    # ------------------------------------------------------------------
+    spec = _build_openapi_spec(personas, base_url)
+    _write_json(actions_dir / "openapi.json", spec, compact=compact)
 
-        _write_json(personas_out / f"{persona_id}.json", {
-            "id": persona_id,
-            "label": pm.get("label", persona_id.replace("-", " ").title()),
-            "headline": pm.get("headline", ""),
-            "pitch": pm.get("pitch", ""),
-            "design": design,
-            "skills": skills_summary,
-            "usage_hint": (
-                "Pick a skill by name, then fetch its full instructions at "
-                f"/actions/skills/{persona_id}/{{skill_name}}."
-            ),
+    # Also write YAML for human readability
+    _write_openapi_yaml(actions_dir / "openapi.yaml", spec)
+
+    # The spec must describe every response as written, minified or not.
+    problems = check_openapi_responses(spec, actions_dir)
+    if problems:
+        raise ValueError("OpenAPI spec does not match the written responses:\n  " + "\n  ".join(problems))
+
+    # ------------------------------------------------------------------
+    # 9. Version hash over everything above (written last)
+    # ------------------------------------------------------------------
+    version_path = actions_dir / "version.json"
+    version_path.unlink(missing_ok=True)
+    _write_json(version_path, {"hash": digest_inputs(actions_dir)}, compact=compact)
+
+    skill_count = sum(
+        len([s for s in p["skills"] if not s["is_meta"]])
+        for p in personas.values()
+    )
+    print(f"Built GPT Actions: {len(personas)} personas, {skill_count} skills")
+    print(f"OpenAPI spec: {actions_dir / 'openapi.json'}")
+
+
+def _write_persona_actions(actions_dir: Path, persona_id: str, pdata: dict[str, Any], compact: bool = False):
+    """Write one persona's detail, per-skill, reference, section, and bundle JSON."""
+    pm = pdata["meta"]
+    design = pm.get("design", {})
+    regular = [s for s in pdata["skills"] if not s["is_meta"]]
+
+    # Estimated token costs (see build_tokens.py): body, and each reference.
+    body_tokens = {s["name"]: estimate_tokens(s["record"].body) for s in regular}
+    ref_tokens = {
+        s["name"]: {r.name: estimate_tokens(s["record"].reference_text(r)) for r in s["record"].references}
+        for s in regular
+    }
+
+    # The bundle is written last (6.) but its size goes into the detail.
+    bundle_skills = []
+    for s in regular:
+        record = s["record"]
+        bundle_skills.append({
+            "name": s["name"],
+            "description": s["description"],
+            "version": s["version"],
+            "tokens": body_tokens[s["name"]],
+            "skill_body": record.body,
+            "references": [
+                {"name": r.name, "tokens": ref_tokens[s["name"]][r.name], "content": record.reference_text(r)}
+                for r in record.references
+            ],
         })
+    bundle = {
+        "id": persona_id,
+        "label": pm.get("label", persona_id.replace("-", " ").title()),
+        "headline": pm.get("headline", ""),
+        "pitch": pm.get("pitch", ""),
+        "design": design,
+        "skills": bundle_skills,
+        "usage_hint": (
+            "Every skill's full instructions and references are included. "
+            "Pick the skill that matches the user's task and follow its skill_body; "
+            "consult its references as the instructions direct."
+        ),
+    }
 
     # ------------------------------------------------------------------
-    # 3. Per-skill full content
+    # 2. Persona detail
     # ------------------------------------------------------------------
-    skills_out = actions_dir / "skills"
+    skills_summary = []
+    for s in regular:
+        refs = s["record"].references
+        skills_summary.append({
+            "name": s["name"],
+            "description": s["description"],
+            "version": s["version"],
+            "has_references": len(refs) > 0,
+            "reference_count": len(refs),
+            "tokens": body_tokens[s["name"]],
+            "reference_tokens": sum(ref_tokens[s["name"]].values()),
+        })
 
-    for persona_id, pdata in personas.items():
-        persona_skills_out = skills_out / persona_id
-        persona_skills_out.mkdir(parents=True, exist_ok=True)
+    _write_json(actions_dir / "personas" / f"{persona_id}.json", {
+        "id": persona_id,
+        "label": pm.get("label", persona_id.replace("-", " ").title()),
+        "headline": pm.get("headline", ""),
+        "pitch": pm.get("pitch", ""),
+        "design": design,
+        "skills": skills_summary,
+        "bundle_tokens": estimate_tokens(_json_text(bundle, compact)),
+        "usage_hint": (
+            "Pick a skill by name, then fetch its full instructions at "
+            f"/actions/skills/{persona_id}/{{skill_name}}. To load every skill "
+            f"and reference at once, fetch /actions/bundles/{persona_id}."
+        ),
+    }, compact=compact)
 
-        for s in pdata["skills"]:
-            if s["is_meta"]:
-                continue
-            skill_dir = s["dir"]
-            parsed = _parse_skill_md(skill_dir / "SKILL.md")
-            refs = _discover_references(skill_dir)
-
-            ref_entries = []
-            for r in refs:
-                ref_entries.append({
-                    "name": r["name"],
-                    "fetch_path": f"/actions/skills/{persona_id}/{s['name']}/references/{r['name']}",
-                })
-
-            _write_json(persona_skills_out / f"{s['name']}.json", {
-                "name": s["name"],
-                "description": s["description"],
-                "version": s["version"],
-                "persona": persona_id,
-                "skill_body": parsed["body"],
-                "references": ref_entries,
-                "usage_hint": (
-                    "The skill_body field contains the full skill instructions. "
-                    "Follow them to assist the user. "
-                    "If references are listed, fetch them as needed for additional context."
-                ) if ref_entries else (
-                    "The skill_body field contains the full skill instructions. "
-                    "Follow them to assist the user."
-                ),
+    # ------------------------------------------------------------------
+    # 3. Per-skill full content
+    # ------------------------------------------------------------------
+    persona_skills_out = actions_dir / "skills" / persona_id
+    persona_skills_out.mkdir(parents=True, exist_ok=True)
+
+    for s in regular:
+        record = s["record"]
+
+        ref_entries = []
+        for r in record.references:
+            ref_entries.append({
+                "name": r.name,
+                "tokens": ref_tokens[s["name"]][r.name],
+                "fetch_path": f"/actions/skills/{persona_id}/{s['name']}/references/{r.name}",
             })
 
+        _write_json(persona_skills_out / f"{s['name']}.json", {
+            "name": s["name"],
+            "description": s["description"],
+            "version": s["version"],
+            "persona": persona_id,
+            "tokens": body_tokens[s["name"]],
+            "skill_body": record.body,
+            "references": ref_entries,
+            "toc_path": f"/actions/skills/{persona_id}/{s['name']}/toc",
+            "usage_hint": (
+                "The skill_body field contains the full skill instructions. "
+                "Follow them to assist the user. "
+                "If references are listed, fetch them as needed for additional context."
+            ) if ref_entries else (
+                "The skill_body field contains the full skill instructions. "
+                "Follow them to assist the user."
+            ),
+        }, compact=compact)
+
     # ------------------------------------------------------------------
     # 4. Reference documents (nested under skills/, mirroring on-disk layout)
     # ------------------------------------------------------------------
-    for persona_id, pdata in personas.items():
-        for s in pdata["skills"]:
-            if s["is_meta"]:
-                continue
-            skill_dir = s["dir"]
-            refs = _discover_references(skill_dir)
-            if not refs:
-                continue
-
-            ref_dir_out = skills_out / persona_id / s["name"] / "references"
-            ref_dir_out.mkdir(parents=True, exist_ok=True)
-
-            for r in refs:
-                content = (skill_dir / "references" / r["filename"]).read_text(encoding="utf-8")
-                _write_json(ref_dir_out / f"{r['name']}.json", {
-                    "name": r["name"],
-                    "skill": s["name"],
-                    "persona": persona_id,
-                    "content": content,
-                })
+    for s in regular:
+        record = s["record"]
+        if not record.references:
+            continue
+
+        ref_dir_out = persona_skills_out / s["name"] / "references"
+        ref_dir_out.mkdir(parents=True, exist_ok=True)
+
+        for r in record.references:
+            _write_json(ref_dir_out / f"{r.name}.json", {
+                "name": r.name,
+                "skill": s["name"],
+                "persona": persona_id,
+                "tokens": ref_tokens[s["name"]][r.name],
+                "content": record.reference_text(r),
+            }, compact=compact)
 
     # ------------------------------------------------------------------
-    # 5. OpenAPI spec
+    # 5. Section chunks and per-skill table of contents
     # ------------------------------------------------------------------
-    spec = _build_openapi_spec(personas, base_url)
-    _write_json(actions_dir / "openapi.json", spec)
+    for s in regular:
+        record = s["record"]
+        skill_out = persona_skills_out / s["name"]
+        skill_path = f"/actions/skills/{persona_id}/{s['name']}"
+
+        toc_sections = _write_sections(
+            skill_out / "sections", f"{skill_path}/sections", record.body,
+            {"skill": s["name"], "persona": persona_id}, compact,
+        )
+        toc_refs = []
+        for r in record.references:
+            toc_refs.append({
+                "name": r.name,
+                "sections": _write_sections(
+                    skill_out / "references" / r.name / "sections",
+                    f"{skill_path}/references/{r.name}/sections",
+                    record.reference_text(r),
+                    {"skill": s["name"], "persona": persona_id, "reference": r.name},
+                    compact,
+                ),
+            })
 
-    # Also write YAML for human readability
-    _write_openapi_yaml(actions_dir / "openapi.yaml", spec)
+        _write_json(skill_out / "toc.json", {
+            "name": s["name"],
+            "persona": persona_id,
+            "version": s["version"],
+            "total_chars": sum(sec["chars"] for sec in toc_sections),
+            "total_tokens": sum(sec["tokens"] for sec in toc_sections),
+            "sections": toc_sections,
+            "references": toc_refs,
+            "usage_hint": (
+                "Fetch only the sections you need by their fetch_path. The overview "
+                "section says what the skill does; later sections are its workflow steps."
+            ),
+        }, compact=compact)
 
-    skill_count = sum(
-        len([s for s in p["skills"] if not s["is_meta"]])
-        for p in personas.values()
-    )
-    print(f"Built GPT Actions: {len(personas)} personas, {skill_count} skills")
-    print(f"OpenAPI spec: {actions_dir / 'openapi.json'}")
+    # ------------------------------------------------------------------
+    # 6. Persona bundle (detail + every skill and reference inline)
+    # ------------------------------------------------------------------
+    _write_json(actions_dir / "bundles" / f"{persona_id}.json", bundle, compact=compact)
+
+
+def _write_sections(
+    out_dir: Path,
+    fetch_prefix: str,
+    markdown: str,
+    owner: dict[str, str],
+    compact: bool = False,
+) -> list[dict[str, Any]]:
+    """Write one JSON file per section of markdown; return the TOC entries."""
+    entries = []
+    for sec in split_sections(markdown):
+        _write_json(out_dir / f"{sec.id}.json", {
+            **owner,
+            "id": sec.id,
+            "title": sec.title,
+            "content": sec.content,
+        }, compact=compact)
+        entries.append({
+            "id": sec.id,
+            "title": sec.title,
+            "chars": len(sec.content),
+            "tokens": estimate_tokens(sec.content),
+            "fetch_path": f"{fetch_prefix}/{sec.id}",
+        })
+    return entries
 
 
 def _build_openapi_spec(personas: dict[str, dict], base_url: str) -> dict[str, Any]:
@@ -251,9 +389,9 @@ def _build_openapi_spec(personas: dict[str, dict], base_url: str) -> dict[str, A
         all_skills[pid] = [s["name"] for s in regular]
         all_refs[pid] = {}
         for s in regular:
-            refs = _discover_references(s["dir"])
+            refs = s["record"].references
             if refs:
-                all_refs[pid][s["name"]] = [r["name"] for r in refs]
+                all_refs[pid][s["name"]] = [r.name for r in refs]
 
     server_url = base_url.rstrip("/") if base_url else "https://example.github.io/skills-hub-demo"
 
@@ -264,7 +402,8 @@ def _build_openapi_spec(personas: dict[str, dict], base_url: str) -> dict[str, A
             "description": (
                 "Progressively discover and load pedagogical AI skills for legal education. "
                 "Start with the personas list, drill into a persona for its skill inventory, "
-                "then fetch individual skill instructions and reference materials as needed."
+                "then fetch individual skill instructions and reference materials as needed. "
+                "Alternatively, load a whole persona in one call with its bundle."
             ),
             "version": "1.0.0",
         },
@@ -355,6 +494,93 @@ def _build_openapi_spec(personas: dict[str, dict], base_url: str) -> dict[str, A
                     },
                 },
             },
+            "/actions/skills/{persona_id}/{skill_name}/toc.json": {
+                "get": {
+                    "operationId": "getSkillToc",
+                    "summary": "Get a skill's table of contents",
+                    "description": (
+                        "Lists the sections of a skill's instructions and of each of its "
+                        "reference documents, with titles and sizes in characters. Use it "
+                        "to fetch only the sections you need with getSkillSection or "
+                        "getReferenceSection instead of the whole skill."
+                    ),
+                    "parameters": [
+                        _persona_id_param(persona_ids),
+                        _skill_name_param(all_skills),
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "Skill table of contents",
+                            "content": {"application/json": {"schema": {
+                                "$ref": "#/components/schemas/SkillToc",
+                            }}},
+                        },
+                    },
+                },
+            },
+            "/actions/skills/{persona_id}/{skill_name}/sections/{section_id}.json": {
+                "get": {
+                    "operationId": "getSkillSection",
+                    "summary": "Get one section of a skill's instructions",
+                    "description": "Returns one section of the SKILL.md body, as listed by getSkillToc.",
+                    "parameters": [
+                        _persona_id_param(persona_ids),
+                        _skill_name_param(all_skills),
+                        _section_id_param(),
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "Section content",
+                            "content": {"application/json": {"schema": {
+                                "$ref": "#/components/schemas/SectionDetail",
+                            }}},
+                        },
+                    },
+                },
+            },
+            "/actions/skills/{persona_id}/{skill_name}/references/{ref_name}/sections/{section_id}.json": {
+                "get": {
+                    "operationId": "getReferenceSection",
+                    "summary": "Get one section of a reference document",
+                    "description": "Returns one section of a reference document, as listed by getSkillToc.",
+                    "parameters": [
+                        _persona_id_param(persona_ids),
+                        _skill_name_param(all_skills),
+                        _ref_name_param(all_refs),
+                        _section_id_param(),
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "Section content",
+                            "content": {"application/json": {"schema": {
+                                "$ref": "#/components/schemas/SectionDetail",
+                            }}},
+                        },
+                    },
+                },
+            },
+            "/actions/bundles/{persona_id}.json": {
+                "get": {
+                    "operationId": "getPersonaBundle",
+                    "summary": "Get a persona with all skills and references inline",
+                    "description": (
+                        "Returns the persona detail plus the full instructions of every skill "
+                        "and the content of every reference document, in one response. "
+                        "Much larger than getPersona; use it when you expect to need several "
+                        "of the persona's skills and have room in context, otherwise use "
+                        "getPersona and getSkill."
+                    ),
+                    "parameters": [_persona_id_param(persona_ids)],
+                    "responses": {
+                        "200": {
+                            "description": "Persona bundle",
+                            "content": {"application/json": {"schema": {
+                                "$ref": "#/components/schemas/PersonaBundle",
+                            }}},
+                        },
+                    },
+                },
+            },
         },
         "components": {
             "schemas": {
@@ -415,9 +641,12 @@ def _build_openapi_spec(personas: dict[str, dict], base_url: str) -> dict[str, A
                                     "version": {"type": "string"},
                                     "has_references": {"type": "boolean"},
                                     "reference_count": {"type": "integer"},
+                                    "tokens": _tokens_schema("the skill body"),
+                                    "reference_tokens": _tokens_schema("all of the skill's references"),
                                 },
                             },
                         },
+                        "bundle_tokens": _tokens_schema("this persona's bundle (getPersonaBundle)"),
                         "usage_hint": {"type": "string"},
                     },
                 },
@@ -428,6 +657,7 @@ def _build_openapi_spec(personas: dict[str, dict], base_url: str) -> dict[str, A
                         "description": {"type": "string"},
                         "version": {"type": "string"},
                         "persona": {"type": "string"},
+                        "tokens": _tokens_schema("skill_body"),
                         "skill_body": {
                             "type": "string",
                             "description": "Complete skill instructions in markdown. Follow these to assist the user.",
@@ -439,30 +669,186 @@ def _build_openapi_spec(personas: dict[str, dict], base_url: str) -> dict[str, A
                                 "type": "object",
                                 "properties": {
                                     "name": {"type": "string"},
+                                    "tokens": _tokens_schema("the reference content"),
                                     "fetch_path": {"type": "string", "description": "Path to fetch reference content"},
                                 },
                             },
                         },
+                        "toc_path": {
+                            "type": "string",
+                            "description": "Path to the skill's table of contents, for loading it in sections",
+                        },
+                        "usage_hint": {"type": "string"},
+                    },
+                },
+                "SkillToc": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "persona": {"type": "string"},
+                        "version": {"type": "string"},
+                        "total_chars": {"type": "integer", "description": "Sum of the section sizes"},
+                        "total_tokens": _tokens_schema("all sections of the skill body"),
+                        "sections": {"$ref": "#/components/schemas/SectionList"},
+                        "references": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "name": {"type": "string"},
+                                    "sections": {"$ref": "#/components/schemas/SectionList"},
+                                },
+                            },
+                        },
                         "usage_hint": {"type": "string"},
                     },
                 },
+                "SectionList": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "string"},
+                            "title": {"type": "string"},
+                            "chars": {"type": "integer", "description": "Section size in characters"},
+                            "tokens": _tokens_schema("the section"),
+                            "fetch_path": {"type": "string"},
+                        },
+                    },
+                },
+                "SectionDetail": {
+                    "type": "object",
+                    "properties": {
+                        "skill": {"type": "string"},
+                        "persona": {"type": "string"},
+                        "reference": {"type": "string", "description": "Present for reference sections"},
+                        "id": {"type": "string"},
+                        "title": {"type": "string"},
+                        "content": {"type": "string", "description": "Markdown content of the section"},
+                    },
+                },
                 "ReferenceDetail": {
                     "type": "object",
                     "properties": {
                         "name": {"type": "string"},
                         "skill": {"type": "string"},
                         "persona": {"type": "string"},
+                        "tokens": _tokens_schema("content"),
                         "content": {
                             "type": "string",
                             "description": "Full markdown content of the reference document",
                         },
                     },
                 },
+                "PersonaBundle": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "string"},
+                        "label": {"type": "string"},
+                        "headline": {"type": "string"},
+                        "pitch": {"type": "string"},
+                        "design": {
+                            "type": "object",
+                            "properties": {
+                                "objective": {"type": "string"},
+                                "principles": {"type": "array", "items": {"type": "string"}},
+                                "tone": {"type": "string"},
+                                "success": {"type": "string"},
+                            },
+                        },
+                        "skills": {
+                            "type": "array",
+                            "description": "Every skill of the persona with its full instructions",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "name": {"type": "string"},
+                                    "description": {"type": "string"},
+                                    "version": {"type": "string"},
+                                    "tokens": _tokens_schema("skill_body"),
+                                    "skill_body": {
+                                        "type": "string",
+                                        "description": "Complete skill instructions in markdown",
+                                    },
+                                    "references": {
+                                        "type": "array",
+                                        "items": {
+                                            "type": "object",
+                                            "properties": {
+                                                "name": {"type": "string"},
+                                                "tokens": _tokens_schema("content"),
+                                                "content": {"type": "string"},
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                        "usage_hint": {"type": "string"},
+                    },
+                },
             },
         },
     }
 
 
+def check_openapi_responses(spec: dict[str, Any], actions_dir: Path) -> list[str]:
+    """Check every written endpoint file against its 200 response schema.
+
+    Each path template is mapped to the files it serves ({param} matches one
+    path segment). Files must parse as JSON, match the schema's types, and
+    contain no properties the schema does not declare. Returns a list of
+    problems, empty when the spec describes every response.
+    """
+    problems: list[str] = []
+    for template, item in spec["paths"].items():
+        schema = item["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        pattern = re.sub(r"\{[^}]+\}", "*", template.removeprefix("/actions/"))
+        for path in sorted(actions_dir.glob(pattern)):
+            rel = path.relative_to(actions_dir).as_posix()
+            try:
+                value = json.loads(path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError as e:
+                problems.append(f"{rel}: invalid JSON ({e})")
+                continue
+            _check_schema(value, schema, spec, rel, problems)
+    return problems
+
+
+_JSON_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "integer": int,
+    "boolean": bool,
+}
+
+
+def _check_schema(value: Any, schema: dict[str, Any], spec: dict[str, Any], where: str, problems: list[str]):
+    while "$ref" in schema:
+        node: Any = spec
+        for part in schema["$ref"].removeprefix("#/").split("/"):
+            node = node[part]
+        schema = node
+    expected = schema.get("type")
+    if expected in _JSON_TYPES:
+        ok = isinstance(value, _JSON_TYPES[expected])
+        if expected == "integer" and isinstance(value, bool):
+            ok = False
+        if not ok:
+            problems.append(f"{where}: expected {expected}, got {type(value).__name__}")
+            return
+    if isinstance(value, dict) and "properties" in schema:
+        for key, item in value.items():
+            if key not in schema["properties"]:
+                problems.append(f"{where}: undeclared property {key!r}")
+            else:
+                _check_schema(item, schema["properties"][key], spec, f"{where}.{key}", problems)
+    elif isinstance(value, list) and "items" in schema:
+        for i, item in enumerate(value):
+            _check_schema(item, schema["items"], spec, f"{where}[{i}]", problems)
+
+
 def _persona_id_param(persona_ids: list[str]) -> dict[str, Any]:
     return {
         "name": "persona_id",
@@ -500,9 +886,29 @@ def _ref_name_param(all_refs: dict[str, dict[str, list[str]]]) -> dict[str, Any]
     }
 
 
-def _write_json(path: Path, data: Any):
+def _tokens_schema(what: str) -> dict[str, Any]:
+    return {"type": "integer", "description": f"Estimated token count of {what}"}
+
+
+def _section_id_param() -> dict[str, Any]:
+    return {
+        "name": "section_id",
+        "in": "path",
+        "required": True,
+        "schema": {"type": "string"},
+        "description": "Section id from the skill's table of contents (getSkillToc)",
+    }
+
+
+def _json_text(data: Any, compact: bool = False) -> str:
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+
+
+def _write_json(path: Path, data: Any, *, compact: bool = False):
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    path.write_text(_json_text(data, compact), encoding="utf-8")
 
 
 def _write_openapi_yaml(path: Path, spec: dict[str, Any]):
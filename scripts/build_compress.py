@@ -0,0 +1,200 @@
+"""Precompressed .gz and .br siblings for the text assets in _site/.
+
+Static hosts that support precompressed variants can send `index.json.gz` or
+`index.json.br` directly when the client accepts it, instead of compressing on
+every request or not at all.
+
+    precompress_site(OUTPUT_DIR, hashes, min_size=1024)
+
+Only text files at or above min_size get siblings. A file whose SHA-256 (taken
+from the site manifest) matches the last run keeps its existing siblings;
+siblings whose source disappeared or shrank below the threshold are removed.
+Results are written to _site/.precompress.json, which doubles as the
+per-file size report:
+
+    {"min_size": 1024, "files": {"inventory/cle.json": {
+        "sha256": "…", "size": 5120, "gzip": 1400, "br": 1200}}}
+
+Brotli output needs the optional `brotli` package; without it only .gz
+siblings are written.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+REPORT_NAME = ".precompress.json"
+TEXT_SUFFIXES = {".html", ".css", ".js", ".json", ".yaml", ".md", ".svg", ".txt"}
+SIBLING_SUFFIXES = (".gz", ".br")
+
+
+def compress_file(path: Path) -> dict[str, int]:
+    """Write path.gz (and path.br when available); return the compressed sizes."""
+    data = path.read_bytes()
+    # mtime=0 keeps the gzip header, and so the .gz bytes, reproducible.
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    path.with_name(path.name + ".gz").write_bytes(gz)
+    sizes = {"gzip": len(gz)}
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        path.with_name(path.name + ".br").write_bytes(br)
+        sizes["br"] = len(br)
+    return sizes
+
+
+def remove_siblings(path: Path):
+    """Delete path's .gz/.br siblings, if any."""
+    for suffix in SIBLING_SUFFIXES:
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+
+def precompress_site(
+    output_dir: Path,
+    hashes: dict[str, dict[str, Any]],
+    *,
+    min_size: int = 1024,
+    executor: Executor | None = None,
+) -> dict[str, Any]:
+    """Create or refresh .gz/.br siblings for text files in output_dir.
+
+    hashes is the "files" mapping from write_site_manifest(). Returns the
+    report that is also written to _site/.precompress.json.
+    """
+    report_path = output_dir / REPORT_NAME
+    previous: dict[str, dict[str, Any]] = {}
+    if report_path.exists():
+        prev_report = json.loads(report_path.read_text(encoding="utf-8"))
+        if prev_report.get("min_size") == min_size:
+            previous = prev_report.get("files", {})
+
+    wanted = {
+        rel: entry
+        for rel, entry in hashes.items()
+        if Path(rel).suffix in TEXT_SUFFIXES and entry["size"] >= min_size
+    }
+
+    # Drop siblings whose source is gone or no longer qualifies.
+    for suffix in SIBLING_SUFFIXES:
+        for sibling in output_dir.rglob(f"*{suffix}"):
+            rel = sibling.relative_to(output_dir).as_posix()[: -len(suffix)]
+            if rel not in wanted:
+                sibling.unlink()
+
+    expected = [".gz", ".br"] if brotli is not None else [".gz"]
+    files: dict[str, dict[str, Any]] = {}
+    todo: list[str] = []
+    for rel, entry in wanted.items():
+        prev = previous.get(rel)
+        path = output_dir / rel
+        fresh = (
+            prev is not None
+            and prev["sha256"] == entry["sha256"]
+            and ("br" in prev) == (brotli is not None)
+            and all(path.with_name(path.name + s).exists() for s in expected)
+        )
+        if fresh:
+            files[rel] = prev
+        else:
+            remove_siblings(path)
+            todo.append(rel)
+
+    if executor is None:
+        results = [compress_file(output_dir / rel) for rel in todo]
+    else:
+        futures = [executor.submit(compress_file, output_dir / rel) for rel in todo]
+        results = [f.result() for f in futures]
+
+    for rel, sizes in zip(todo, results):
+        files[rel] = {"sha256": wanted[rel]["sha256"], "size": wanted[rel]["size"], **sizes}
+
+    report = {"min_size": min_size, "files": dict(sorted(files.items()))}
+    report_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    total = sum(e["size"] for e in files.values())
+    gz_total = sum(e["gzip"] for e in files.values())
+    line = f"Precompressed {len(files)} files ({len(todo)} updated): {total / 1024:.0f} KB"
+    line += f" -> gzip {gz_total / 1024:.0f} KB"
+    if brotli is not None:
+        br_total = sum(e["br"] for e in files.values())
+        line += f", brotli {br_total / 1024:.0f} KB"
+    else:
+        line += " (install 'brotli' for .br siblings)"
+    print(line)
+    return report
+
+
+def _endpoint_group(rel: str) -> str:
+    """Up to two levels of a file's parent directory (actions/skills/, …; top level "/")."""
+    parts = rel.split("/")[:-1][:2]
+    return "/".join(parts) + "/" if parts else "/"
+
+
+def format_size_report(report: dict[str, Any]) -> str:
+    """Summarize transfer savings per endpoint directory.
+
+    Files are grouped by up to two levels of their parent directory
+    (actions/skills/, inventory/, traces/cle/, …; top-level files as "/").
+    """
+    groups: dict[str, dict[str, int]] = {}
+    for rel, entry in report["files"].items():
+        key = _endpoint_group(rel)
+        g = groups.setdefault(key, {"files": 0, "size": 0, "gzip": 0, "br": 0})
+        g["files"] += 1
+        g["size"] += entry["size"]
+        g["gzip"] += entry["gzip"]
+        g["br"] += entry.get("br", 0)
+
+    lines = [f"{'endpoint':<28}{'files':>7}{'raw KB':>10}{'gzip KB':>10}{'br KB':>10}{'saved':>8}"]
+    for key, g in sorted(groups.items()):
+        best = g["br"] or g["gzip"]
+        saved = 1 - best / g["size"] if g["size"] else 0.0
+        lines.append(
+            f"{key:<28}{g['files']:>7}{g['size'] / 1024:>10.1f}{g['gzip'] / 1024:>10.1f}"
+            f"{g['br'] / 1024:>10.1f}{saved:>8.0%}"
+        )
+    return "\n".join(lines)
+
+
+def format_compact_json_report(output_dir: Path, roots: list[str], skip: frozenset[str] = frozenset()) -> str:
+    """Compare minified JSON under output_dir/roots with its indent=2 form.
+
+    Used after a --compact-json build; groups files like format_size_report.
+    Files in skip (relative paths) are left out, e.g. ones that are always
+    written compact.
+    """
+    groups: dict[str, dict[str, int]] = {}
+    for root in roots:
+        for path in sorted((output_dir / root).rglob("*.json")):
+            rel = path.relative_to(output_dir).as_posix()
+            if rel in skip:
+                continue
+            text = path.read_text(encoding="utf-8")
+            pretty = json.dumps(json.loads(text), indent=2, ensure_ascii=False) + "\n"
+            g = groups.setdefault(_endpoint_group(rel), {"files": 0, "pretty": 0, "compact": 0})
+            g["files"] += 1
+            g["pretty"] += len(pretty.encode())
+            g["compact"] += len(text.encode())
+
+    lines = [f"{'endpoint':<28}{'files':>7}{'pretty KB':>11}{'compact KB':>12}{'saved':>8}"]
+    for key, g in sorted(groups.items()):
+        saved = 1 - g["compact"] / g["pretty"] if g["pretty"] else 0.0
+        lines.append(
+            f"{key:<28}{g['files']:>7}{g['pretty'] / 1024:>11.1f}{g['compact'] / 1024:>12.1f}{saved:>8.0%}"
+        )
+    pretty = sum(g["pretty"] for g in groups.values())
+    compact = sum(g["compact"] for g in groups.values())
+    lines.append(
+        f"{'total':<28}{sum(g['files'] for g in groups.values()):>7}"
+        f"{pretty / 1024:>11.1f}{compact / 1024:>12.1f}"
+        f"{(1 - compact / pretty if pretty else 0.0):>8.0%}"
+    )
+    return "\n".join(lines)
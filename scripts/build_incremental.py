@@ -0,0 +1,150 @@
+"""Incremental build support: a manifest of input hashes kept in _site/.
+
+Every output of build.py belongs to a *unit* -- one skill archive, one meta
+skill archive, the inventory JSON, the website, the actions tree, the .mcpb,
+one published trace file. The manifest maps each unit key to a digest of the
+inputs that feed it and the list of files it wrote:
+
+    {
+      "version": 2,
+      "units": {
+        "skills/student/socratic-tutor.skill": {
+          "digest": "…",
+          "outputs": ["skills/student/socratic-tutor.skill"]
+        },
+        …
+      }
+    }
+
+On an incremental build, a unit whose digest is unchanged and whose outputs
+still exist is skipped. A unit that is rebuilt first has its previous outputs
+removed, and outputs of units that no longer exist at all are deleted when
+the build finishes. Either way the outputs' precompressed .gz/.br siblings
+go with them, so a later build without --precompress can't leave them
+serving old content.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterable
+
+from build_compress import remove_siblings
+
+MANIFEST_NAME = ".build-manifest.json"
+MANIFEST_VERSION = 2
+
+
+def digest_inputs(*inputs: Path | str) -> str:
+    """Hash a mix of files, directory trees, and literal strings.
+
+    Directories are walked recursively in sorted order; each file contributes
+    its name (relative to the directory) and its bytes, so renames count as
+    changes. Strings cover build parameters such as the base URL.
+    """
+    h = hashlib.sha256()
+    for item in inputs:
+        if isinstance(item, Path):
+            if item.is_dir():
+                files = sorted(p for p in item.rglob("*") if p.is_file())
+                root = item
+            elif item.is_file():
+                files = [item]
+                root = item.parent
+            else:
+                files = []
+                root = item
+            h.update(f"path:{item.name}\0".encode())
+            for file in files:
+                h.update(f"{file.relative_to(root).as_posix()}\0".encode())
+                h.update(file.read_bytes())
+                h.update(b"\0")
+        else:
+            h.update(f"str:{item}\0".encode())
+    return h.hexdigest()
+
+
+class BuildManifest:
+    """Tracks which units of the current build are fresh, rebuilt, or gone."""
+
+    def __init__(self, output_dir: Path, previous: dict[str, dict] | None = None):
+        self.output_dir = output_dir
+        self._previous = previous or {}
+        self._units: dict[str, dict] = {}
+
+    @classmethod
+    def load(cls, output_dir: Path) -> BuildManifest:
+        """Read the manifest left by the last build, or start empty."""
+        path = output_dir / MANIFEST_NAME
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return cls(output_dir)
+        if data.get("version") != MANIFEST_VERSION:
+            return cls(output_dir)
+        return cls(output_dir, data.get("units", {}))
+
+    def is_fresh(self, key: str, digest: str) -> bool:
+        """Return True (and carry the unit forward) if it needs no rebuild."""
+        prev = self._previous.get(key)
+        if prev is None or prev["digest"] != digest:
+            return False
+        if not all((self.output_dir / p).exists() for p in prev["outputs"]):
+            return False
+        self._units[key] = prev
+        return True
+
+    def begin(self, key: str):
+        """Remove a stale unit's previous outputs before it is rebuilt."""
+        prev = self._previous.get(key)
+        if prev:
+            self._remove(prev["outputs"])
+
+    def record(self, key: str, digest: str, outputs: Iterable[Path]):
+        """Record a freshly built unit and the files it wrote."""
+        self._units[key] = {
+            "digest": digest,
+            "outputs": sorted(p.relative_to(self.output_dir).as_posix() for p in outputs),
+        }
+
+    def prune(self) -> int:
+        """Delete outputs of units that were not part of this build.
+
+        Returns the number of files removed.
+        """
+        current = {p for unit in self._units.values() for p in unit["outputs"]}
+        stale = [
+            p
+            for key, unit in self._previous.items()
+            if key not in self._units
+            for p in unit["outputs"]
+            if p not in current
+        ]
+        return self._remove(stale)
+
+    def save(self):
+        path = self.output_dir / MANIFEST_NAME
+        path.write_text(
+            json.dumps(
+                {"version": MANIFEST_VERSION, "units": dict(sorted(self._units.items()))},
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+
+    def _remove(self, rel_paths: Iterable[str]) -> int:
+        removed = 0
+        for rel in rel_paths:
+            path = self.output_dir / rel
+            remove_siblings(path)
+            if not path.is_file():
+                continue
+            path.unlink()
+            removed += 1
+            parent = path.parent
+            while parent != self.output_dir and not any(parent.iterdir()):
+                parent.rmdir()
+                parent = parent.parent
+        return removed
@@ -2,7 +2,16 @@
 """Build a Claude Desktop Extension (.mcpb) for the Legal Ed Skills Hub.
 
 Reads templates/mcpb/ (which mirrors the .mcpb zip structure), renders
-{{…}} placeholders, and zips the result.
+{{…}} placeholders, and zips the result reproducibly (see build_zip.py).
+
+The extension also carries server/snapshot.json: every JSON endpoint under
+_site/actions/ (minus the OpenAPI spec, which the server never reads) packed
+into one file with the tree's version hash. The server answers from it
+without touching the network and checks actions/version.json in the
+background to learn when the snapshot has gone stale.
+
+Live responses are kept in an LRU cache with a TTL and revalidated with
+ETags; its settings (CacheSettings) are rendered into server/config.json.
 
 Run after build.py (needs _site/actions/personas.json):
 
@@ -12,18 +21,31 @@ Run after build.py (needs _site/actions/personas.json):
 import argparse
 import json
 import os
-import tempfile
 import zipfile
 from pathlib import Path
+from typing import NamedTuple
 
 from dotenv import load_dotenv
 
+from build_zip import write_member
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 MCPB_TEMPLATE_DIR = PROJECT_ROOT / "templates" / "mcpb"
 SITE_DIR = PROJECT_ROOT / "_site"
+SNAPSHOT_NAME = "server/snapshot.json"
+SNAPSHOT_SKIP = {"openapi.json"}
+
+
+class CacheSettings(NamedTuple):
+    """MCP server cache settings, rendered into server/config.json."""
+
+    ttl_seconds: int = 300
+    max_entries: int = 200
+    version_check_seconds: int = 600
+    max_batch: int = 20
 
 
-def _build_replacements(base_url: str, site_dir: Path) -> dict[str, str]:
+def _build_replacements(base_url: str, site_dir: Path, cache: CacheSettings) -> dict[str, str]:
     """Compute all {{…}} replacement values."""
     personas_json_path = site_dir / "actions" / "personas.json"
     personas_data = json.loads(personas_json_path.read_text(encoding="utf-8"))
@@ -34,24 +56,55 @@ def _build_replacements(base_url: str, site_dir: Path) -> dict[str, str]:
 
     return {
         "base_url": base_url,
-        "personas_json": personas_json_path.read_text(encoding="utf-8"),
+        # Pretty-printed for the model even when the endpoint is minified.
+        "personas_json": json.dumps(personas_data, indent=2, ensure_ascii=False) + "\n",
         "personas_summary": "\n".join(lines),
+        "cache_ttl_seconds": str(cache.ttl_seconds),
+        "cache_max_entries": str(cache.max_entries),
+        "version_check_seconds": str(cache.version_check_seconds),
+        "max_batch": str(cache.max_batch),
     }
 
 
+def _pack_snapshot(site_dir: Path) -> str:
+    """Pack _site/actions/*.json into one compact JSON document."""
+    actions_dir = site_dir / "actions"
+    version = json.loads((actions_dir / "version.json").read_text(encoding="utf-8"))
+    files = {}
+    for path in sorted(actions_dir.rglob("*.json")):
+        rel = path.relative_to(actions_dir).as_posix()
+        if rel in SNAPSHOT_SKIP:
+            continue
+        files[rel] = json.loads(path.read_text(encoding="utf-8"))
+    return json.dumps(
+        {"hash": version["hash"], "files": files},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
 def _render(text: str, replacements: dict[str, str]) -> str:
     for key, value in replacements.items():
         text = text.replace(f"{{{{{key}}}}}", value)
     return text
 
 
-def build_mcpb(base_url: str, *, output_dir: Path | None = None, site_dir: Path | None = None):
-    """Build the .mcpb file.
+def build_mcpb(
+    base_url: str,
+    *,
+    output_dir: Path | None = None,
+    site_dir: Path | None = None,
+    snapshot: bool = True,
+    cache: CacheSettings = CacheSettings(),
+) -> Path:
+    """Build the .mcpb file and return its path.
 
     Args:
         base_url: Deployed site base URL.
         output_dir: Where to write the .mcpb. Defaults to _site/.
-        site_dir: Location of the built _site/ (for reading actions/personas.json).
+        site_dir: Location of the built _site/ (for reading actions/).
+        snapshot: Embed the actions snapshot for offline answers.
+        cache: The server's live-response cache settings.
     """
     base = base_url if base_url.endswith("/") else base_url + "/"
     if site_dir is None:
@@ -59,34 +112,28 @@ def build_mcpb(base_url: str, *, output_dir: Path | None = None, site_dir: Path
     if output_dir is None:
         output_dir = SITE_DIR
 
-    replacements = _build_replacements(base, site_dir)
+    replacements = _build_replacements(base, site_dir, cache)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp = Path(tmpdir)
+    mcpb_path = output_dir / "legal-ed-skills-hub.mcpb"
+    mcpb_path.parent.mkdir(parents=True, exist_ok=True)
 
+    with zipfile.ZipFile(mcpb_path, "w", zipfile.ZIP_DEFLATED) as zf:
         for src in sorted(MCPB_TEMPLATE_DIR.rglob("*")):
             if not src.is_file() or src.name.startswith("."):
                 continue
             rel = src.relative_to(MCPB_TEMPLATE_DIR)
-            dest = tmp / rel
-            dest.parent.mkdir(parents=True, exist_ok=True)
 
             content = src.read_text(encoding="utf-8")
             if "{{" in content:
                 content = _render(content, replacements)
-            dest.write_text(content, encoding="utf-8")
+            write_member(zf, rel.as_posix(), content)
+        if snapshot:
+            write_member(zf, SNAPSHOT_NAME, _pack_snapshot(site_dir))
 
-        mcpb_path = output_dir / "legal-ed-skills-hub.mcpb"
-        mcpb_path.parent.mkdir(parents=True, exist_ok=True)
+    size_kb = mcpb_path.stat().st_size / 1024
+    print(f"Built MCPB: {mcpb_path} ({size_kb:.0f} KB)")
 
-        with zipfile.ZipFile(mcpb_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for file in sorted(tmp.rglob("*")):
-                if not file.is_file():
-                    continue
-                zf.write(file, file.relative_to(tmp))
-
-        size_kb = mcpb_path.stat().st_size / 1024
-        print(f"Built MCPB: {mcpb_path} ({size_kb:.0f} KB)")
+    return mcpb_path
 
 
 def main():
@@ -98,12 +145,52 @@ def main():
         default=os.environ.get("BASE_URL", ""),
         help="Base URL of the deployed site (required)",
     )
+    parser.add_argument(
+        "--no-snapshot",
+        action="store_true",
+        help="Don't embed the actions snapshot; the server always fetches live.",
+    )
+    defaults = CacheSettings()
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=defaults.ttl_seconds,
+        help=f"Seconds a live response is served before revalidation. Defaults to {defaults.ttl_seconds}.",
+    )
+    parser.add_argument(
+        "--cache-max-entries",
+        type=int,
+        default=defaults.max_entries,
+        help=f"Live responses kept in the server's LRU cache. Defaults to {defaults.max_entries}.",
+    )
+    parser.add_argument(
+        "--version-check",
+        type=int,
+        default=defaults.version_check_seconds,
+        help="Seconds between background checks of actions/version.json. "
+             f"Defaults to {defaults.version_check_seconds}.",
+    )
+    parser.add_argument(
+        "--max-batch",
+        type=int,
+        default=defaults.max_batch,
+        help=f"Most paths one getJsonBatch call may request. Defaults to {defaults.max_batch}.",
+    )
     args = parser.parse_args()
 
     if not args.base_url:
         parser.error("--base-url is required (or set BASE_URL in .env)")
 
-    build_mcpb(args.base_url)
+    build_mcpb(
+        args.base_url,
+        snapshot=not args.no_snapshot,
+        cache=CacheSettings(
+            ttl_seconds=args.cache_ttl,
+            max_entries=args.cache_max_entries,
+            version_check_seconds=args.version_check,
+            max_batch=args.max_batch,
+        ),
+    )
 
 
 if __name__ == "__main__":
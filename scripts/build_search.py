@@ -0,0 +1,124 @@
+"""Build-time BM25 search index over the skills in the GPT Actions API.
+
+Clients that need to route a request to a skill otherwise walk the persona
+listings and read descriptions one by one. build_actions() writes
+_site/actions/search-index.json instead, so a client can rank every skill
+across all personas after a single fetch:
+
+    {
+      "version": 1,
+      "docs": [{"persona": "student", "skill": "socratic-tutor",
+                "description": "…", "path": "skills/student/socratic-tutor.json"}, …],
+      "terms": {"abstention": [3, 1.204, 11, 0.381], …}
+    }
+
+Each term maps to a flat list of (doc index, weight) pairs. The weight is the
+term's full BM25 contribution (IDF times the saturated, length-normalized
+term frequency), precomputed at build time, so scoring a query is a sum of
+lookups: split the query with the same tokenizer, add up each doc's weights
+for the distinct query terms, sort. search() below is the reference scorer;
+the MCP server ships a JavaScript port of tokenize() and search().
+
+Term frequency is counted over weighted fields (BM25F-style): a hit in the
+skill name counts three times, in the description or a heading twice, in the
+body once.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from typing import Any
+
+INDEX_VERSION = 1
+K1 = 1.2
+B = 0.75
+FIELD_WEIGHTS = {"name": 3, "description": 2, "headings": 2, "body": 1}
+
+STOP_WORDS = frozenset(
+    "a an and are as at be but by can do does for from has have how i if in into is it its "
+    "me my no not of on or our so that the their them then there these they this to was we "
+    "what when which who will with you your".split()
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase words minus stop words, with a naive plural strip.
+
+    Must stay in sync with tokenize() in templates/mcpb/server/index.js.
+    """
+    tokens = []
+    for word in _TOKEN_RE.findall(text.lower()):
+        if len(word) < 2 or word in STOP_WORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+def _fields(skill: dict[str, Any]) -> dict[str, str]:
+    body = skill["record"].body
+    headings = "\n".join(line.lstrip("#") for line in body.splitlines() if line.startswith("#"))
+    return {
+        "name": skill["name"].replace("-", " "),
+        "description": skill["description"],
+        "headings": headings,
+        "body": body,
+    }
+
+
+def build_search_index(personas: dict[str, dict]) -> dict[str, Any]:
+    """Build the index for every non-meta skill in a discover_personas() result."""
+    docs: list[dict[str, str]] = []
+    freqs: list[Counter[str]] = []
+    for persona_id, pdata in personas.items():
+        for s in pdata["skills"]:
+            if s["is_meta"]:
+                continue
+            tf: Counter[str] = Counter()
+            for field, text in _fields(s).items():
+                weight = FIELD_WEIGHTS[field]
+                for token in tokenize(text):
+                    tf[token] += weight
+            docs.append({
+                "persona": persona_id,
+                "skill": s["name"],
+                "description": s["description"],
+                "path": f"skills/{persona_id}/{s['name']}.json",
+            })
+            freqs.append(tf)
+
+    n = len(docs)
+    lengths = [sum(tf.values()) for tf in freqs]
+    avg_len = sum(lengths) / n if n else 0.0
+    df: Counter[str] = Counter(term for tf in freqs for term in tf)
+
+    postings: dict[str, list[float]] = {}
+    for term in sorted(df):
+        idf = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5))
+        flat: list[float] = []
+        for i, tf in enumerate(freqs):
+            f = tf.get(term)
+            if not f:
+                continue
+            norm = f * (K1 + 1) / (f + K1 * (1 - B + B * lengths[i] / avg_len))
+            flat.extend((i, round(idf * norm, 3)))
+        postings[term] = flat
+
+    return {"version": INDEX_VERSION, "docs": docs, "terms": postings}
+
+
+def search(index: dict[str, Any], query: str, limit: int = 5) -> list[dict[str, Any]]:
+    """Rank the index's skills for query; best first, at most limit results."""
+    scores: dict[int, float] = {}
+    for term in set(tokenize(query)):
+        flat = index["terms"].get(term, ())
+        for j in range(0, len(flat), 2):
+            doc = int(flat[j])
+            scores[doc] = scores.get(doc, 0.0) + flat[j + 1]
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [{**index["docs"][doc], "score": round(score, 3)} for doc, score in ranked]
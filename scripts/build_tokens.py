@@ -0,0 +1,129 @@
+"""Approximate token costs for skills and the context-budget report.
+
+A skill costs tokens twice: when it is installed as a system prompt (the
+SKILL.md, or the rendered SKILL.md of a meta skill) and when it is fetched
+through the actions API. estimate_tokens() gives a fast, offline estimate
+that is close enough to compare skills and catch bloat; it is not a
+tokenizer and will differ from any particular model's count by a few
+percent either way on English markdown.
+
+Counts are added to the inventory and actions JSON as "tokens" fields, and
+
+    uv run scripts/build.py --token-budget 4000
+
+prints a per-skill report, writes it to _site/token-budget.json, and exits
+non-zero if any skill's install cost plus its references exceeds the budget.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+BUDGET_NAME = "token-budget.json"
+
+# Letter runs, digit runs (BPE vocabularies mostly split numbers into groups
+# of up to three), and runs of other non-space characters.
+_PIECE_RE = re.compile(r"[^\W\d_]+|\d{1,3}|[^\w\s]+|_+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text.
+
+    Common words are one token and longer words split roughly every seven
+    letters; punctuation runs such as '**' or '---' cost about one token per
+    four characters. Whitespace is folded into the neighbouring piece.
+    """
+    count = 0
+    for piece in _PIECE_RE.findall(text):
+        if piece[0].isalpha():
+            count += 1 + (len(piece) - 1) // 7
+        elif piece[0].isdigit():
+            count += 1
+        else:
+            count += (len(piece) + 3) // 4
+    return count
+
+
+def skill_token_costs(
+    personas: dict[str, dict],
+    rendered_meta: dict[str, str],
+) -> dict[str, dict[str, dict[str, int]]]:
+    """Token costs per persona and skill.
+
+    Returns {persona_id: {skill_name: {"tokens", "reference_tokens"}}}, where
+    tokens is the install cost (the SKILL.md, or for a meta skill the SKILL.md
+    rendered from the template, passed in rendered_meta by persona) and
+    reference_tokens covers the skill's own reference documents.
+    """
+    costs: dict[str, dict[str, dict[str, int]]] = {}
+    for persona_id, pdata in personas.items():
+        costs[persona_id] = {}
+        for s in pdata["skills"]:
+            record = s["record"]
+            text = rendered_meta.get(persona_id, record.text) if s["is_meta"] else record.text
+            costs[persona_id][s["name"]] = {
+                "tokens": estimate_tokens(text),
+                "reference_tokens": sum(
+                    estimate_tokens(record.reference_text(r)) for r in record.references
+                ),
+            }
+    return costs
+
+
+def budget_report(
+    costs: dict[str, dict[str, dict[str, int]]],
+    output_dir: Path,
+    budget: int,
+) -> dict[str, Any]:
+    """Combine install costs with the actions payloads written to output_dir.
+
+    Each row gets the token estimate of the skill's actions JSON (the
+    getSkill response) and its persona's bundle, and is flagged over_budget
+    when tokens + reference_tokens exceeds budget.
+    """
+    def payload_tokens(rel: str) -> int | None:
+        path = output_dir / rel
+        return estimate_tokens(path.read_text(encoding="utf-8")) if path.is_file() else None
+
+    rows = []
+    for persona_id, skills in costs.items():
+        bundle = payload_tokens(f"actions/bundles/{persona_id}.json")
+        for name, cost in skills.items():
+            total = cost["tokens"] + cost["reference_tokens"]
+            rows.append({
+                "persona": persona_id,
+                "skill": name,
+                **cost,
+                "total": total,
+                "actions_tokens": payload_tokens(f"actions/skills/{persona_id}/{name}.json"),
+                "bundle_tokens": bundle,
+                "over_budget": total > budget,
+            })
+    return {"budget": budget, "skills": rows}
+
+
+def write_budget_report(report: dict[str, Any], output_dir: Path) -> Path:
+    path = output_dir / BUDGET_NAME
+    path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def format_budget_report(report: dict[str, Any]) -> str:
+    """A table of every skill's costs, largest first, over-budget rows marked '!'."""
+    lines = [
+        f"  {'persona':<18}{'skill':<28}{'install':>9}{'refs':>8}{'total':>8}{'action':>8}{'bundle':>8}",
+    ]
+    for row in sorted(report["skills"], key=lambda r: -r["total"]):
+        mark = "!" if row["over_budget"] else " "
+        lines.append(
+            f"{mark} {row['persona']:<18}{row['skill']:<28}{row['tokens']:>9}"
+            f"{row['reference_tokens']:>8}{row['total']:>8}"
+            f"{row['actions_tokens'] if row['actions_tokens'] is not None else '-':>8}"
+            f"{row['bundle_tokens'] if row['bundle_tokens'] is not None else '-':>8}"
+        )
+    over = sum(row["over_budget"] for row in report["skills"])
+    lines.append(f"{over} of {len(report['skills'])} skills over the {report['budget']}-token budget")
+    return "\n".join(lines)
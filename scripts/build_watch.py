@@ -0,0 +1,185 @@
+"""Watch mode for build.py: rebuild on change and serve _site/ with live reload.
+
+    uv run scripts/build.py --watch [--port 8000]
+
+Source directories are polled for changed, added, or removed files (no extra
+dependencies). Each change triggers an incremental build, so only the outputs
+whose inputs changed are regenerated. _site/ is served over HTTP; HTML pages
+get a small script injected at serve time (never written to _site/) that
+listens on a Server-Sent Events endpoint and reloads the page after each
+successful rebuild.
+"""
+
+from __future__ import annotations
+
+import functools
+import http.server
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Callable
+
+POLL_INTERVAL = 0.2
+# Wait for the tree to stop changing for this long before rebuilding, so an
+# editor's save-via-rename or a multi-file checkout triggers one build.
+SETTLE_TIME = 0.1
+
+RELOAD_PATH = "/__livereload"
+RELOAD_SCRIPT = (
+    "<script>new EventSource('" + RELOAD_PATH + "')"
+    ".addEventListener('reload', () => location.reload());</script>"
+).encode()
+
+
+def snapshot(dirs: list[Path]) -> dict[Path, tuple[int, int]]:
+    """Map every file under dirs to its (mtime_ns, size)."""
+    state = {}
+    for d in dirs:
+        if not d.is_dir():
+            continue
+        for path in d.rglob("*"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if path.is_file():
+                state[path] = (st.st_mtime_ns, st.st_size)
+    return state
+
+
+class ReloadNotifier:
+    """Tells connected pages to reload when the build generation advances."""
+
+    def __init__(self):
+        self._generation = 0
+        self._cond = threading.Condition()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def notify(self):
+        with self._cond:
+            self._generation += 1
+            self._cond.notify_all()
+
+    def wait(self, seen: int, timeout: float) -> int:
+        with self._cond:
+            self._cond.wait_for(lambda: self._generation != seen, timeout=timeout)
+            return self._generation
+
+
+class DevRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Static handler for _site/ with a live-reload event stream."""
+
+    notifier: ReloadNotifier
+
+    def do_GET(self):
+        if self.path == RELOAD_PATH:
+            self._stream_reloads()
+            return
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            path = path / "index.html"
+        if path.suffix == ".html" and path.is_file() and self.path.endswith(("/", ".html")):
+            self._send_html(path)
+            return
+        super().do_GET()
+
+    def _send_html(self, path: Path):
+        body = path.read_bytes()
+        marker = body.rfind(b"</body>")
+        body = body[:marker] + RELOAD_SCRIPT + body[marker:] if marker >= 0 else body + RELOAD_SCRIPT
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream_reloads(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        seen = self.notifier.generation
+        try:
+            while True:
+                current = self.notifier.wait(seen, timeout=15)
+                if current != seen:
+                    seen = current
+                    self.wfile.write(b"event: reload\ndata: {}\n\n")
+                else:
+                    self.wfile.write(b": keep-alive\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        if self.path != RELOAD_PATH:
+            super().log_message(format, *args)
+
+
+def serve(output_dir: Path, port: int, notifier: ReloadNotifier) -> http.server.ThreadingHTTPServer:
+    """Start serving output_dir on a background thread and return the server."""
+    handler = functools.partial(DevRequestHandler, directory=str(output_dir))
+    DevRequestHandler.notifier = notifier
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def watch(
+    rebuild: Callable[[], None],
+    *,
+    watch_dirs: list[Path],
+    output_dir: Path,
+    port: int,
+):
+    """Serve output_dir and call rebuild() whenever a file in watch_dirs changes.
+
+    Runs until interrupted. A failing rebuild is reported and the previous
+    output keeps being served.
+    """
+    notifier = ReloadNotifier()
+    server = serve(output_dir, port, notifier)
+    print(f"Serving {output_dir} at http://127.0.0.1:{port}/")
+    print(f"Watching {', '.join(d.name + '/' for d in watch_dirs)} (Ctrl-C to stop)")
+
+    state = snapshot(watch_dirs)
+    try:
+        while True:
+            time.sleep(POLL_INTERVAL)
+            current = snapshot(watch_dirs)
+            if current == state:
+                continue
+            while True:
+                time.sleep(SETTLE_TIME)
+                settled = snapshot(watch_dirs)
+                if settled == current:
+                    break
+                current = settled
+
+            changed = sorted(
+                (state.keys() ^ current.keys())
+                | {p for p in state.keys() & current.keys() if state[p] != current[p]}
+            )
+            state = current
+            print(f"\n{len(changed)} file(s) changed: {', '.join(p.name for p in changed[:5])}"
+                  + (" …" if len(changed) > 5 else ""))
+
+            start = time.perf_counter()
+            try:
+                rebuild()
+            except Exception:
+                traceback.print_exc()
+                print("Build failed; still serving the previous output.")
+                continue
+            print(f"Rebuilt in {time.perf_counter() - start:.2f}s")
+            notifier.notify()
+    except KeyboardInterrupt:
+        print("\nStopping.")
+    finally:
+        server.shutdown()
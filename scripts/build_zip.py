@@ -0,0 +1,86 @@
+"""Reproducible zip writing for .skill and .mcpb archives.
+
+Every member gets the same fixed timestamp, regular-file permissions, and
+creator system, and callers add members in sorted order, so building the same
+sources twice yields byte-identical archives regardless of file mtimes,
+umask, or the machine doing the build.
+"""
+
+from __future__ import annotations
+
+import struct
+import zipfile
+
+# Earliest timestamp a zip entry can carry (the DOS epoch).
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+# -rw-r--r-- regular file, in the upper 16 bits as zip stores Unix modes.
+ZIP_FILE_ATTR = 0o100644 << 16
+ZIP_CREATE_SYSTEM_UNIX = 3
+# ZipFile internals the raw copy in copy_compressed_member() relies on.
+_RAW_COPY_ATTRS = ("fp", "start_dir", "filelist", "NameToInfo", "_didModify")
+
+
+def zip_info(arcname: str) -> zipfile.ZipInfo:
+    """A ZipInfo with normalized timestamp, permissions, and creator system."""
+    info = zipfile.ZipInfo(arcname, date_time=ZIP_DATE_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.create_system = ZIP_CREATE_SYSTEM_UNIX
+    info.external_attr = ZIP_FILE_ATTR
+    return info
+
+
+def write_member(zf: zipfile.ZipFile, arcname: str, data: bytes | str):
+    """Add one member to zf with normalized metadata."""
+    zf.writestr(zip_info(arcname), data)
+
+
+def copy_compressed_member(
+    src: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    dst: zipfile.ZipFile,
+    arcname: str,
+):
+    """Append a member of src to dst under a new name without recompressing it.
+
+    zipfile has no public raw-copy API, so this reads the stored bytes past
+    the member's local header and writes them behind a new header, keeping
+    the CRC, sizes, and compression method. Metadata is normalized the same
+    way as write_member(). If this Python's zipfile lacks the internals that
+    takes, or the local header isn't where info says, the member is
+    decompressed and written again instead.
+    """
+    new = zip_info(arcname)
+    new.compress_type = info.compress_type
+    header = b""
+    if _raw_copy_supported(src, dst):
+        src.fp.seek(info.header_offset)
+        header = src.fp.read(zipfile.sizeFileHeader)
+    if header[:4] != zipfile.stringFileHeader:
+        dst.writestr(new, src.read(info))
+        return
+
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    src.fp.seek(info.header_offset + zipfile.sizeFileHeader + name_len + extra_len)
+    raw = src.fp.read(info.compress_size)
+
+    new.CRC = info.CRC
+    new.file_size = info.file_size
+    new.compress_size = info.compress_size
+    new.header_offset = dst.fp.tell()
+
+    dst.fp.write(new.FileHeader())
+    dst.fp.write(raw)
+    dst.start_dir = dst.fp.tell()
+    dst.filelist.append(new)
+    dst.NameToInfo[new.filename] = new
+    dst._didModify = True
+
+
+def _raw_copy_supported(src: zipfile.ZipFile, dst: zipfile.ZipFile) -> bool:
+    return (
+        getattr(src, "fp", None) is not None
+        and all(hasattr(dst, attr) for attr in _RAW_COPY_ATTRS)
+        and dst.fp is not None
+        and not getattr(dst, "_writing", False)
+        and callable(getattr(zipfile.ZipInfo, "FileHeader", None))
+    )
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""Serve _site/ locally the way a production static host would.
+
+    uv run scripts/serve_site.py [--port 8000] [--max-age 0] [--log requests.jsonl]
+
+Stands in for the deployed host so the GPT Actions / MCP flow can be tested
+end to end and its cache behaviour and payload sizes measured:
+
+- Strong ETags from a SHA-256 of the bytes sent, taken from _site/manifest.json
+  when the file hasn't changed since the manifest was written and hashed (and
+  remembered per size/mtime) otherwise.
+- If-None-Match answered with 304 Not Modified.
+- Accept-Encoding negotiation onto the .br/.gz siblings written by
+  build.py --precompress (Content-Encoding and Vary set; each encoding has
+  its own ETag). A sibling older than its source is ignored.
+- HTTP/1.1 keep-alive and a thread per connection.
+- One log line per request with status, encoding, bytes, and latency; --log
+  also appends them as JSON lines for later analysis.
+
+Unlike build.py --watch, nothing is injected into pages and nothing is
+rebuilt; run a build first.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import http.server
+import json
+import mimetypes
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SITE_DIR = PROJECT_ROOT / "_site"
+
+# Preferred first when the client accepts several.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def parse_accept_encoding(header: str) -> set[str]:
+    """Codings the client accepts (q > 0). "*" is not expanded."""
+    accepted = set()
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding and q > 0:
+            accepted.add(coding.lower())
+    return accepted
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match comparison (weak comparison, as RFC 9110 requires)."""
+    if header.strip() == "*":
+        return True
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return etag in tags
+
+
+class ETagStore:
+    """Content-hash ETags for files under the site directory."""
+
+    def __init__(self, site_dir: Path):
+        self.site_dir = site_dir
+        self._lock = threading.Lock()
+        self._hashes: dict[Path, tuple[tuple[int, int], str]] = {}
+        self._manifest: dict[str, dict[str, Any]] = {}
+        self._manifest_ns = 0
+        self._load_manifest()
+
+    def _load_manifest(self):
+        path = self.site_dir / "manifest.json"
+        try:
+            self._manifest_ns = path.stat().st_mtime_ns
+            self._manifest = json.loads(path.read_text(encoding="utf-8")).get("files", {})
+        except (OSError, json.JSONDecodeError):
+            self._manifest, self._manifest_ns = {}, 0
+
+    def etag(self, path: Path, st: os.stat_result) -> str:
+        sig = (st.st_size, st.st_mtime_ns)
+        with self._lock:
+            cached = self._hashes.get(path)
+        if cached and cached[0] == sig:
+            return cached[1]
+        entry = self._manifest.get(path.relative_to(self.site_dir).as_posix())
+        # Same freshness test as write_site_manifest() in build.py.
+        if entry and entry["size"] == st.st_size and st.st_ctime_ns < self._manifest_ns:
+            digest = entry["sha256"]
+        else:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        etag = f'"{digest[:32]}"'
+        with self._lock:
+            self._hashes[path] = (sig, etag)
+        return etag
+
+
+class SiteRequestHandler(http.server.BaseHTTPRequestHandler):
+    """GET/HEAD for static files with ETags and precompressed variants."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, keep-alive
+    # clients wait ~40 ms for a delayed ACK before the body arrives.
+    disable_nagle_algorithm = True
+    server_version = "SkillsHubStatic/1.0"
+
+    site_dir: Path
+    etags: ETagStore
+    cache_control: str
+    log_file: Any = None
+    quiet = False
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def _resolve(self) -> Path | None:
+        rel = unquote(urlsplit(self.path).path).lstrip("/")
+        path = (self.site_dir / rel).resolve()
+        if path != self.site_dir and self.site_dir not in path.parents:
+            return None
+        if path.is_dir():
+            path = path / "index.html"
+        return path if path.is_file() else None
+
+    def _serve(self, send_body: bool):
+        start = time.perf_counter()
+        self._encoding = None
+        self._sent = 0
+        path = self._resolve()
+        if path is None or any(p.startswith(".") for p in path.relative_to(self.site_dir).parts):
+            self._send_simple(404, b"Not found\n", send_body)
+            self._log_request(start)
+            return
+
+        accepted = parse_accept_encoding(self.headers.get("Accept-Encoding", ""))
+        body_path = path
+        source_ns = path.stat().st_mtime_ns
+        for coding, suffix in ENCODINGS:
+            if coding not in accepted:
+                continue
+            sibling = path.with_name(path.name + suffix)
+            try:
+                sibling_ns = sibling.stat().st_mtime_ns
+            except OSError:
+                continue
+            # An older sibling predates a rebuild of the source that ran without --precompress.
+            if sibling_ns >= source_ns:
+                body_path, self._encoding = sibling, coding
+                break
+
+        st = body_path.stat()
+        etag = self.etags.etag(body_path, st)
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in ("application/json", "application/javascript"):
+            content_type += "; charset=utf-8"
+
+        if etag_matches(self.headers.get("If-None-Match", ""), etag):
+            self.send_response(304)
+            self._common_headers(etag)
+            self.end_headers()
+            self._log_request(start)
+            return
+
+        self.send_response(200)
+        self._common_headers(etag)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(st.st_size))
+        if self._encoding:
+            self.send_header("Content-Encoding", self._encoding)
+        self.end_headers()
+        if send_body:
+            with body_path.open("rb") as f:
+                self._sent = self._copy(f)
+        self._log_request(start)
+
+    def _copy(self, f) -> int:
+        sent = 0
+        while chunk := f.read(64 * 1024):
+            self.wfile.write(chunk)
+            sent += len(chunk)
+        return sent
+
+    def _common_headers(self, etag: str):
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", self.cache_control)
+        self.send_header("Vary", "Accept-Encoding")
+
+    def _send_simple(self, status: int, body: bytes, send_body: bool):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+            self._sent = len(body)
+
+    def _log_request(self, start: float):
+        ms = (time.perf_counter() - start) * 1000
+        status = getattr(self, "_status", 0)
+        if not self.quiet:
+            sys.stderr.write(
+                f"{self.command} {self.path} {status} {self._encoding or '-'} "
+                f"{self._sent}B {ms:.2f}ms\n"
+            )
+        if self.log_file is not None:
+            line = json.dumps({
+                "time": time.time(),
+                "method": self.command,
+                "path": self.path,
+                "status": status,
+                "encoding": self._encoding,
+                "bytes": self._sent,
+                "ms": round(ms, 3),
+            })
+            with self.server.log_lock:
+                self.log_file.write(line + "\n")
+                self.log_file.flush()
+
+    def send_response(self, code, message=None):
+        self._status = code
+        super().send_response(code, message)
+
+    def log_request(self, code="-", size="-"):
+        pass  # replaced by _log_request, which knows the latency
+
+
+def serve(
+    site_dir: Path,
+    port: int,
+    *,
+    host: str = "127.0.0.1",
+    max_age: int = 0,
+    log_path: Path | None = None,
+    quiet: bool = False,
+) -> http.server.ThreadingHTTPServer:
+    """Create the server (not yet serving); call serve_forever() on it.
+
+    quiet drops the per-request stderr line (the --log file is still written).
+    """
+    site_dir = site_dir.resolve()
+    handler = type("Handler", (SiteRequestHandler,), {
+        "site_dir": site_dir,
+        "etags": ETagStore(site_dir),
+        "cache_control": f"public, max-age={max_age}" if max_age > 0 else "no-cache",
+        "log_file": log_path.open("a", encoding="utf-8") if log_path else None,
+        "quiet": quiet,
+    })
+    server = http.server.ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.log_lock = threading.Lock()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve _site/ with ETags and precompressed variants.")
+    parser.add_argument("--port", type=int, default=8000, help="Defaults to 8000.")
+    parser.add_argument("--host", default="127.0.0.1", help="Defaults to 127.0.0.1.")
+    parser.add_argument("--dir", type=Path, default=SITE_DIR, help="Site directory. Defaults to _site/.")
+    parser.add_argument(
+        "--max-age",
+        type=int,
+        default=0,
+        help="Cache-Control max-age in seconds. 0 (default) sends no-cache, so "
+             "clients revalidate every request with If-None-Match.",
+    )
+    parser.add_argument("--log", type=Path, help="Append one JSON line per request to this file.")
+    args = parser.parse_args()
+
+    if not args.dir.is_dir():
+        parser.error(f"{args.dir} does not exist; run scripts/build.py first")
+
+    server = serve(args.dir, args.port, host=args.host, max_age=args.max_age, log_path=args.log)
+    print(f"Serving {args.dir} at http://{args.host}:{args.port}/ (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
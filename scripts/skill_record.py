@@ -0,0 +1,281 @@
+"""Parsed, immutable view of one skill directory.
+
+A SkillRecord is built once per skill directory from a single read of its
+files and shared by build.py, build_actions.py, and the test harness:
+
+    record = load_skill(SKILLS_DIR / "student" / "socratic-tutor")
+    record.name, record.version, record.body, record.references
+
+Records are cached per directory and reused until a file in the directory
+is added, removed, or modified (tracked by path, size, and mtime).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+
+
+class SkillReference(NamedTuple):
+    """A reference .md document shipped in a skill's references/ folder."""
+
+    name: str
+    filename: str
+
+
+class SkillSection(NamedTuple):
+    """One level-2 section of a markdown document (see split_sections)."""
+
+    id: str
+    title: str
+    content: str
+
+
+class SkillRecord:
+    """Frontmatter, body, references, and file bytes of a skill; meta sections on demand."""
+
+    __slots__ = (
+        "dir",
+        "stamp",
+        "files",
+        "text",
+        "frontmatter",
+        "body",
+        "references",
+        "digest",
+        "_meta_sections",
+    )
+
+    dir: Path
+    stamp: tuple[tuple[str, int, int], ...]
+    files: Mapping[str, bytes]
+    text: str
+    frontmatter: Mapping[str, str]
+    body: str
+    references: tuple[SkillReference, ...]
+    digest: str
+
+    def __init__(
+        self,
+        dir: Path,
+        stamp: tuple[tuple[str, int, int], ...],
+        files: Mapping[str, bytes],
+        text: str,
+        frontmatter: Mapping[str, str],
+        body: str,
+        references: tuple[SkillReference, ...],
+        digest: str,
+    ):
+        set_ = object.__setattr__
+        set_(self, "dir", dir)
+        set_(self, "stamp", stamp)
+        set_(self, "files", MappingProxyType(dict(files)))
+        set_(self, "text", text)
+        set_(self, "frontmatter", MappingProxyType(dict(frontmatter)))
+        set_(self, "body", body)
+        set_(self, "references", tuple(references))
+        set_(self, "digest", digest)
+        set_(self, "_meta_sections", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        # MappingProxyType can't be pickled; hand plain dicts to __init__ so
+        # records can be sent to build worker processes without re-parsing.
+        return (type(self), (
+            self.dir,
+            self.stamp,
+            dict(self.files),
+            self.text,
+            dict(self.frontmatter),
+            self.body,
+            self.references,
+            self.digest,
+        ))
+
+    def __repr__(self):
+        return f"SkillRecord({str(self.dir)!r})"
+
+    @property
+    def name(self) -> str:
+        return self.frontmatter.get("name", self.dir.name)
+
+    @property
+    def description(self) -> str:
+        return self.frontmatter.get("description", "")
+
+    @property
+    def version(self) -> str:
+        return self.frontmatter.get("version", "0.0.0")
+
+    @property
+    def is_meta(self) -> bool:
+        return self.dir.name.endswith("-meta")
+
+    @property
+    def meta_sections(self) -> Mapping[str, str]:
+        """parse_meta_sections_text() of the SKILL.md, parsed on first access.
+
+        Only meta skills are rendered from sections, so other skills never
+        pay for (or fail on) the stricter meta parse.
+        """
+        if self._meta_sections is None:
+            sections = parse_meta_sections_text(self.text, self.dir / "SKILL.md")
+            object.__setattr__(self, "_meta_sections", MappingProxyType(sections))
+        return self._meta_sections
+
+    def reference_text(self, ref: SkillReference) -> str:
+        return self.files[f"references/{ref.filename}"].decode("utf-8")
+
+
+def parse_frontmatter_text(text: str, source: Path | str = "SKILL.md") -> dict[str, str]:
+    """Extract YAML frontmatter (name, description, version, …) as a flat dict.
+
+    Nested keys are flattened, so `metadata:\\n  version: 0.1.0` yields
+    {"metadata": "", "version": "0.1.0"}.
+    """
+    m = re.match(r"^---\s*\n(.*?)\n---", text, re.DOTALL)
+    if not m:
+        raise ValueError(f"No YAML frontmatter in {source}")
+    result = {}
+    for line in m.group(1).strip().splitlines():
+        key, sep, val = line.partition(":")
+        if sep:
+            result[key.strip()] = val.strip()
+    return result
+
+
+def split_sections(markdown: str) -> list[SkillSection]:
+    """Split markdown at '## ' headings into addressable sections.
+
+    Text before the first '## ' (typically the '# Title' and an intro)
+    becomes an "overview" section titled after the '# ' heading. Each
+    section's content starts with its own heading line; deeper headings stay
+    inside their section, and headings inside ``` fences are ignored. Ids are
+    slugs of the titles, suffixed -2, -3, … when a title repeats.
+    """
+    chunks: list[tuple[str, list[str]]] = [("", [])]
+    in_fence = False
+    for line in markdown.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        if not in_fence and line.startswith("## "):
+            chunks.append((line[3:].strip(), [line]))
+        else:
+            chunks[-1][1].append(line)
+
+    sections = []
+    seen: dict[str, int] = {}
+    for i, (title, lines) in enumerate(chunks):
+        content = "\n".join(lines).strip()
+        if not content:
+            continue
+        if i == 0:
+            h1 = next((ln[2:].strip() for ln in lines if ln.startswith("# ")), "")
+            title, slug = h1 or "Overview", "overview"
+        else:
+            slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-") or "section"
+        seen[slug] = seen.get(slug, 0) + 1
+        if seen[slug] > 1:
+            slug = f"{slug}-{seen[slug]}"
+        sections.append(SkillSection(id=slug, title=title, content=content))
+    return sections
+
+
+def parse_meta_sections_text(text: str, source: Path | str = "SKILL.md") -> dict[str, str]:
+    """Split a SKILL.md into sections for meta skill template rendering.
+
+    Returns dict with keys: frontmatter, intro, assist_directly, extra_sections.
+    The SKILL.md is split at '## Assist Directly'; everything before is intro,
+    everything after is assist_directly + any trailing sections (boundaries etc.).
+    """
+    m = re.match(r"(---\s*\n.*?\n---)\s*\n(.*)", text, re.DOTALL)
+    if not m:
+        raise ValueError(f"Cannot parse meta skill: {source}")
+    frontmatter = m.group(1)
+    body = m.group(2)
+
+    parts = re.split(r"^## Assist Directly\s*$", body, maxsplit=1, flags=re.MULTILINE)
+    intro = parts[0].strip()
+
+    if len(parts) > 1:
+        after = parts[1].strip()
+        sub = re.split(r"(?=^## )", after, maxsplit=1, flags=re.MULTILINE)
+        assist_directly = sub[0].strip()
+        extra_sections = sub[1].strip() if len(sub) > 1 else ""
+    else:
+        assist_directly = ""
+        extra_sections = ""
+
+    return {
+        "frontmatter": frontmatter,
+        "intro": intro,
+        "assist_directly": assist_directly,
+        "extra_sections": extra_sections,
+    }
+
+
+def _stamp(skill_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    entries = []
+    for file in sorted(skill_dir.rglob("*")):
+        if not file.is_file():
+            continue
+        st = file.stat()
+        entries.append((file.relative_to(skill_dir).as_posix(), st.st_size, st.st_mtime_ns))
+    return tuple(entries)
+
+
+def _read_skill(skill_dir: Path, stamp: tuple[tuple[str, int, int], ...]) -> SkillRecord:
+    files = {rel: (skill_dir / rel).read_bytes() for rel, _, _ in stamp}
+    skill_md = skill_dir / "SKILL.md"
+    if "SKILL.md" not in files:
+        raise FileNotFoundError(skill_md)
+    text = files["SKILL.md"].decode("utf-8")
+
+    m = re.match(r"^---\s*\n(.*?)\n---\s*\n?(.*)", text, re.DOTALL)
+    if not m:
+        raise ValueError(f"No YAML frontmatter in {skill_md}")
+
+    references = tuple(
+        SkillReference(name=Path(rel).stem, filename=Path(rel).name)
+        for rel in sorted(files)
+        if rel.startswith("references/") and rel.count("/") == 1 and rel.endswith(".md")
+    )
+
+    h = hashlib.sha256()
+    for rel, data in files.items():
+        h.update(f"{rel}\0".encode())
+        h.update(data)
+        h.update(b"\0")
+
+    return SkillRecord(
+        dir=skill_dir,
+        stamp=stamp,
+        files=files,
+        text=text,
+        frontmatter=parse_frontmatter_text(text, skill_md),
+        body=m.group(2).strip(),
+        references=references,
+        digest=h.hexdigest(),
+    )
+
+
+_cache: dict[Path, SkillRecord] = {}
+
+
+def load_skill(skill_dir: Path) -> SkillRecord:
+    """Return the SkillRecord for a skill directory, reading it only if changed."""
+    stamp = _stamp(skill_dir)
+    cached = _cache.get(skill_dir)
+    if cached is not None and cached.stamp == stamp:
+        return cached
+    record = _read_skill(skill_dir, stamp)
+    _cache[skill_dir] = record
+    return record
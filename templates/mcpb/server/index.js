@@ -2,7 +2,7 @@
 // Zero-dependency MCP server — NDJSON over stdio (matches SDK wire format).
 'use strict';
 
-const { readFileSync } = require('fs');
+const { existsSync, readFileSync } = require('fs');
 const { join } = require('path');
 const { createInterface } = require('readline');
 
@@ -14,8 +14,169 @@ function send(msg) {
   process.stdout.write(JSON.stringify(msg) + '\n');
 }
 
+// Offline snapshot of actions/ packed by build_mcpb.py: { hash, files: { path: json } }.
+// Answers come from it without waiting on the network; actions/version.json
+// is checked in the background to learn when the deployed site has moved on,
+// and stale entries are refreshed behind the response that used them.
+const snapshotPath = join(__dirname, 'snapshot.json');
+const snapshot = existsSync(snapshotPath)
+  ? JSON.parse(readFileSync(snapshotPath, 'utf-8'))
+  : { hash: null, files: {} };
+const cacheConfig = config.cache || {};
+const TTL_MS = (cacheConfig.ttl_seconds ?? 300) * 1000;
+const VERSION_CHECK_INTERVAL_MS = (cacheConfig.version_check_seconds ?? 600) * 1000;
+const MAX_BATCH = cacheConfig.max_batch ?? 20;
+let liveHash = null;
+let lastVersionCheck = 0;
+
+// Least-recently-used cache of live responses: path -> { data, etag, fetchedAt }.
+class LruCache {
+  constructor(maxEntries) {
+    this.maxEntries = maxEntries;
+    this.entries = new Map();
+  }
+
+  get(path) {
+    const entry = this.entries.get(path);
+    if (entry) {
+      this.entries.delete(path);
+      this.entries.set(path, entry);
+    }
+    return entry;
+  }
+
+  set(path, entry) {
+    this.entries.delete(path);
+    this.entries.set(path, entry);
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+  }
+
+  expireAll() {
+    for (const entry of this.entries.values()) entry.fetchedAt = 0;
+  }
+}
+
+const cache = new LruCache(cacheConfig.max_entries ?? 200);
+const inflight = new Map();  // path -> promise, so concurrent requests share one fetch
+
+async function fetchLive(path, etag) {
+  const url = `${config.base_url}actions/${path}`;
+  let res;
+  try {
+    res = await fetch(url, etag ? { headers: { 'If-None-Match': etag } } : undefined);
+  } catch (err) {
+    throw new Error(`fetching ${url}: ${err.message}`);
+  }
+  if (res.status === 304) return { notModified: true };
+  if (!res.ok) throw new Error(`${res.status} ${res.statusText} for ${url}`);
+  return { data: await res.json(), etag: res.headers.get('etag') };
+}
+
+// Fetch or revalidate one path through the cache. A cached copy is returned
+// when the network fails, so an expired entry still works offline.
+function load(path) {
+  if (inflight.has(path)) return inflight.get(path);
+  const cached = cache.get(path);
+  const promise = fetchLive(path, cached?.etag)
+    .then((res) => {
+      const entry = res.notModified
+        ? { ...cached, fetchedAt: Date.now() }
+        : { data: res.data, etag: res.etag, fetchedAt: Date.now() };
+      cache.set(path, entry);
+      return entry.data;
+    })
+    .catch((err) => {
+      if (cached) return cached.data;
+      throw err;
+    })
+    .finally(() => inflight.delete(path));
+  inflight.set(path, promise);
+  return promise;
+}
+
+function checkVersion() {
+  if (Date.now() - lastVersionCheck < VERSION_CHECK_INTERVAL_MS) return;
+  lastVersionCheck = Date.now();
+  fetchLive('version.json').then((res) => {
+    if (res.data.hash !== liveHash) cache.expireAll();
+    liveHash = res.data.hash;
+  }).catch(() => {});  // offline: keep serving what we have
+}
+
+async function getActionsJson(path) {
+  checkVersion();
+  const cached = cache.get(path);
+  if (cached && Date.now() - cached.fetchedAt < TTL_MS) return cached.data;
+  if (Object.hasOwn(snapshot.files, path)) {
+    if (liveHash === null || liveHash === snapshot.hash) return snapshot.files[path];
+    load(path).catch(() => {});
+    return cached ? cached.data : snapshot.files[path];
+  }
+  return load(path);
+}
+
+function normalizePath(path) {
+  return typeof path === 'string' ? path.replace(/^\/?(actions\/)?/, '') : '';
+}
+
+// Port of scripts/build_search.py: tokenize() must match the build exactly.
+const STOP_WORDS = new Set((
+  'a an and are as at be but by can do does for from has have how i if in into is it its ' +
+  'me my no not of on or our so that the their them then there these they this to was we ' +
+  'what when which who will with you your').split(' '));
+
+function tokenize(text) {
+  const tokens = [];
+  for (let word of text.toLowerCase().match(/[a-z0-9]+/g) || []) {
+    if (word.length < 2 || STOP_WORDS.has(word)) continue;
+    if (word.length > 3 && word.endsWith('s') && !word.endsWith('ss')) word = word.slice(0, -1);
+    tokens.push(word);
+  }
+  return tokens;
+}
+
+function search(index, query, limit) {
+  const scores = new Map();
+  for (const term of new Set(tokenize(query))) {
+    // Own keys only: a query word like 'constructor' must not hit Object.prototype.
+    const flat = Object.hasOwn(index.terms, term) ? index.terms[term] : [];
+    for (let j = 0; j < flat.length; j += 2) {
+      scores.set(flat[j], (scores.get(flat[j]) || 0) + flat[j + 1]);
+    }
+  }
+  return [...scores.entries()]
+    .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+    .slice(0, limit)
+    .map(([doc, score]) => ({ ...index.docs[doc], score: Math.round(score * 1000) / 1000 }));
+}
+
+async function handleSearchSkills(id, params) {
+  const query = params?.arguments?.query;
+  const limit = params?.arguments?.limit || 5;
+  if (!query) {
+    send({ jsonrpc: '2.0', id, result: {
+      content: [{ type: 'text', text: 'Error: query argument is required' }],
+      isError: true,
+    }});
+    return;
+  }
+  try {
+    const results = search(await getActionsJson('search-index.json'), query, limit);
+    send({ jsonrpc: '2.0', id, result: {
+      content: [{ type: 'text', text: JSON.stringify({ query, results }, null, 2) }],
+    }});
+  } catch (err) {
+    send({ jsonrpc: '2.0', id, result: {
+      content: [{ type: 'text', text: `Error searching skills: ${err.message}` }],
+      isError: true,
+    }});
+  }
+}
+
 async function handleGetJson(id, params) {
-  const path = params?.arguments?.path;
+  const path = normalizePath(params?.arguments?.path);
   if (!path) {
     send({ jsonrpc: '2.0', id, result: {
       content: [{ type: 'text', text: 'Error: path argument is required' }],
@@ -23,28 +184,49 @@ async function handleGetJson(id, params) {
     }});
     return;
   }
-  const url = `${config.base_url}actions/${path}`;
   try {
-    const res = await fetch(url);
-    if (!res.ok) {
-      send({ jsonrpc: '2.0', id, result: {
-        content: [{ type: 'text', text: `Error: ${res.status} ${res.statusText} for ${url}` }],
-        isError: true,
-      }});
-      return;
-    }
-    const data = await res.json();
+    const data = await getActionsJson(path);
     send({ jsonrpc: '2.0', id, result: {
       content: [{ type: 'text', text: JSON.stringify(data, null, 2) }],
     }});
   } catch (err) {
     send({ jsonrpc: '2.0', id, result: {
-      content: [{ type: 'text', text: `Error fetching ${url}: ${err.message}` }],
+      content: [{ type: 'text', text: `Error: ${err.message}` }],
       isError: true,
     }});
   }
 }
 
+async function handleGetJsonBatch(id, params) {
+  const paths = params?.arguments?.paths;
+  if (!Array.isArray(paths) || paths.length === 0) {
+    send({ jsonrpc: '2.0', id, result: {
+      content: [{ type: 'text', text: 'Error: paths must be a non-empty array' }],
+      isError: true,
+    }});
+    return;
+  }
+  if (paths.length > MAX_BATCH) {
+    send({ jsonrpc: '2.0', id, result: {
+      content: [{ type: 'text', text: `Error: at most ${MAX_BATCH} paths per call` }],
+      isError: true,
+    }});
+    return;
+  }
+  const results = await Promise.all(paths.map(async (raw) => {
+    const path = normalizePath(raw);
+    try {
+      return { path, data: await getActionsJson(path) };
+    } catch (err) {
+      return { path, error: err.message };
+    }
+  }));
+  send({ jsonrpc: '2.0', id, result: {
+    content: [{ type: 'text', text: JSON.stringify({ results }, null, 2) }],
+    isError: results.every((r) => r.error),
+  }});
+}
+
 function handleMessage(msg) {
   if (!('id' in msg)) return;
 
@@ -76,12 +258,50 @@ function handleMessage(msg) {
           },
           required: ['path'],
         },
+      }, {
+        name: 'getJsonBatch',
+        description: (
+          'Fetch several JSON documents from the Legal Ed Skills Hub in one call, e.g. a skill ' +
+          'and its references. Takes the same paths as getJson and returns ' +
+          '{ results: [{ path, data } or { path, error }] } in the order given.'
+        ),
+        inputSchema: {
+          type: 'object',
+          properties: {
+            paths: {
+              type: 'array',
+              items: { type: 'string' },
+              description: "Paths relative to the actions root, e.g. ['skills/student/socratic-tutor.json']",
+            },
+          },
+          required: ['paths'],
+        },
+      }, {
+        name: 'searchSkills',
+        description: (
+          'Rank skills across all personas for a description of the user\'s task. ' +
+          'Returns persona, skill, description, and the getJson path of the best matches. ' +
+          'Use it to find a candidate skill in one call; confirm the match against the ' +
+          'persona before following the skill.'
+        ),
+        inputSchema: {
+          type: 'object',
+          properties: {
+            query: { type: 'string', description: "The user's task in a few words" },
+            limit: { type: 'integer', description: 'Maximum results (default 5)' },
+          },
+          required: ['query'],
+        },
       }]}});
       break;
 
     case 'tools/call':
       if (msg.params?.name === 'getJson') {
         handleGetJson(msg.id, msg.params);
+      } else if (msg.params?.name === 'getJsonBatch') {
+        handleGetJsonBatch(msg.id, msg.params);
+      } else if (msg.params?.name === 'searchSkills') {
+        handleSearchSkills(msg.id, msg.params);
       } else {
         send({ jsonrpc: '2.0', id: msg.id, error: {
           code: -32601, message: `Unknown tool: ${msg.params?.name}`,
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import logging
 import os
-import re
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
@@ -17,19 +17,37 @@ import yaml
 from dotenv import load_dotenv
 from openai import OpenAI
 
+from harness.completion_cache import MODES, CompletionCache, cached_client
+from harness.rate_limit import RateLimiter, rate_limited_client
 from harness.runner import ModelConfig, load_skill_as_system_prompt
-from harness.trace_writer import rebuild_index
+from harness.trace_writer import rebuild_index, usage_since
+from skill_record import load_skill
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SKILLS_DIR = PROJECT_ROOT / "skills"
 TESTS_DIR = Path(__file__).resolve().parent
 
+SESSION_START = pytest.StashKey[str]()
+RATE_LIMIT_STATE = TESTS_DIR / ".rate-limit.json"
+
 
 def pytest_addoption(parser):
     parser.addoption(
         "--rerun", action="store_true", default=False,
         help="Re-run scenarios even if a trace already exists in the index.",
     )
+    parser.addoption(
+        "--concurrency", type=int, default=0, metavar="N",
+        help="Run every selected scenario and judge call from one asyncio event loop "
+             "with at most N API calls in flight (0, the default, runs each test "
+             "synchronously). Not combinable with -n.",
+    )
+    parser.addoption(
+        "--completion-cache", choices=MODES, default=None,
+        help="Chat completion cache: 'record' reuses and stores responses, 'replay' "
+             "answers only from the cache (offline; misses fail), 'off' calls the API "
+             "every time. Defaults to completion_cache.mode in test_config.yaml.",
+    )
 
 
 def pytest_configure(config):
@@ -42,9 +60,20 @@ def pytest_configure(config):
     logging.getLogger("openai").setLevel(logging.WARNING)
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
+    config.stash[SESSION_START] = datetime.now(timezone.utc).isoformat()
+    if not hasattr(config, "workerinput"):
+        limiter = make_rate_limiter(load_test_config())
+        if limiter is not None:
+            limiter.reset()
+
+    if config.getoption("--concurrency") and getattr(config.option, "numprocesses", None):
+        raise pytest.UsageError(
+            "--concurrency schedules every test from one event loop; drop -n/--numprocesses"
+        )
+
 
 def pytest_sessionfinish(session, exitstatus):
-    """Rebuild the trace index after all tests complete.
+    """Rebuild the trace index after all tests complete; report rate limiting and cache use.
 
     With pytest-xdist, only the controller node rebuilds the index (workers
     have a 'workerinput' attribute on their config).
@@ -52,13 +81,18 @@ def pytest_sessionfinish(session, exitstatus):
     if hasattr(session.config, "workerinput"):
         return
     rebuild_index()
-
-
-def _extract_version(skill_path: Path) -> str:
-    """Pull the version from SKILL.md YAML frontmatter."""
-    text = skill_path.read_text(encoding="utf-8")
-    m = re.search(r"version:\s*(.+)", text)
-    return m.group(1).strip() if m else "0.0.0"
+    limiter = make_rate_limiter(load_test_config())
+    if limiter is not None and RATE_LIMIT_STATE.exists():
+        logging.getLogger("harness").info(limiter.summary())
+    usage = usage_since(session.config.stash[SESSION_START])
+    if usage["traces"]:
+        share = usage["cached_tokens"] / usage["prompt_tokens"] if usage["prompt_tokens"] else 0.0
+        logging.getLogger("harness").info(
+            "Prompt cache: %d of %d prompt tokens cached (%.0f%%) across %d conversations "
+            "and %d judged traces",
+            usage["cached_tokens"], usage["prompt_tokens"], share * 100,
+            usage["conversations"], usage["traces"],
+        )
 
 
 def discover_rubrics() -> list[dict]:
@@ -72,7 +106,7 @@ def discover_rubrics() -> list[dict]:
             rubric = yaml.safe_load(f)
         rubric["_rubric_path"] = rubric_path
         rubric["_skill_path"] = skill_md
-        rubric["_version"] = _extract_version(skill_md)
+        rubric["_version"] = load_skill(rubric_path.parent).version
         rubrics.append(rubric)
     return rubrics
 
@@ -83,24 +117,76 @@ def load_test_config() -> dict:
         return yaml.safe_load(f)
 
 
+def make_rate_limiter(test_config: dict) -> RateLimiter | None:
+    """The session's shared limiter from the rate_limit block, or None when it is off."""
+    limits = test_config.get("rate_limit") or {}
+    rpm = limits.get("requests_per_minute", 0)
+    tpm = limits.get("tokens_per_minute", 0)
+    if not rpm or not tpm:
+        return None
+    return RateLimiter(
+        RATE_LIMIT_STATE,
+        requests_per_minute=rpm,
+        tokens_per_minute=tpm,
+        max_retries=limits.get("max_retries", 6),
+    )
+
+
 @pytest.fixture(scope="session")
 def test_config() -> dict:
     return load_test_config()
 
 
 @pytest.fixture(scope="session")
-def openai_client(test_config) -> OpenAI:
+def completion_cache(request, test_config):
+    """The on-disk completion cache, or None when it is off."""
+    cache_config = test_config.get("completion_cache", {})
+    mode = request.config.getoption("--completion-cache") or cache_config.get("mode", "off")
+    if mode == "off":
+        yield None
+        return
+    cache = CompletionCache(
+        PROJECT_ROOT / cache_config.get("dir", "tests/.completion-cache"),
+        mode,
+        max_bytes=int(cache_config.get("max_mb", 512)) * 1024 * 1024,
+    )
+    yield cache
+    logging.getLogger("harness.cache").info(cache.summary())
+    cache.evict()
+
+
+@pytest.fixture(scope="session")
+def rate_limiter(test_config) -> RateLimiter | None:
+    return make_rate_limiter(test_config)
+
+
+@pytest.fixture(scope="session")
+def openai_client_kwargs(test_config, completion_cache, rate_limiter) -> dict:
+    """Constructor arguments shared by the sync and async OpenAI clients.
+
+    Replay mode never reaches the API, so it runs without a key. With a
+    rate limiter, retries are its job rather than the client's.
+    """
     load_dotenv(PROJECT_ROOT / ".env")
     api_config = test_config.get("api", {})
     api_key = os.environ.get(api_config.get("api_key_env", "OPENROUTER_API_KEY"), "")
+    if not api_key and completion_cache is not None and completion_cache.mode == "replay":
+        api_key = "replay-only"
     if not api_key:
         pytest.skip("No API key configured -- set OPENROUTER_API_KEY in .env")
-    return OpenAI(
-        api_key=api_key,
-        base_url=api_config.get("base_url", "https://openrouter.ai/api/v1"),
-        timeout=60.0,
-        max_retries=1,
-    )
+    return {
+        "api_key": api_key,
+        "base_url": api_config.get("base_url", "https://openrouter.ai/api/v1"),
+        "timeout": 60.0,
+        "max_retries": 0 if rate_limiter is not None else 1,
+    }
+
+
+@pytest.fixture(scope="session")
+def openai_client(openai_client_kwargs, completion_cache, rate_limiter) -> OpenAI:
+    # Cache hits are answered before the limiter is consulted.
+    client = rate_limited_client(OpenAI(**openai_client_kwargs), rate_limiter)
+    return cached_client(client, completion_cache)
 
 
 @pytest.fixture(scope="session")
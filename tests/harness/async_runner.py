@@ -0,0 +1,94 @@
+"""Run many scenario jobs from one event loop under a shared concurrency limit.
+
+Each job is one scenario played against one model and then judged by every
+judge model. run_jobs() starts all of them at once; a single semaphore,
+held around every chat completion call (conversation turns and judge
+calls alike), caps how many requests are in flight in total. A run is then
+bound by provider throughput rather than by the number of worker
+processes, and a slow scenario never holds a worker idle.
+
+Traces and reports are built by the same code as the synchronous path
+(run_scenario_async() / evaluate_trace_async()), so saved traces are
+identical.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+
+from openai import AsyncOpenAI
+
+from .evaluator import EvaluationReport, evaluate_trace_async
+from .runner import ConversationTrace, ModelConfig, run_scenario_async
+
+log = logging.getLogger("harness.async_runner")
+
+
+@dataclass
+class ScenarioJob:
+    key: str
+    model: ModelConfig
+    rubric: dict
+    scenario: dict
+    system_prompt: str
+    skill_name: str
+    persona: str
+    version: str
+
+
+@dataclass
+class JobResult:
+    trace: ConversationTrace | None = None
+    reports: list[EvaluationReport] = field(default_factory=list)
+    error: BaseException | None = None
+
+
+async def run_job(
+    client: AsyncOpenAI,
+    job: ScenarioJob,
+    judges: list[ModelConfig],
+    limiter: asyncio.Semaphore,
+) -> JobResult:
+    """Play out one scenario, then judge it with every judge concurrently."""
+    trace = await run_scenario_async(
+        client=client,
+        model_config=job.model,
+        system_prompt=job.system_prompt,
+        scenario=job.scenario,
+        skill_name=job.skill_name,
+        limiter=limiter,
+    )
+    if not trace.agent_turns():
+        return JobResult(trace=trace)
+    reports = await asyncio.gather(*(
+        evaluate_trace_async(client, judge, job.rubric, trace, limiter)
+        for judge in judges
+    ))
+    return JobResult(trace=trace, reports=list(reports))
+
+
+async def run_jobs(
+    client: AsyncOpenAI,
+    jobs: list[ScenarioJob],
+    judges: list[ModelConfig],
+    concurrency: int,
+) -> dict[str, JobResult]:
+    """Run every job with at most concurrency API calls in flight.
+
+    Returns results by job key. A job that raises gets a JobResult with
+    the exception in error; the other jobs carry on.
+    """
+    limiter = asyncio.Semaphore(concurrency)
+
+    async def guarded(job: ScenarioJob) -> JobResult:
+        try:
+            return await run_job(client, job, judges, limiter)
+        except Exception as exc:
+            log.warning("Job %s failed: %s", job.key, exc)
+            return JobResult(error=exc)
+
+    log.info("Scheduling %d jobs, %d API calls at a time", len(jobs), concurrency)
+    results = await asyncio.gather(*(guarded(job) for job in jobs))
+    return {job.key: result for job, result in zip(jobs, results)}
@@ -0,0 +1,214 @@
+"""Content-addressed on-disk cache of chat completions, for record and replay.
+
+Every rerun of the suite otherwise pays for real API calls, even when only
+the scoring formula or the trace format changed. With the cache, each
+request's model, messages, temperature and max_tokens, plus response_format
+and tools when set, are hashed (with any prompt-cache hints stripped), and
+the response is stored under that hash:
+
+    <cache dir>/<first 2 hex>/<sha256>.json
+
+Modes:
+
+- off: passthrough; the cache is neither read nor written.
+- record: answer from the cache when possible; otherwise call the API and
+  store the response.
+- replay: answer only from the cache; a miss raises CompletionCacheMiss and
+  nothing reaches the network, so runs are offline and deterministic.
+
+Entries are written to a temporary file and renamed into place, so several
+xdist workers can record into the same directory at once and a reader never
+sees a partial entry. A hit refreshes the entry's mtime; once the directory
+grows past max_bytes, the least recently used entries are deleted.
+
+Clients are wrapped rather than replaced: cached_client() returns an object
+with the same chat.completions.create() (sync or async) that run_scenario()
+and the evaluator already call. The async wrapper does its file reads and
+writes through asyncio.to_thread(), off the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from openai import AsyncOpenAI, OpenAI
+from openai.types.chat import ChatCompletion
+
+log = logging.getLogger("harness.cache")
+
+MODES = ("off", "record", "replay")
+
+# Request fields that identify a completion. Anything else the caller sends
+# (timeouts, provider hints) doesn't change the answer and isn't hashed.
+KEY_FIELDS = ("model", "messages", "temperature", "max_tokens")
+# Also identify it, but only when the request sets them, so keys recorded
+# for plain requests stay valid.
+OPTIONAL_KEY_FIELDS = ("response_format", "tools", "tool_choice")
+
+# Check the directory size after this many new entries.
+EVICT_EVERY = 100
+
+
+class CompletionCacheMiss(LookupError):
+    """Replay mode was asked for a completion that was never recorded."""
+
+
+def _plain_messages(messages: list[dict]) -> list[dict]:
+    """Messages with text-part content joined back into a string.
+
+    Prompt-cache breakpoints (see runner.cache_breakpoint()) split content
+    into parts without changing what the model reads, so they don't change
+    the key either.
+    """
+    plain = []
+    for m in messages:
+        content = m.get("content")
+        if isinstance(content, list) and all(p.get("type") == "text" for p in content):
+            m = {**m, "content": "".join(p["text"] for p in content)}
+        plain.append(m)
+    return plain
+
+
+def _key_fields(request: dict[str, Any]) -> dict[str, Any]:
+    """The request fields that identify its completion, messages normalized."""
+    fields = {k: request.get(k) for k in KEY_FIELDS}
+    fields.update((k, request[k]) for k in OPTIONAL_KEY_FIELDS if request.get(k) is not None)
+    fields["messages"] = _plain_messages(fields["messages"] or [])
+    return fields
+
+
+def cache_key(request: dict[str, Any]) -> str:
+    """SHA-256 of the canonical JSON of the request's key fields."""
+    payload = _key_fields(request)
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CompletionCache:
+    def __init__(self, root: Path, mode: str = "record", max_bytes: int = 512 * 1024 * 1024):
+        if mode not in MODES:
+            raise ValueError(f"Unknown completion cache mode {mode!r}; expected one of {MODES}")
+        self.root = root
+        self.mode = mode
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, request: dict[str, Any]) -> ChatCompletion | None:
+        """The cached response, or None. Raises CompletionCacheMiss in replay mode."""
+        if self.mode == "off":
+            return None
+        key = cache_key(request)
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, json.JSONDecodeError):
+            data = None
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if data is not None:
+            return ChatCompletion.model_validate(data["response"])
+        if self.mode == "replay":
+            raise CompletionCacheMiss(
+                f"No recorded completion for {request.get('model')} (key {key[:12]}); "
+                f"record it first with --completion-cache record"
+            )
+        return None
+
+    def put(self, request: dict[str, Any], response: ChatCompletion):
+        if self.mode != "record":
+            return
+        key = cache_key(request)
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"request": _key_fields(request), "response": response.model_dump(mode="json")}
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._writes_since_evict += 1
+            due = self._writes_since_evict >= EVICT_EVERY
+            if due:
+                self._writes_since_evict = 0
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits max_bytes.
+
+        Returns the number of entries removed. Safe to run from several
+        processes at once: entries already gone are skipped.
+        """
+        entries = []
+        total = 0
+        for path in self.root.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+            total += st.st_size
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        if removed:
+            log.info("Completion cache: evicted %d entries", removed)
+        return removed
+
+    def summary(self) -> str:
+        return f"Completion cache ({self.mode}): {self.hits} hits, {self.misses} misses"
+
+
+def cached_client(client: OpenAI | AsyncOpenAI, cache: CompletionCache | None):
+    """Wrap client so chat.completions.create() goes through cache.
+
+    Returns client itself when cache is None or off.
+    """
+    if cache is None or cache.mode == "off":
+        return client
+
+    if isinstance(client, AsyncOpenAI):
+        async def create(**request):
+            cached = await asyncio.to_thread(cache.get, request)
+            if cached is not None:
+                return cached
+            response = await client.chat.completions.create(**request)
+            await asyncio.to_thread(cache.put, request, response)
+            return response
+    else:
+        def create(**request):
+            cached = cache.get(request)
+            if cached is not None:
+                return cached
+            response = client.chat.completions.create(**request)
+            cache.put(request, response)
+            return response
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
@@ -5,22 +5,38 @@ prompt asking for a binary pass/fail. Pedagogical criteria use the same approach
 but ask for a three-level rating (strong/adequate/weak). Anti-patterns are checked
 as binary violations.
 
-Each criterion is evaluated independently in its own LLM call. This keeps each
-judgment narrow and debuggable.
+By default each criterion is evaluated independently in its own LLM call. This
+keeps each judgment narrow and debuggable. A judge's judge_batch setting can
+trade that for fewer calls: "category" grades all criteria of a category in
+one structured-output call, and "rubric" grades the whole rubric in one call.
+Both return the same CriterionEval lists. scripts/bench_judging.py measures
+how often batched judgments agree with per-criterion ones. evaluate_trace()
+runs the calls on a thread pool; evaluate_trace_async() runs them on the
+caller's event loop.
+
+Every judge prompt starts with the same text, JUDGE_PREFIX with the
+transcript, and only the criterion-specific question follows it, so the
+provider can serve the transcript from its prompt cache for all but the first
+call. For judges with prompt_cache set, the prefix also carries an explicit
+cache_control breakpoint.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
 import logging
 import re
+import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import NamedTuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
-from .runner import ConversationTrace, ModelConfig
+from .runner import ConversationTrace, ModelConfig, Usage, cache_breakpoint
 
 MAX_EVAL_WORKERS = 10
 
@@ -60,6 +76,7 @@ class EvaluationReport:
     structural: list[CriterionEval] = field(default_factory=list)
     pedagogical: list[CriterionEval] = field(default_factory=list)
     anti_patterns: list[CriterionEval] = field(default_factory=list)
+    usage: Usage = field(default_factory=Usage)
 
     def structural_pass_count(self) -> int:
         return sum(1 for c in self.structural if c.result == StructuralResult.PASS.value)
@@ -144,48 +161,69 @@ class EvaluationReport:
         return "\n".join(lines)
 
 
-STRUCTURAL_PROMPT = """\
+JUDGE_PREFIX = """\
 You are evaluating a conversation between an AI agent and a user. The agent has a pedagogical skill installed.
 
+Conversation transcript:
+{transcript}
+
+"""
+
+STRUCTURAL_PROMPT = """\
 Evaluate this specific criterion:
 ID: {criterion_id}
 Description: {description}
 How to check: {check}
 
-Conversation transcript:
-{transcript}
-
 Does the agent's behavior satisfy this criterion? Respond with exactly this JSON format:
 {{"result": "pass" or "fail", "justification": "<one sentence explaining your judgment>"}}"""
 
 PEDAGOGICAL_PROMPT = """\
-You are evaluating a conversation between an AI agent and a user. The agent has a pedagogical skill installed.
-
 Evaluate this specific quality dimension:
 ID: {criterion_id}
 Description: {description}
 
-Conversation transcript:
-{transcript}
-
 Rate the agent on this dimension. Respond with exactly this JSON format:
 {{"result": "strong" or "adequate" or "weak", "justification": "<one sentence explaining your judgment>"}}"""
 
 ANTI_PATTERN_PROMPT = """\
-You are evaluating a conversation between an AI agent and a user. The agent has a pedagogical skill installed.
-
 Check for this anti-pattern:
 ID: {criterion_id}
 Description: {description}
 How to detect: {check}
 
-Conversation transcript:
-{transcript}
-
 Did the agent violate this anti-pattern? Respond with exactly this JSON format:
 {{"result": "clear" or "violation", "justification": "<one sentence explaining your judgment>"}}"""
 
 
+# judge_batch modes: one call per criterion, per category, or for the whole rubric.
+BATCH_MODES = ("criterion", "category", "rubric")
+
+# Category -> (kind label, question, allowed results, label for the "check" field)
+BATCH_KINDS = {
+    "structural": (
+        "Structural criterion", "Does the agent's behavior satisfy this criterion?",
+        ("pass", "fail"), "How to check",
+    ),
+    "pedagogical": (
+        "Quality dimension", "Rate the agent on this dimension.",
+        ("strong", "adequate", "weak"), None,
+    ),
+    "anti-pattern": (
+        "Anti-pattern", "Did the agent violate this anti-pattern?",
+        ("clear", "violation"), "How to detect",
+    ),
+}
+
+BATCH_PROMPT = """\
+Evaluate the agent against each of the following {count} items. Judge each one on its own, as if it were the only item; do not let one judgment influence another.
+
+{criteria}
+
+Respond with exactly this JSON format, with one entry for every ID above:
+{{"<ID>": {{"result": "<one of that item's allowed results>", "justification": "<one sentence explaining your judgment>"}}, ...}}"""
+
+
 def _parse_judge_response(text: str) -> dict:
     """Extract JSON from the judge's response, handling markdown fences."""
     text = text.strip()
@@ -194,58 +232,189 @@ def _parse_judge_response(text: str) -> dict:
     return json.loads(text)
 
 
-def _evaluate_criterion(
-    client: OpenAI,
-    judge: ModelConfig,
-    prompt_template: str,
-    criterion: dict,
-    transcript: str,
-    category: str = "",
-) -> CriterionEval:
-    """Evaluate a single criterion using the judge model."""
-    log.debug("  Judging %s [%s] with %s ...", criterion["id"], category, judge.model)
-    prompt = prompt_template.format(
-        criterion_id=criterion["id"],
-        description=criterion["description"],
-        check=criterion.get("check", criterion["description"]),
-        transcript=transcript,
+class _Item(NamedTuple):
+    """One criterion to judge, and where its result goes in the report."""
+
+    field_name: str
+    position: int
+    template: str
+    criterion: dict
+    category: str
+
+    @property
+    def key(self) -> str:
+        """The item's ID in batched prompts and schemas; IDs may repeat across categories."""
+        return f"{self.category}.{self.criterion['id']}"
+
+
+def _judge_request(judge: ModelConfig, question: str, transcript: str, max_tokens: int) -> dict:
+    """Keyword arguments for a judge call: the shared transcript prefix, then question."""
+    prefix = JUDGE_PREFIX.format(transcript=transcript)
+    if judge.prompt_cache:
+        content = [*cache_breakpoint(prefix), {"type": "text", "text": question}]
+    else:
+        content = prefix + question
+    return {
+        "model": judge.model,
+        "messages": [{"role": "user", "content": content}],
+        "temperature": judge.temperature,
+        "max_tokens": max_tokens,
+    }
+
+
+def _criterion_question(item: _Item) -> str:
+    log.debug("  Judging %s [%s] ...", item.criterion["id"], item.category)
+    return item.template.format(
+        criterion_id=item.criterion["id"],
+        description=item.criterion["description"],
+        check=item.criterion.get("check", item.criterion["description"]),
     )
 
-    response = client.chat.completions.create(
-        model=judge.model,
-        messages=[{"role": "user", "content": prompt}],
-        temperature=judge.temperature,
-        max_tokens=judge.max_tokens,
-    )
-
-    raw = response.choices[0].message.content or "{}"
-    try:
-        parsed = _parse_judge_response(raw)
-    except (json.JSONDecodeError, KeyError):
-        log.warning("  Judge response unparseable for %s: %s", criterion["id"], raw[:200])
-        parsed = {"result": "fail", "justification": f"Judge response unparseable: {raw[:200]}"}
 
+def _batch_question(batch: list[_Item]) -> str:
+    log.debug("  Judging %d criteria in one call ...", len(batch))
+    blocks = []
+    for item in batch:
+        kind, question, results, check_label = BATCH_KINDS[item.category]
+        lines = [
+            f"ID: {item.key}",
+            f"Kind: {kind}. {question}",
+            f"Allowed results: {' or '.join(json.dumps(r) for r in results)}",
+            f"Description: {item.criterion['description']}",
+        ]
+        if check_label:
+            lines.append(f"{check_label}: {item.criterion.get('check', item.criterion['description'])}")
+        blocks.append("\n".join(lines))
+    return BATCH_PROMPT.format(count=len(batch), criteria="\n\n".join(blocks))
+
+
+def _batch_schema(batch: list[_Item]) -> dict:
+    """Structured-output schema: one {result, justification} object per item key."""
+    properties = {
+        item.key: {
+            "type": "object",
+            "properties": {
+                "result": {"type": "string", "enum": list(BATCH_KINDS[item.category][2])},
+                "justification": {"type": "string"},
+            },
+            "required": ["result", "justification"],
+            "additionalProperties": False,
+        }
+        for item in batch
+    }
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "rubric_judgments",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": properties,
+                "required": list(properties),
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
+def _batch_request(judge: ModelConfig, batch: list[_Item], transcript: str) -> dict:
+    """The request for a batch: one criterion as in per-criterion mode, or several at once."""
+    if len(batch) == 1:
+        return _judge_request(judge, _criterion_question(batch[0]), transcript, judge.max_tokens)
+    request = _judge_request(judge, _batch_question(batch), transcript, judge.max_tokens * len(batch))
+    request["response_format"] = _batch_schema(batch)
+    return request
+
+
+def _criterion_eval(item: _Item, parsed: dict) -> CriterionEval:
+    """Turn one parsed judgment into a CriterionEval."""
     result = parsed.get("result", "fail")
     justification = parsed.get("justification", "No justification provided")
     tag = result.upper()
-    log.info("  [%s] %s %s — %s", tag, category, criterion["id"], justification)
+    log.info("  [%s] %s %s — %s", tag, item.category, item.criterion["id"], justification)
 
     return CriterionEval(
-        criterion_id=criterion["id"],
-        description=criterion["description"],
+        criterion_id=item.criterion["id"],
+        description=item.criterion["description"],
         result=result,
         justification=justification,
     )
 
 
-def evaluate_trace(
+def _batch_evals(batch: list[_Item], response) -> list[CriterionEval]:
+    """Parse the judge's response into one CriterionEval per item in batch."""
+    raw = response.choices[0].message.content or "{}"
+    try:
+        parsed = _parse_judge_response(raw)
+        if not isinstance(parsed, dict):
+            raise KeyError("expected a JSON object")
+        if len(batch) == 1 and not isinstance(parsed.get("result", "fail"), str):
+            raise KeyError("expected a string result")
+    except (json.JSONDecodeError, KeyError):
+        ids = ", ".join(item.criterion["id"] for item in batch)
+        log.warning("  Judge response unparseable for %s: %s", ids, raw[:200])
+        parsed = None
+
+    if len(batch) == 1:
+        judgments = [parsed]
+    else:
+        judgments = [
+            parsed.get(item.key) if parsed is not None else None
+            for item in batch
+        ]
+        # Any entry that isn't {"result": "<str>", ...} counts as missing.
+        judgments = [
+            j if isinstance(j, dict) and isinstance(j.get("result"), str)
+            else {"result": "fail", "justification": "Judge response omitted this criterion"}
+            for j in judgments
+        ]
+    return [
+        _criterion_eval(item, judgment if judgment is not None else {
+            "result": "fail", "justification": f"Judge response unparseable: {raw[:200]}",
+        })
+        for item, judgment in zip(batch, judgments)
+    ]
+
+
+def _evaluate_batch(
     client: OpenAI,
+    judge: ModelConfig,
+    batch: list[_Item],
+    transcript: str,
+) -> tuple[list[CriterionEval], Usage]:
+    """Evaluate a batch of criteria (usually just one) in a single judge call."""
+    request = _batch_request(judge, batch, transcript)
+    usage = Usage()
+    start = time.perf_counter()
+    response = client.chat.completions.create(**request)
+    usage.add(response, time.perf_counter() - start)
+    return _batch_evals(batch, response), usage
+
+
+async def _evaluate_batch_async(
+    client: AsyncOpenAI,
+    judge: ModelConfig,
+    batch: list[_Item],
+    transcript: str,
+    limiter: asyncio.Semaphore | None,
+) -> tuple[list[CriterionEval], Usage]:
+    request = _batch_request(judge, batch, transcript)
+    usage = Usage()
+    async with limiter or contextlib.nullcontext():
+        start = time.perf_counter()
+        response = await client.chat.completions.create(**request)
+        usage.add(response, time.perf_counter() - start)
+    return _batch_evals(batch, response), usage
+
+
+def _start_report(
     judge: ModelConfig,
     rubric: dict,
     trace: ConversationTrace,
-) -> EvaluationReport:
-    """Evaluate a conversation trace against a rubric using the judge model."""
-    transcript = trace.as_transcript()
+) -> tuple[EvaluationReport, list[list[_Item]]]:
+    """The empty report plus the batches of criteria to judge, per judge.judge_batch."""
+    if judge.judge_batch not in BATCH_MODES:
+        raise ValueError(f"Unknown judge_batch {judge.judge_batch!r}; expected one of {BATCH_MODES}")
     criteria = rubric.get("criteria", {})
     structural = criteria.get("structural", [])
     ped_criteria_meta = criteria.get("pedagogical", [])
@@ -253,8 +422,8 @@ def evaluate_trace(
 
     total_checks = len(structural) + len(ped_criteria_meta) + len(anti_patterns)
     log.info(
-        "Evaluating %s::%s with judge %s (%d criteria)",
-        trace.skill_name, trace.scenario_id, judge.model, total_checks,
+        "Evaluating %s::%s with judge %s (%d criteria, %s mode)",
+        trace.skill_name, trace.scenario_id, judge.model, total_checks, judge.judge_batch,
     )
 
     report = EvaluationReport(
@@ -264,33 +433,82 @@ def evaluate_trace(
         judge_model_id=judge.id,
         _ped_criteria_meta=ped_criteria_meta,
     )
+    groups = [
+        [_Item(field_name, i, template, c, category) for i, c in enumerate(group)]
+        for field_name, template, group, category in (
+            ("structural", STRUCTURAL_PROMPT, structural, "structural"),
+            ("pedagogical", PEDAGOGICAL_PROMPT, ped_criteria_meta, "pedagogical"),
+            ("anti_patterns", ANTI_PATTERN_PROMPT, anti_patterns, "anti-pattern"),
+        )
+    ]
+    if judge.judge_batch == "criterion":
+        batches = [[item] for group in groups for item in group]
+    elif judge.judge_batch == "category":
+        batches = [group for group in groups if group]
+    else:
+        batches = [[item for group in groups for item in group]]
+    for batch in batches:
+        keys = [item.key for item in batch]
+        if len(batch) > 1 and len(set(keys)) != len(keys):
+            dup = next(k for k in keys if keys.count(k) > 1)
+            raise ValueError(f"Duplicate criterion {dup!r} in rubric; batched judging needs unique IDs")
+    return report, [b for b in batches if b]
+
+
+def _fill_report(report: EvaluationReport, batches: list[list[_Item]], results):
+    """Put each batch's CriterionEvals into the report in rubric order and sum usage."""
+    by_field: dict[str, list[tuple[int, CriterionEval]]] = {
+        "structural": [], "pedagogical": [], "anti_patterns": [],
+    }
+    for batch, (evals, usage) in zip(batches, results):
+        for item, ev in zip(batch, evals):
+            by_field[item.field_name].append((item.position, ev))
+        report.usage.merge(usage)
+    for field_name, evals in by_field.items():
+        setattr(report, field_name, [ev for _, ev in sorted(evals, key=lambda pair: pair[0])])
+
+
+def evaluate_trace(
+    client: OpenAI,
+    judge: ModelConfig,
+    rubric: dict,
+    trace: ConversationTrace,
+) -> EvaluationReport:
+    """Evaluate a conversation trace against a rubric using the judge model."""
+    transcript = trace.as_transcript()
+    report, batches = _start_report(judge, rubric, trace)
 
     with ThreadPoolExecutor(max_workers=MAX_EVAL_WORKERS) as executor:
-        structural_futures = [
-            executor.submit(
-                _evaluate_criterion, client, judge, STRUCTURAL_PROMPT,
-                c, transcript, "structural",
-            )
-            for c in structural
-        ]
-        pedagogical_futures = [
-            executor.submit(
-                _evaluate_criterion, client, judge, PEDAGOGICAL_PROMPT,
-                c, transcript, "pedagogical",
-            )
-            for c in ped_criteria_meta
-        ]
-        anti_pattern_futures = [
-            executor.submit(
-                _evaluate_criterion, client, judge, ANTI_PATTERN_PROMPT,
-                c, transcript, "anti-pattern",
-            )
-            for c in anti_patterns
+        futures = [
+            executor.submit(_evaluate_batch, client, judge, batch, transcript)
+            for batch in batches
         ]
+        _fill_report(report, batches, [f.result() for f in futures])
+
+    log.info("  Score: %.0f/100 (%s)", report.score(), report.usage.describe())
+    return report
+
+
+async def evaluate_trace_async(
+    client: AsyncOpenAI,
+    judge: ModelConfig,
+    rubric: dict,
+    trace: ConversationTrace,
+    limiter: asyncio.Semaphore | None = None,
+) -> EvaluationReport:
+    """Async twin of evaluate_trace(); produces the same report.
+
+    Every judge call is made concurrently; limiter, when given, bounds the
+    calls in flight together with whatever else shares it.
+    """
+    transcript = trace.as_transcript()
+    report, batches = _start_report(judge, rubric, trace)
 
-        report.structural = [f.result() for f in structural_futures]
-        report.pedagogical = [f.result() for f in pedagogical_futures]
-        report.anti_patterns = [f.result() for f in anti_pattern_futures]
+    results = await asyncio.gather(*(
+        _evaluate_batch_async(client, judge, batch, transcript, limiter)
+        for batch in batches
+    ))
+    _fill_report(report, batches, results)
 
-    log.info("  Score: %.0f/100", report.score())
+    log.info("  Score: %.0f/100 (%s)", report.score(), report.usage.describe())
     return report
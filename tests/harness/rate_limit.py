@@ -0,0 +1,278 @@
+"""Token-bucket rate limiting with 429-aware backoff, shared across processes.
+
+Every chat completion, from the runner and the evaluator alike, first takes
+one request and an estimated number of tokens from two buckets that refill
+at the configured requests/min and tokens/min. The bucket state lives in a
+JSON file guarded by an exclusive flock, so all xdist workers of a session
+draw from the same budget. The controller resets the file when the session
+starts.
+
+When the provider still answers 429 or 5xx (or the connection fails), the
+call is retried after a jittered exponential backoff, honouring Retry-After
+when the response carries one, and the shared rate factor is halved: every
+worker then sends at half the rate, down to MIN_FACTOR. A burst of failures
+from one overload halves it once (DECREASE_COOLDOWN), and it recovers by
+RECOVERY_STEP for every RECOVERY_SECONDS without a throttled call.
+
+Counters for waits, throttled calls, retries and give-ups are kept in the
+same file; summary() reads them for the session output.
+
+Without fcntl (Windows) the file is still used, but only calls within one
+process are serialized.
+
+The async wrapper makes every limiter call (each one a blocking flock and a
+read/write of the file) through asyncio.to_thread(), so a worker waiting on
+the lock never stalls the other coroutines on the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import openai
+from openai import AsyncOpenAI, OpenAI
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+log = logging.getLogger("harness.rate_limit")
+
+# Buckets hold this many seconds' worth of the per-minute rates.
+BURST_SECONDS = 10
+MIN_FACTOR = 0.1
+RECOVERY_STEP = 0.1
+RECOVERY_SECONDS = 30
+DECREASE_COOLDOWN = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+RETRYABLE = (
+    openai.RateLimitError,
+    openai.InternalServerError,
+    openai.APIConnectionError,  # includes APITimeoutError
+)
+
+_STATS = ("waits", "wait_seconds", "rate_limited", "server_errors", "retries", "failures")
+
+
+def estimate_tokens(request: dict[str, Any]) -> int:
+    """Prompt tokens (about four characters each) plus the completion budget."""
+    chars = 0
+    for m in request.get("messages", []):
+        content = m.get("content") or ""
+        if isinstance(content, list):
+            chars += sum(len(p.get("text", "")) for p in content)
+        else:
+            chars += len(content)
+    return chars // 4 + (request.get("max_tokens") or 0)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        state_path: Path,
+        *,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        max_retries: int = 6,
+    ):
+        self.state_path = state_path
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self._thread_lock = threading.Lock()
+
+    def reset(self):
+        """Start a fresh session: full buckets, full rate, zeroed counters."""
+        self.state_path.unlink(missing_ok=True)
+
+    @contextlib.contextmanager
+    def _state(self):
+        """Read-modify-write the shared state under the thread and file locks."""
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._thread_lock:
+            fd = os.open(self.state_path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                with os.fdopen(os.dup(fd), "r+", encoding="utf-8") as f:
+                    raw = f.read()
+                    now = time.time()
+                    state = json.loads(raw) if raw else {
+                        "requests": self._capacity(self.requests_per_minute, 1.0),
+                        "tokens": self._capacity(self.tokens_per_minute, 1.0),
+                        "updated": now,
+                        "factor": 1.0,
+                        "last_throttle": 0.0,
+                        "min_factor": 1.0,
+                        **{k: 0 for k in _STATS},
+                    }
+                    self._refill(state, now)
+                    yield state
+                    f.seek(0)
+                    f.truncate()
+                    json.dump(state, f)
+            finally:
+                os.close(fd)  # releases the flock
+
+    @staticmethod
+    def _capacity(per_minute: float, factor: float) -> float:
+        return per_minute * factor / 60 * BURST_SECONDS
+
+    def _refill(self, state: dict, now: float):
+        elapsed = max(0.0, now - state["updated"])
+        factor = state["factor"]
+        for key, per_minute in (("requests", self.requests_per_minute), ("tokens", self.tokens_per_minute)):
+            cap = self._capacity(per_minute, factor)
+            state[key] = min(cap, state[key] + elapsed * per_minute * factor / 60)
+        state["updated"] = now
+
+    def try_acquire(self, tokens: int) -> float:
+        """Take one request and tokens if both buckets allow; else the seconds to wait."""
+        with self._state() as state:
+            factor = state["factor"]
+            tokens = min(tokens, self._capacity(self.tokens_per_minute, factor))
+            waits = []
+            for key, per_minute, need in (
+                ("requests", self.requests_per_minute, 1),
+                ("tokens", self.tokens_per_minute, tokens),
+            ):
+                if state[key] < need:
+                    waits.append((need - state[key]) / (per_minute * factor / 60))
+            if not waits:
+                state["requests"] -= 1
+                state["tokens"] -= tokens
+                return 0.0
+            return max(waits)
+
+    def record_wait(self, seconds: float):
+        """Count one call that had to wait seconds for capacity."""
+        with self._state() as state:
+            state["waits"] += 1
+            state["wait_seconds"] += seconds
+
+    def record_success(self, estimated: int, response):
+        """Charge the tokens actually used and let the rate recover."""
+        usage = getattr(response, "usage", None)
+        actual = (usage.prompt_tokens or 0) + (usage.completion_tokens or 0) if usage else estimated
+        with self._state() as state:
+            state["tokens"] -= actual - estimated
+            now = time.time()
+            if state["factor"] < 1.0 and now - state["last_throttle"] >= RECOVERY_SECONDS:
+                state["factor"] = min(1.0, state["factor"] + RECOVERY_STEP)
+                state["last_throttle"] = now
+
+    def record_failure(self, exc: Exception, attempt: int) -> float | None:
+        """Slow everyone down and return the backoff before retrying.
+
+        Returns None once max_retries is used up; the caller re-raises.
+        """
+        retry_after = None
+        response = getattr(exc, "response", None)
+        if response is not None:
+            with contextlib.suppress(TypeError, ValueError):
+                retry_after = float(response.headers.get("retry-after"))
+        with self._state() as state:
+            if isinstance(exc, openai.RateLimitError):
+                state["rate_limited"] += 1
+            else:
+                state["server_errors"] += 1
+            now = time.time()
+            if now - state["last_throttle"] >= DECREASE_COOLDOWN:
+                state["factor"] = max(MIN_FACTOR, state["factor"] / 2)
+                state["min_factor"] = min(state["min_factor"], state["factor"])
+            state["last_throttle"] = now
+            if attempt >= self.max_retries:
+                state["failures"] += 1
+                return None
+            state["retries"] += 1
+            factor = state["factor"]
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.0)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        log.warning(
+            "  %s; retry %d/%d in %.1fs at %.0f%% rate",
+            type(exc).__name__, attempt + 1, self.max_retries, delay, factor * 100,
+        )
+        return delay
+
+    def stats(self) -> dict[str, Any]:
+        with self._state() as state:
+            return {k: state[k] for k in (*_STATS, "factor", "min_factor")}
+
+    def summary(self) -> str:
+        s = self.stats()
+        return (
+            f"Rate limiter: {s['waits']} calls waited ({s['wait_seconds']:.1f}s in total), "
+            f"{s['rate_limited']} rate-limited and {s['server_errors']} failed calls, "
+            f"{s['retries']} retries, {s['failures']} gave up; "
+            f"lowest rate {s['min_factor'] * 100:.0f}%"
+        )
+
+
+def rate_limited_client(client: OpenAI | AsyncOpenAI, limiter: RateLimiter | None):
+    """Wrap client so chat.completions.create() waits for limiter and retries throttled calls.
+
+    Returns client itself when limiter is None.
+    """
+    if limiter is None:
+        return client
+
+    if isinstance(client, AsyncOpenAI):
+        async def create(**request):
+            tokens = estimate_tokens(request)
+            attempt = 0
+            while True:
+                waited = 0.0
+                while (wait := await asyncio.to_thread(limiter.try_acquire, tokens)) > 0:
+                    await asyncio.sleep(wait)
+                    waited += wait
+                if waited:
+                    await asyncio.to_thread(limiter.record_wait, waited)
+                try:
+                    response = await client.chat.completions.create(**request)
+                except RETRYABLE as exc:
+                    delay = await asyncio.to_thread(limiter.record_failure, exc, attempt)
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+                await asyncio.to_thread(limiter.record_success, tokens, response)
+                return response
+    else:
+        def create(**request):
+            tokens = estimate_tokens(request)
+            attempt = 0
+            while True:
+                waited = 0.0
+                while (wait := limiter.try_acquire(tokens)) > 0:
+                    time.sleep(wait)
+                    waited += wait
+                if waited:
+                    limiter.record_wait(waited)
+                try:
+                    response = client.chat.completions.create(**request)
+                except RETRYABLE as exc:
+                    delay = limiter.record_failure(exc, attempt)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+                limiter.record_success(tokens, response)
+                return response
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
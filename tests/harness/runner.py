@@ -3,16 +3,29 @@
 The runner sends the skill as a system prompt, then plays out the scripted user
 messages from the test scenario, capturing the full conversation trace. Between
 each user message the model responds, producing an interleaved transcript.
+
+Every turn resends the system prompt and the whole history, so the request is
+the previous one plus a suffix. Providers that cache prompt prefixes serve that
+part at a discount; for models with prompt_cache set, the system prompt and the
+newest user message also carry an explicit cache_control breakpoint, which
+OpenRouter passes on to providers (such as Anthropic) that require one. Token
+counts, including cached prompt tokens, are summed into the trace's Usage.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import time
+import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import yaml
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+from skill_record import load_skill
 
 log = logging.getLogger("harness.runner")
 
@@ -23,6 +36,9 @@ class ModelConfig:
     model: str
     temperature: float = 0.3
     max_tokens: int = 2048
+    prompt_cache: bool = False
+    # Judges only: "criterion" (one call per criterion), "category", or "rubric".
+    judge_batch: str = "criterion"
 
 
 @dataclass
@@ -31,12 +47,51 @@ class Message:
     content: str
 
 
+@dataclass
+class Usage:
+    """Tokens and wall time summed over chat completion calls."""
+
+    calls: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    completion_tokens: int = 0
+    seconds: float = 0.0
+
+    def add(self, response, seconds: float):
+        """Count one call; cached_tokens comes from usage.prompt_tokens_details."""
+        self.calls += 1
+        self.seconds += seconds
+        usage = response.usage
+        if usage is None:
+            return
+        self.prompt_tokens += usage.prompt_tokens or 0
+        self.completion_tokens += usage.completion_tokens or 0
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.cached_tokens += getattr(details, "cached_tokens", None) or 0
+
+    def describe(self) -> str:
+        return (
+            f"{self.calls} calls, {self.prompt_tokens} prompt tokens "
+            f"({self.cached_tokens} cached), {self.seconds:.1f}s"
+        )
+
+    def merge(self, other: Usage):
+        self.calls += other.calls
+        self.prompt_tokens += other.prompt_tokens
+        self.cached_tokens += other.cached_tokens
+        self.completion_tokens += other.completion_tokens
+        self.seconds += other.seconds
+
+
 @dataclass
 class ConversationTrace:
     skill_name: str
     scenario_id: str
     model_id: str
     messages: list[Message] = field(default_factory=list)
+    usage: Usage = field(default_factory=Usage)
+    # Shared by every trace file saved from this conversation (one per judge).
+    conversation_id: str = field(default_factory=lambda: uuid.uuid4().hex)
 
     def agent_turns(self) -> list[Message]:
         return [m for m in self.messages if m.role == "assistant"]
@@ -54,7 +109,7 @@ class ConversationTrace:
 
 def load_skill_as_system_prompt(skill_path: Path) -> str:
     """Read a SKILL.md and return it as a system prompt string."""
-    text = skill_path.read_text(encoding="utf-8")
+    text = load_skill(skill_path.parent).text
     return (
         "You are an AI agent with the following skill installed. "
         "Follow its instructions precisely.\n\n"
@@ -62,18 +117,13 @@ def load_skill_as_system_prompt(skill_path: Path) -> str:
     )
 
 
-def run_scenario(
-    client: OpenAI,
+def _start_conversation(
     model_config: ModelConfig,
     system_prompt: str,
     scenario: dict,
     skill_name: str,
-) -> ConversationTrace:
-    """Run a single test scenario and return the conversation trace.
-
-    The scenario dict should have 'id', 'setup', 'messages', and 'expected'
-    keys as defined in the rubric schema.
-    """
+) -> tuple[ConversationTrace, list[dict]]:
+    """Create the empty trace and the opening (system) messages for a scenario."""
     trace = ConversationTrace(
         skill_name=skill_name,
         scenario_id=scenario["id"],
@@ -81,10 +131,9 @@ def run_scenario(
     )
 
     setup_context = scenario.get("setup", "")
-    user_messages = scenario["messages"]
     log.info(
         "Running scenario %s (%d user turns) with model %s",
-        scenario["id"], len(user_messages), model_config.model,
+        scenario["id"], len(scenario["messages"]), model_config.model,
     )
 
     openai_messages: list[dict] = [{"role": "system", "content": system_prompt}]
@@ -95,33 +144,108 @@ def run_scenario(
             "role": "system",
             "content": f"Context about the user you are helping: {setup_context}",
         })
+    return trace, openai_messages
+
+
+def _add_user_turn(trace: ConversationTrace, openai_messages: list[dict], content: str, i: int, n: int):
+    log.info("  [Turn %d/%d] USER: %s", i, n, content[:120])
+    openai_messages.append({"role": "user", "content": content})
+    trace.messages.append(Message(role="user", content=content))
+
+
+def cache_breakpoint(text: str) -> list[dict]:
+    """Message content that marks text as the end of a cacheable prefix."""
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+def _completion_args(model_config: ModelConfig, openai_messages: list[dict]) -> dict:
+    log.debug("  Calling %s ...", model_config.model)
+    messages = openai_messages
+    if model_config.prompt_cache:
+        # Breakpoints after the skill system prompt (shared by every scenario
+        # for the skill) and after the newest user message (this turn's
+        # history, which the next turn extends).
+        messages = [
+            {**m, "content": cache_breakpoint(m["content"])}
+            if i in (0, len(messages) - 1) else m
+            for i, m in enumerate(messages)
+        ]
+    return {
+        "model": model_config.model,
+        "messages": messages,
+        "temperature": model_config.temperature,
+        "max_tokens": model_config.max_tokens,
+    }
+
+
+def _add_agent_turn(trace: ConversationTrace, openai_messages: list[dict], response, i: int, n: int):
+    assistant_content = response.choices[0].message.content or ""
+    usage = response.usage
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None)
+    tokens_info = (
+        f" ({usage.prompt_tokens}+{usage.completion_tokens} tokens"
+        f"{f', {cached} cached' if cached else ''})"
+        if usage else ""
+    )
+    preview = assistant_content.replace("\n", " ")[:150]
+    log.info("  [Turn %d/%d] AGENT:%s %s", i, n, tokens_info, preview)
+    openai_messages.append({"role": "assistant", "content": assistant_content})
+    trace.messages.append(Message(role="assistant", content=assistant_content))
+
+
+def run_scenario(
+    client: OpenAI,
+    model_config: ModelConfig,
+    system_prompt: str,
+    scenario: dict,
+    skill_name: str,
+) -> ConversationTrace:
+    """Run a single test scenario and return the conversation trace.
+
+    The scenario dict should have 'id', 'setup', 'messages', and 'expected'
+    keys as defined in the rubric schema.
+    """
+    trace, openai_messages = _start_conversation(model_config, system_prompt, scenario, skill_name)
+    user_messages = scenario["messages"]
 
     for i, user_msg in enumerate(user_messages, 1):
-        content = user_msg["content"]
-        log.info("  [Turn %d/%d] USER: %s", i, len(user_messages), content[:120])
-        openai_messages.append({"role": "user", "content": content})
-        trace.messages.append(Message(role="user", content=content))
-
-        log.debug("  Calling %s ...", model_config.model)
-        response = client.chat.completions.create(
-            model=model_config.model,
-            messages=openai_messages,
-            temperature=model_config.temperature,
-            max_tokens=model_config.max_tokens,
-        )
+        _add_user_turn(trace, openai_messages, user_msg["content"], i, len(user_messages))
+        start = time.perf_counter()
+        response = client.chat.completions.create(**_completion_args(model_config, openai_messages))
+        trace.usage.add(response, time.perf_counter() - start)
+        _add_agent_turn(trace, openai_messages, response, i, len(user_messages))
 
-        assistant_content = response.choices[0].message.content or ""
-        usage = response.usage
-        tokens_info = (
-            f" ({usage.prompt_tokens}+{usage.completion_tokens} tokens)"
-            if usage else ""
-        )
-        preview = assistant_content.replace("\n", " ")[:150]
-        log.info("  [Turn %d/%d] AGENT:%s %s", i, len(user_messages), tokens_info, preview)
-        openai_messages.append({"role": "assistant", "content": assistant_content})
-        trace.messages.append(Message(role="assistant", content=assistant_content))
+    log.info("  Conversation complete: %d turns total (%s)", len(trace.messages), trace.usage.describe())
+    return trace
+
+
+async def run_scenario_async(
+    client: AsyncOpenAI,
+    model_config: ModelConfig,
+    system_prompt: str,
+    scenario: dict,
+    skill_name: str,
+    limiter: asyncio.Semaphore | None = None,
+) -> ConversationTrace:
+    """Async twin of run_scenario(); produces the same trace.
+
+    Turns are still sequential (each depends on the last reply); limiter,
+    when given, is held for the duration of each API call so many
+    scenarios can share one concurrency budget.
+    """
+    trace, openai_messages = _start_conversation(model_config, system_prompt, scenario, skill_name)
+    user_messages = scenario["messages"]
 
-    log.info("  Conversation complete: %d turns total", len(trace.messages))
+    for i, user_msg in enumerate(user_messages, 1):
+        _add_user_turn(trace, openai_messages, user_msg["content"], i, len(user_messages))
+        async with limiter or contextlib.nullcontext():
+            start = time.perf_counter()
+            response = await client.chat.completions.create(**_completion_args(model_config, openai_messages))
+            trace.usage.add(response, time.perf_counter() - start)
+        _add_agent_turn(trace, openai_messages, response, i, len(user_messages))
+
+    log.info("  Conversation complete: %d turns total (%s)", len(trace.messages), trace.usage.describe())
     return trace
 
 
@@ -18,7 +18,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from .evaluator import EvaluationReport
-from .runner import ConversationTrace, ModelConfig
+from .runner import ConversationTrace, ModelConfig, Usage
 
 log = logging.getLogger("harness.traces")
 
@@ -38,6 +38,10 @@ def _next_sequence(directory: Path, prefix: str) -> int:
         return len(existing) + 1
 
 
+def _usage_record(usage: Usage) -> dict:
+    return {**asdict(usage), "seconds": round(usage.seconds, 3)}
+
+
 def save_trace(
     trace: ConversationTrace,
     report: EvaluationReport,
@@ -66,6 +70,7 @@ def save_trace(
             "skill": trace.skill_name,
             "version": version,
             "scenario_id": trace.scenario_id,
+            "conversation_id": trace.conversation_id,
         },
         "config": {
             "model_under_test": asdict(model_config),
@@ -87,6 +92,10 @@ def save_trace(
             "pedagogical": [asdict(c) for c in report.pedagogical],
             "anti_patterns": [asdict(c) for c in report.anti_patterns],
         },
+        "usage": {
+            "conversation": _usage_record(trace.usage),
+            "judge": _usage_record(report.usage),
+        },
     }
 
     out_path.write_text(
@@ -116,6 +125,32 @@ def trace_exists(skill: str, version: str, scenario_id: str, model: str) -> bool
     return False
 
 
+def usage_since(timestamp: str) -> dict[str, int]:
+    """Sum the usage of traces in the index written at or after timestamp.
+
+    A conversation judged by several judges is saved once per judge; its own
+    usage is counted once, each judge's usage once per trace.
+    """
+    index_path = TRACES_DIR / "index.json"
+    totals = {"traces": 0, "conversations": 0, "prompt_tokens": 0, "cached_tokens": 0}
+    if not index_path.is_file():
+        return totals
+    conversations: dict[str, tuple[int, int]] = {}
+    for e in json.loads(index_path.read_text(encoding="utf-8"))["traces"]:
+        if e["timestamp"] < timestamp or "judge_prompt_tokens" not in e:
+            continue
+        totals["traces"] += 1
+        totals["prompt_tokens"] += e["judge_prompt_tokens"]
+        totals["cached_tokens"] += e["judge_cached_tokens"]
+        conversations[e.get("conversation_id") or e["path"]] = (
+            e["conversation_prompt_tokens"], e["conversation_cached_tokens"],
+        )
+    totals["conversations"] = len(conversations)
+    totals["prompt_tokens"] += sum(prompt for prompt, _ in conversations.values())
+    totals["cached_tokens"] += sum(cached for _, cached in conversations.values())
+    return totals
+
+
 def rebuild_index() -> int:
     """Rebuild traces/index.json from all trace files on disk.
 
@@ -131,7 +166,7 @@ def rebuild_index() -> int:
             meta = record["meta"]
             config = record["config"]
             rel_path = trace_file.relative_to(TRACES_DIR)
-            entries.append({
+            entry = {
                 "path": str(rel_path),
                 "persona": meta["persona"],
                 "skill": meta["skill"],
@@ -141,7 +176,15 @@ def rebuild_index() -> int:
                 "score": record["evaluation"]["score"],
                 "model": config["model_under_test"]["model"],
                 "judge": config["judge_model"]["model"],
-            })
+            }
+            # Traces written before usage was recorded have no token counts.
+            if usage := record.get("usage"):
+                if "conversation_id" in meta:
+                    entry["conversation_id"] = meta["conversation_id"]
+                for part in ("conversation", "judge"):
+                    entry[f"{part}_prompt_tokens"] = usage[part]["prompt_tokens"]
+                    entry[f"{part}_cached_tokens"] = usage[part]["cached_tokens"]
+            entries.append(entry)
         except (json.JSONDecodeError, KeyError) as exc:
             log.warning("Skipping malformed trace %s: %s", trace_file, exc)
 
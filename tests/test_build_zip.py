@@ -0,0 +1,63 @@
+"""Round-trip tests for build_zip.copy_compressed_member().
+
+The raw copy writes through zipfile internals that can change between
+Python versions; these tests catch a corrupt archive on whichever Python
+runs them, for the raw path and for the recompressing fallback.
+"""
+
+from __future__ import annotations
+
+import zipfile
+
+import pytest
+
+import build_zip
+from build_zip import ZIP_DATE_TIME, ZIP_FILE_ATTR, copy_compressed_member, write_member
+
+MEMBERS = {
+    "socratic-tutor/SKILL.md": "# Socratic tutor\n\n" + "Ask before you tell. " * 200,
+    "socratic-tutor/references/notes.md": "short",
+}
+
+
+def _source(path) -> None:
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, text in MEMBERS.items():
+            write_member(zf, name, text)
+
+
+def _bundle(src_path, dst_path) -> None:
+    """Copy every member under references/, then add one member normally."""
+    with zipfile.ZipFile(src_path) as src, zipfile.ZipFile(dst_path, "w") as dst:
+        write_member(dst, "meta/SKILL.md", "# Meta")
+        for info in src.infolist():
+            copy_compressed_member(src, info, dst, f"meta/references/{info.filename}")
+        write_member(dst, "meta/README.md", "after the copies")
+
+
+@pytest.mark.parametrize("raw", [True, False], ids=["raw-copy", "recompress"])
+def test_copied_members_round_trip(tmp_path, monkeypatch, raw):
+    if not raw:
+        monkeypatch.setattr(build_zip, "_raw_copy_supported", lambda src, dst: False)
+    src_path, dst_path = tmp_path / "src.zip", tmp_path / "dst.zip"
+    _source(src_path)
+    _bundle(src_path, dst_path)
+
+    with zipfile.ZipFile(src_path) as src, zipfile.ZipFile(dst_path) as dst:
+        assert dst.testzip() is None
+        assert dst.read("meta/README.md") == b"after the copies"
+        for info in src.infolist():
+            copied = dst.getinfo(f"meta/references/{info.filename}")
+            assert dst.read(copied) == MEMBERS[info.filename].encode()
+            assert copied.date_time == ZIP_DATE_TIME
+            assert copied.external_attr == ZIP_FILE_ATTR
+            assert copied.compress_type == info.compress_type
+            if raw:
+                assert copied.compress_size == info.compress_size
+
+
+def test_copy_is_reproducible(tmp_path):
+    _source(tmp_path / "src.zip")
+    _bundle(tmp_path / "src.zip", tmp_path / "a.zip")
+    _bundle(tmp_path / "src.zip", tmp_path / "b.zip")
+    assert (tmp_path / "a.zip").read_bytes() == (tmp_path / "b.zip").read_bytes()
@@ -0,0 +1,130 @@
+"""Completion cache tests that need no API: responses come from a fake client."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletion
+
+from harness.completion_cache import CompletionCache, CompletionCacheMiss, cache_key, cached_client
+
+REQUEST = {
+    "model": "fake-judge",
+    "messages": [{"role": "user", "content": "Grade this."}],
+    "temperature": 0.0,
+    "max_tokens": 100,
+}
+SCHEMA = {"type": "json_schema", "json_schema": {"name": "grade", "strict": True, "schema": {}}}
+
+
+def _completion(content: str) -> ChatCompletion:
+    return ChatCompletion.model_validate({
+        "id": "fake",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "fake-judge",
+        "choices": [{
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": content},
+        }],
+    })
+
+
+def _client(content: str):
+    calls = []
+
+    def create(**request):
+        calls.append(request)
+        return _completion(content)
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    return client, calls
+
+
+def _content(response: ChatCompletion) -> str:
+    return response.choices[0].message.content
+
+
+def _request(text: str) -> dict:
+    return {**REQUEST, "messages": [{"role": "user", "content": text}]}
+
+
+def test_replay_answers_from_the_recording(tmp_path):
+    recorder, _ = _client("recorded")
+    cached_client(recorder, CompletionCache(tmp_path, "record")).chat.completions.create(**REQUEST)
+
+    inner, calls = _client("live")
+    cache = CompletionCache(tmp_path, "replay")
+    response = cached_client(inner, cache).chat.completions.create(**REQUEST)
+
+    assert _content(response) == "recorded"
+    assert calls == []
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_replay_miss_raises_without_calling_the_api(tmp_path):
+    inner, calls = _client("live")
+    cache = CompletionCache(tmp_path, "replay")
+
+    with pytest.raises(CompletionCacheMiss):
+        cached_client(inner, cache).chat.completions.create(**REQUEST)
+    assert calls == []
+    assert cache.misses == 1
+
+
+def test_key_changes_with_response_format():
+    assert cache_key({**REQUEST, "response_format": SCHEMA}) != cache_key(REQUEST)
+    assert cache_key({**REQUEST, "response_format": {"type": "json_object"}}) != cache_key(
+        {**REQUEST, "response_format": SCHEMA}
+    )
+    # Unset and None leave the key of a plain request unchanged.
+    assert cache_key({**REQUEST, "response_format": None}) == cache_key(REQUEST)
+
+
+def test_response_format_is_part_of_the_key(tmp_path):
+    recorder, _ = _client("free-form")
+    cached_client(recorder, CompletionCache(tmp_path, "record")).chat.completions.create(**REQUEST)
+
+    replay = cached_client(_client("unused")[0], CompletionCache(tmp_path, "replay"))
+    assert _content(replay.chat.completions.create(**REQUEST)) == "free-form"
+    with pytest.raises(CompletionCacheMiss):
+        replay.chat.completions.create(**REQUEST, response_format=SCHEMA)
+
+
+def test_evict_removes_least_recently_used_first(tmp_path):
+    inner, _ = _client("x" * 500)
+    cache = CompletionCache(tmp_path, "record")
+    client = cached_client(inner, cache)
+    paths = {}
+    for mtime, name in ((1000, "a"), (2000, "b"), (3000, "c")):
+        client.chat.completions.create(**_request(name))
+        paths[name] = cache._path(cache_key(_request(name)))
+        os.utime(paths[name], (mtime, mtime))
+    # A hit refreshes a's mtime, so b is now the least recently used.
+    client.chat.completions.create(**_request("a"))
+
+    cache.max_bytes = paths["a"].stat().st_size + paths["c"].stat().st_size
+    assert cache.evict() == 1
+    assert {name for name, path in paths.items() if path.exists()} == {"a", "c"}
+    assert cache.evict() == 0
+
+
+def test_async_wrapper_records_and_replays(tmp_path, monkeypatch):
+    async def create(**request):
+        return _completion("async")
+
+    client = AsyncOpenAI(api_key="unused", base_url="http://127.0.0.1:9/v1")
+    monkeypatch.setattr(client.chat.completions, "create", create)
+
+    async def run(mode: str) -> str:
+        response = await cached_client(client, CompletionCache(tmp_path, mode)).chat.completions.create(**REQUEST)
+        return _content(response)
+
+    assert asyncio.run(run("record")) == "async"
+    monkeypatch.setattr(client.chat.completions, "create", None)
+    assert asyncio.run(run("replay")) == "async"
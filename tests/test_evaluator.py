@@ -0,0 +1,160 @@
+"""Evaluator tests that need no API: the judge is a fake client with canned replies.
+
+Covers how batched and per-criterion judge responses are parsed, in
+particular that a malformed entry fails only its own criterion instead of
+the whole evaluation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from harness.evaluator import evaluate_trace, evaluate_trace_async
+from harness.runner import ConversationTrace, Message, ModelConfig
+
+RUBRIC = {
+    "criteria": {
+        "structural": [
+            {"id": "S1", "description": "Asks first", "check": "Asks before answering"},
+            {"id": "S2", "description": "Stays in scope", "check": "Only tutoring"},
+        ],
+        "pedagogical": [
+            {"id": "P1", "description": "Socratic", "weight": "high"},
+        ],
+    },
+    "anti_patterns": [
+        {"id": "A1", "description": "Gives the answer", "check": "States the solution"},
+    ],
+}
+
+TRACE = ConversationTrace(
+    skill_name="fake-skill",
+    scenario_id="fake-scenario",
+    model_id="fake-model",
+    messages=[Message("user", "What is 2 + 2?"), Message("assistant", "What do you think?")],
+)
+
+OMITTED = "Judge response omitted this criterion"
+
+
+def fake_client(reply, *, is_async: bool = False):
+    """A client whose chat.completions.create() answers reply(request) as the message content."""
+    requests = []
+
+    def respond(request):
+        requests.append(request)
+        message = SimpleNamespace(content=reply(request))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+    if is_async:
+        async def create(**request):
+            return respond(request)
+    else:
+        def create(**request):
+            return respond(request)
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    return client, requests
+
+
+def _results(report) -> dict[str, tuple[str, str]]:
+    return {
+        c.criterion_id: (c.result, c.justification)
+        for c in report.structural + report.pedagogical + report.anti_patterns
+    }
+
+
+def test_rubric_batch_malformed_entries_fail_only_their_criterion():
+    reply = json.dumps({
+        "structural.S1": "pass",
+        "structural.S2": {"result": "pass", "justification": "Stayed on topic"},
+        "pedagogical.P1": ["strong"],
+        "anti-pattern.A1": {"result": 3, "justification": "Not a label"},
+    })
+    client, requests = fake_client(lambda request: reply)
+    judge = ModelConfig(id="judge", model="fake-judge", judge_batch="rubric")
+
+    report = evaluate_trace(client, judge, RUBRIC, TRACE)
+
+    assert len(requests) == 1
+    assert "response_format" in requests[0]
+    assert _results(report) == {
+        "S1": ("fail", OMITTED),
+        "S2": ("pass", "Stayed on topic"),
+        "P1": ("fail", OMITTED),
+        "A1": ("fail", OMITTED),
+    }
+
+
+def test_rubric_batch_keeps_ids_shared_across_categories_apart():
+    rubric = {
+        "criteria": {"structural": [{"id": "X1", "description": "Asks first", "check": "Asks"}]},
+        "anti_patterns": [{"id": "X1", "description": "Gives the answer", "check": "Solves"}],
+    }
+    reply = json.dumps({
+        "structural.X1": {"result": "pass", "justification": "Asked a question"},
+        "anti-pattern.X1": {"result": "clear", "justification": "No answer given"},
+    })
+    client, requests = fake_client(lambda request: reply)
+    judge = ModelConfig(id="judge", model="fake-judge", judge_batch="rubric")
+
+    report = evaluate_trace(client, judge, rubric, TRACE)
+
+    schema = requests[0]["response_format"]["json_schema"]["schema"]
+    assert sorted(schema["properties"]) == ["anti-pattern.X1", "structural.X1"]
+    assert [(c.result, c.justification) for c in report.structural] == [("pass", "Asked a question")]
+    assert [(c.result, c.justification) for c in report.anti_patterns] == [("clear", "No answer given")]
+
+
+def test_batch_rejects_ids_repeated_within_a_category():
+    rubric = {"criteria": {"structural": [
+        {"id": "S1", "description": "Asks first", "check": "Asks"},
+        {"id": "S1", "description": "Stays in scope", "check": "Only tutoring"},
+    ]}}
+    client, requests = fake_client(lambda request: "{}")
+    judge = ModelConfig(id="judge", model="fake-judge", judge_batch="category")
+
+    with pytest.raises(ValueError, match="structural.S1"):
+        evaluate_trace(client, judge, rubric, TRACE)
+    assert requests == []
+
+
+def test_category_batch_non_object_response_fails_that_category():
+    def reply(request):
+        prompt = json.dumps(request["messages"])
+        if "S1" in prompt:
+            return json.dumps(["S1", "S2"])
+        # A category with one criterion is asked exactly as in per-criterion mode.
+        if "Socratic" in prompt:
+            return json.dumps({"result": "strong", "justification": "Asked questions"})
+        return json.dumps({"result": "clear", "justification": "No answer given"})
+
+    client, requests = fake_client(reply)
+    judge = ModelConfig(id="judge", model="fake-judge", judge_batch="category")
+
+    report = evaluate_trace(client, judge, RUBRIC, TRACE)
+
+    assert len(requests) == 3
+    assert _results(report) == {
+        "S1": ("fail", OMITTED),
+        "S2": ("fail", OMITTED),
+        "P1": ("strong", "Asked questions"),
+        "A1": ("clear", "No answer given"),
+    }
+
+
+def test_criterion_mode_non_string_result_is_unparseable():
+    client, requests = fake_client(lambda request: json.dumps({"result": ["pass"]}), is_async=True)
+    judge = ModelConfig(id="judge", model="fake-judge")
+
+    report = asyncio.run(evaluate_trace_async(client, judge, RUBRIC, TRACE))
+
+    assert len(requests) == 4
+    assert "response_format" not in requests[0]
+    for result, justification in _results(report).values():
+        assert result == "fail"
+        assert justification.startswith("Judge response unparseable")
@@ -0,0 +1,40 @@
+"""SkillRecord tests: skill directories are written by hand in a temp directory."""
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from skill_record import load_skill
+
+
+def _skill(tmp_path, name: str, text: str):
+    skill_dir = tmp_path / name
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text(text, encoding="utf-8")
+    return skill_dir
+
+
+def test_frontmatter_without_trailing_newline_loads(tmp_path):
+    record = load_skill(_skill(tmp_path, "bare-skill", "---\nname: bare-skill\nversion: 1.2.0\n---"))
+
+    assert (record.name, record.version, record.body) == ("bare-skill", "1.2.0", "")
+
+
+def test_meta_sections_are_parsed_on_first_access(tmp_path):
+    bare = load_skill(_skill(tmp_path, "bare-meta", "---\nname: bare-meta\n---"))
+    with pytest.raises(ValueError, match="Cannot parse meta skill"):
+        bare.meta_sections
+
+    meta = load_skill(_skill(
+        tmp_path, "tutor-meta",
+        "---\nname: tutor-meta\n---\n# Tutor\n\nIntro.\n\n## Assist Directly\n\nHelp.\n\n## Boundaries\n\nNone.\n",
+    ))
+    assert dict(meta.meta_sections) == {
+        "frontmatter": "---\nname: tutor-meta\n---",
+        "intro": "# Tutor\n\nIntro.",
+        "assist_directly": "Help.",
+        "extra_sections": "## Boundaries\n\nNone.",
+    }
+    assert dict(pickle.loads(pickle.dumps(meta)).meta_sections) == dict(meta.meta_sections)
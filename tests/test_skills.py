@@ -7,15 +7,23 @@ traces using judge models.
 Run with:
     uv run pytest tests/ -v -s          # skip scenarios that already have traces
     uv run pytest tests/ -v -s --rerun  # force re-run everything
+    uv run pytest tests/ -v --concurrency 16  # one event loop, 16 API calls in flight
+    uv run pytest tests/ -v --rerun --completion-cache replay  # offline, from recorded completions
 
 Requires OPENROUTER_API_KEY in .env (or the env var configured in test_config.yaml).
 """
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
+from openai import AsyncOpenAI
 
+from harness.async_runner import JobResult, ScenarioJob, run_jobs
+from harness.completion_cache import cached_client
 from harness.evaluator import AntiPatternResult, evaluate_trace
+from harness.rate_limit import rate_limited_client
 from harness.runner import ModelConfig, run_scenario
 from harness.trace_writer import save_trace, trace_exists
 
@@ -23,55 +31,140 @@ MINIMUM_SCORE = 50
 NULL_VERSION = "_null"
 
 
-def _skip_if_exists(request, skill: str, version: str, scenario_id: str, model: str):
+def _skill_job(key: str, rubric_scenario: dict, model: ModelConfig) -> ScenarioJob:
+    return ScenarioJob(
+        key=key,
+        model=model,
+        rubric=rubric_scenario["rubric"],
+        scenario=rubric_scenario["scenario"],
+        system_prompt=rubric_scenario["system_prompt"],
+        skill_name=rubric_scenario["skill_name"],
+        persona=rubric_scenario["persona"],
+        version=rubric_scenario["version"],
+    )
+
+
+def _null_job(key: str, rubric_scenario: dict, model: ModelConfig) -> ScenarioJob:
+    return ScenarioJob(
+        key=key,
+        model=model,
+        rubric=rubric_scenario["rubric"],
+        scenario=rubric_scenario["scenario"],
+        system_prompt="You are a helpful assistant.",
+        skill_name=rubric_scenario["skill_name"],
+        persona=rubric_scenario["persona"],
+        version=NULL_VERSION,
+    )
+
+
+# Test function name -> how its parameters become a job (used by --concurrency).
+JOB_BUILDERS = {
+    "test_skill_scenario": _skill_job,
+    "test_null_scenario": _null_job,
+}
+
+
+def _trace_recorded(config, job: ScenarioJob) -> bool:
+    """True if a trace already exists for this job and --rerun wasn't passed."""
+    if config.getoption("--rerun"):
+        return False
+    return trace_exists(job.skill_name, job.version, job.scenario["id"], job.model.model)
+
+
+def _skip_if_exists(request, job: ScenarioJob):
     """Skip this test if a trace already exists, unless --rerun was passed."""
-    if request.config.getoption("--rerun"):
-        return
-    if trace_exists(skill, version, scenario_id, model):
-        pytest.skip(f"Trace exists for {skill}/{version}/{scenario_id} ({model}) — use --rerun to force")
+    if _trace_recorded(request.config, job):
+        pytest.skip(
+            f"Trace exists for {job.skill_name}/{job.version}/{job.scenario['id']} "
+            f"({job.model.model}) — use --rerun to force"
+        )
+
+
+@pytest.fixture(scope="session")
+def scheduled_results(request, models_under_test, judge_models) -> dict[str, JobResult]:
+    """With --concurrency N, run every selected test's job up front.
+
+    All scenarios and judge calls go through one event loop with at most N
+    API calls in flight; each test then saves and checks its precomputed
+    result. Without --concurrency this is empty and tests call the API
+    themselves.
+    """
+    concurrency = request.config.getoption("--concurrency")
+    if not concurrency:
+        return {}
+    client_kwargs = request.getfixturevalue("openai_client_kwargs")
+    cache = request.getfixturevalue("completion_cache")
+    limiter = request.getfixturevalue("rate_limiter")
+
+    jobs = []
+    for item in request.session.items:
+        builder = JOB_BUILDERS.get(getattr(item, "originalname", ""))
+        params = getattr(getattr(item, "callspec", None), "params", {})
+        if builder is None or "rubric_scenario" not in params:
+            continue
+        if params["model_idx"] >= len(models_under_test):
+            continue
+        job = builder(item.nodeid, params["rubric_scenario"], models_under_test[params["model_idx"]])
+        if not _trace_recorded(request.config, job):
+            jobs.append(job)
+
+    async def run() -> dict[str, JobResult]:
+        async with AsyncOpenAI(**client_kwargs) as client:
+            client = cached_client(rate_limited_client(client, limiter), cache)
+            return await run_jobs(client, jobs, judge_models, concurrency)
+
+    return asyncio.run(run())
 
 
 def _run_and_evaluate(
     *,
     openai_client,
-    model: ModelConfig,
+    job: ScenarioJob,
     judge_models: list[ModelConfig],
-    rubric: dict,
-    scenario: dict,
-    system_prompt: str,
-    skill_name: str,
-    persona: str,
-    version: str,
+    scheduled: JobResult | None = None,
     minimum_score: int = MINIMUM_SCORE,
 ):
-    """Run a scenario, evaluate it, save the trace, and assert quality."""
-    trace = run_scenario(
-        client=openai_client,
-        model_config=model,
-        system_prompt=system_prompt,
-        scenario=scenario,
-        skill_name=skill_name,
-    )
+    """Run a scenario, evaluate it, save the trace, and assert quality.
 
-    assert len(trace.agent_turns()) > 0, "Model produced no responses"
+    With a scheduled result (see scheduled_results), its trace and reports
+    are used instead of calling the API again.
+    """
+    if scheduled is not None and scheduled.error is not None:
+        raise scheduled.error
 
-    for judge in judge_models:
-        report = evaluate_trace(
+    if scheduled is not None:
+        trace = scheduled.trace
+    else:
+        trace = run_scenario(
             client=openai_client,
-            judge=judge,
-            rubric=rubric,
-            trace=trace,
+            model_config=job.model,
+            system_prompt=job.system_prompt,
+            scenario=job.scenario,
+            skill_name=job.skill_name,
         )
 
+    assert len(trace.agent_turns()) > 0, "Model produced no responses"
+
+    for i, judge in enumerate(judge_models):
+        if scheduled is not None:
+            report = scheduled.reports[i]
+        else:
+            report = evaluate_trace(
+                client=openai_client,
+                judge=judge,
+                rubric=job.rubric,
+                trace=trace,
+            )
+
         print(f"\n{report.summary()}\n")
 
         save_trace(
             trace,
             report,
-            persona=persona,
-            version=version,
-            scenario=scenario,
-            model_config=model,
+            persona=job.persona,
+            version=job.version,
+            scenario=job.scenario,
+            model_config=job.model,
             judge_config=judge,
         )
 
@@ -97,29 +190,21 @@ def test_skill_scenario(
     openai_client,
     models_under_test: list[ModelConfig],
     judge_models: list[ModelConfig],
+    scheduled_results: dict[str, JobResult],
     model_idx: int,
 ):
     """Run a skill scenario and evaluate the conversation against the rubric."""
     if model_idx >= len(models_under_test):
         pytest.skip(f"Model index {model_idx} out of range")
 
-    model = models_under_test[model_idx]
-    skill_name = rubric_scenario["skill_name"]
-    version = rubric_scenario["version"]
-    scenario = rubric_scenario["scenario"]
-
-    _skip_if_exists(request, skill_name, version, scenario["id"], model.model)
+    job = _skill_job(request.node.nodeid, rubric_scenario, models_under_test[model_idx])
+    _skip_if_exists(request, job)
 
     _run_and_evaluate(
         openai_client=openai_client,
-        model=model,
+        job=job,
         judge_models=judge_models,
-        rubric=rubric_scenario["rubric"],
-        scenario=scenario,
-        system_prompt=rubric_scenario["system_prompt"],
-        skill_name=skill_name,
-        persona=rubric_scenario["persona"],
-        version=version,
+        scheduled=scheduled_results.get(job.key),
     )
 
 
@@ -130,6 +215,7 @@ def test_null_scenario(
     openai_client,
     models_under_test: list[ModelConfig],
     judge_models: list[ModelConfig],
+    scheduled_results: dict[str, JobResult],
     model_idx: int,
 ):
     """Run the same scenario with NO skill — a bare-model baseline.
@@ -142,21 +228,13 @@ def test_null_scenario(
     if model_idx >= len(models_under_test):
         pytest.skip(f"Model index {model_idx} out of range")
 
-    model = models_under_test[model_idx]
-    skill_name = rubric_scenario["skill_name"]
-    scenario = rubric_scenario["scenario"]
-
-    _skip_if_exists(request, skill_name, NULL_VERSION, scenario["id"], model.model)
+    job = _null_job(request.node.nodeid, rubric_scenario, models_under_test[model_idx])
+    _skip_if_exists(request, job)
 
     _run_and_evaluate(
         openai_client=openai_client,
-        model=model,
+        job=job,
         judge_models=judge_models,
-        rubric=rubric_scenario["rubric"],
-        scenario=scenario,
-        system_prompt="You are a helpful assistant.",
-        skill_name=skill_name,
-        persona=rubric_scenario["persona"],
-        version=NULL_VERSION,
+        scheduled=scheduled_results.get(job.key),
         minimum_score=0,
     )
@@ -0,0 +1,56 @@
+"""Trace index tests that need no API: traces are built by hand in a temp directory."""
+
+from __future__ import annotations
+
+from harness import trace_writer
+from harness.evaluator import EvaluationReport
+from harness.runner import ConversationTrace, Message, ModelConfig, Usage
+from harness.trace_writer import rebuild_index, save_trace, usage_since
+
+SCENARIO = {"id": "fake-scenario", "messages": ["Hi"]}
+MODEL = ModelConfig(id="model", model="fake-model")
+
+
+def _trace(prompt: int, cached: int) -> ConversationTrace:
+    return ConversationTrace(
+        skill_name="fake-skill",
+        scenario_id="fake-scenario",
+        model_id="model",
+        messages=[Message("user", "Hi"), Message("assistant", "Hello")],
+        usage=Usage(calls=1, prompt_tokens=prompt, cached_tokens=cached),
+    )
+
+
+def _report(judge: str, prompt: int, cached: int) -> EvaluationReport:
+    return EvaluationReport(
+        skill_name="fake-skill",
+        scenario_id="fake-scenario",
+        model_id="model",
+        judge_model_id=judge,
+        usage=Usage(calls=1, prompt_tokens=prompt, cached_tokens=cached),
+    )
+
+
+def test_usage_since_counts_each_conversation_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(trace_writer, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(trace_writer, "TRACES_DIR", tmp_path / "traces")
+
+    judged_twice = _trace(prompt=1000, cached=600)
+    judged_once = _trace(prompt=500, cached=0)
+    for trace, report in (
+        (judged_twice, _report("judge-a", 300, 200)),
+        (judged_twice, _report("judge-b", 300, 100)),
+        (judged_once, _report("judge-a", 200, 0)),
+    ):
+        save_trace(
+            trace, report, persona="fake", version="0.1.0", scenario=SCENARIO,
+            model_config=MODEL, judge_config=ModelConfig(id=report.judge_model_id, model=report.judge_model_id),
+        )
+    assert rebuild_index() == 3
+
+    assert usage_since("") == {
+        "traces": 3,
+        "conversations": 2,
+        "prompt_tokens": 1000 + 500 + 300 + 300 + 200,
+        "cached_tokens": 600 + 200 + 100,
+    }
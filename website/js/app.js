@@ -16,35 +16,23 @@ let activeFilter = 'all';
 let skillsWithTraces = new Set();
 let repoUrl = '';
 
-// Fetch inventory data
+// Fetch inventory data: persona index, every inventory, and the per-skill
+// trace summary arrive together in one bundle written by the build.
 async function loadInventory() {
     try {
-        const resp = await fetch('inventory/personas.json');
+        const resp = await fetch('inventory/all.json');
         if (!resp.ok) throw new Error(resp.statusText);
-        const index = await resp.json();
-
-        const inventories = await Promise.all(
-            index.personas.map(async (p) => {
-                const r = await fetch(p.inventory_url);
-                if (!r.ok) throw new Error(r.statusText);
-                return r.json();
-            })
-        );
-
-        allData = { index: index.personas, inventories };
-        repoUrl = index.repo_url || '';
-        buildFilters();
+        const bundle = await resp.json();
 
-        try {
-            const tr = await fetch('traces/index.json');
-            if (tr.ok) {
-                const trData = await tr.json();
-                for (const t of trData.traces || []) {
-                    skillsWithTraces.add(t.skill);
-                }
+        allData = { index: bundle.personas, inventories: bundle.inventories };
+        repoUrl = bundle.repo_url || '';
+        for (const skills of Object.values(bundle.traces || {})) {
+            for (const name of Object.keys(skills)) {
+                skillsWithTraces.add(name);
             }
-        } catch (_) { /* no traces yet — silently skip */ }
+        }
 
+        buildFilters();
         render();
     } catch (err) {
         personasContainer.innerHTML =